@@ -1,22 +1,27 @@
 import pandas as pd
 import argparse
 
+from py_clob_client.market_index import MarketIndex
+
 def load_markets_data(file_path):
     """Load the markets data CSV file into a pandas DataFrame."""
     return pd.read_csv(file_path)
 
-def filter_markets(df, keyword=None):
-    """Filter markets based on keyword matching in ID or description."""
+def build_index(df):
+    """Build the keyword index of the markets."""
+    return MarketIndex.from_markets(df.fillna("").to_dict("records"))
+
+def filter_markets(df, keyword=None, index=None):
+    """Filter markets based on keyword matching in ID, title or description."""
     if not keyword:
         return df
-        
-    # Search in both condition_id and description
-    mask = (
-        df['condition_id'].str.contains(keyword, na=False, case=False) |
-        df['description'].str.contains(keyword, na=False, case=False) |
-        df['question'].str.contains(keyword, na=False, case=False)
-    )
-    return df[mask]
+    if index is None:
+        index = build_index(df)
+
+    # IDs match on a substring, and every word of the keyword matches as a prefix in the indexed fields
+    mask = df['condition_id'].str.contains(keyword, na=False, case=False)
+    query = " ".join(word + "*" for word in keyword.split())
+    return df[mask | df['condition_id'].isin(index.search(query))]
 
 def display_market(market):
     """Display formatted market information."""
@@ -40,7 +45,8 @@ def main():
         df = load_markets_data(args.file)
         
         # Apply filters
-        filtered_df = filter_markets(df, args.keyword)
+        index = build_index(df) if args.keyword else None
+        filtered_df = filter_markets(df, args.keyword, index)
         
         # Display results
         if filtered_df.empty:
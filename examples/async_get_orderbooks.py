@@ -0,0 +1,21 @@
+import asyncio
+
+from py_clob_client.async_client import AsyncClobClient
+
+
+async def main():
+    host = "https://clob.polymarket.com"
+    token_ids = [
+        "52114319501245915516055106046884209969926127482827954674443846427813813222426",
+        "71321045679252212594626385532706912750332728571942532289631379312455583992563",
+    ]
+
+    async with AsyncClobClient(host) as client:
+        books = await asyncio.gather(
+            *[client.get_order_book(token_id) for token_id in token_ids]
+        )
+        print(books)
+    print("Done!")
+
+
+asyncio.run(main())
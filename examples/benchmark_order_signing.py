@@ -0,0 +1,56 @@
+import time
+
+from py_order_utils.builders import OrderBuilder as UtilsOrderBuilder
+from py_order_utils.signer import Signer as UtilsSigner
+
+from py_clob_client.clob_types import CreateOrderOptions, OrderArgs
+from py_clob_client.config import get_contract_config
+from py_clob_client.constants import AMOY
+from py_clob_client.order_builder.builder import OrderBuilder
+from py_clob_client.order_builder.constants import BUY
+from py_clob_client.signer import Signer
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+chain_id = AMOY
+
+ORDERS = 500
+
+
+class UncachedOrderBuilder(OrderBuilder):
+    """
+    Builds a new exchange builder and signer for every order, as done before caching
+    """
+
+    def get_exchange_builder(self, neg_risk: bool):
+        contract_config = get_contract_config(self.signer.get_chain_id(), neg_risk)
+        return UtilsOrderBuilder(
+            contract_config.exchange,
+            self.signer.get_chain_id(),
+            UtilsSigner(key=self.signer.private_key),
+        )
+
+
+def orders_per_second(builder: OrderBuilder) -> float:
+    order_args = OrderArgs(token_id="123", price=0.5, size=100.0, side=BUY)
+    options = CreateOrderOptions(tick_size="0.01", neg_risk=False)
+
+    start = time.perf_counter()
+    for _ in range(ORDERS):
+        builder.create_order(order_args, options)
+    return ORDERS / (time.perf_counter() - start)
+
+
+def main():
+    signer = Signer(private_key=private_key, chain_id=chain_id)
+
+    before = orders_per_second(UncachedOrderBuilder(signer))
+    after = orders_per_second(OrderBuilder(signer))
+
+    print("uncached: {:.0f} orders/s".format(before))
+    print("cached:   {:.0f} orders/s".format(after))
+    print("speedup:  {:.2f}x".format(after / before))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+import asyncio
+
+from py_clob_client.order_book.local_book import LocalOrderBooks
+from py_clob_client.ws.market import MarketDataClient
+
+
+async def main():
+    token_ids = [
+        "52114319501245915516055106046884209969926127482827954674443846427813813222426",
+        "71321045679252212594626385532706912750332728571942532289631379312455583992563",
+    ]
+
+    # the market channel sends a book snapshot on every (re)subscription
+    books = LocalOrderBooks()
+    async with MarketDataClient() as client:
+        consumer = client.consumer(maxsize=10000)
+        await client.subscribe(token_ids)
+        async for message in consumer:
+            for token_id in books.apply(message):
+                book = books[token_id]
+                print(token_id[:8], book.best_bid, book.best_ask)
+
+
+asyncio.run(main())
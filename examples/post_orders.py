@@ -0,0 +1,51 @@
+import os
+
+from py_clob_client.client import ClobClient
+from py_clob_client.clob_types import ApiCreds, OrderArgs, OrderType, PostOrdersArgs
+from dotenv import load_dotenv
+from py_clob_client.constants import AMOY
+
+from py_clob_client.order_builder.constants import BUY
+
+
+load_dotenv()
+
+
+def main():
+    host = "http://localhost:8080"
+    key = os.getenv("PK")
+    creds = ApiCreds(
+        api_key=os.getenv("CLOB_API_KEY"),
+        api_secret=os.getenv("CLOB_SECRET"),
+        api_passphrase=os.getenv("CLOB_PASS_PHRASE"),
+    )
+    chain_id = AMOY
+    client = ClobClient(host, key=key, chain_id=chain_id, creds=creds)
+
+    # Create and sign a ladder of limit orders buying 10 YES tokens from 0.40c to 0.49c
+    orders_args = [
+        OrderArgs(
+            price=round(0.40 + i * 0.01, 2),
+            size=10.0,
+            side=BUY,
+            token_id="71321045679252212594626385532706912750332728571942532289631379312455583992563",
+        )
+        for i in range(10)
+    ]
+    # Sign them in worker processes, which receive the key once when they start
+    with client.builder.signing_pool() as pool:
+        signed_orders = client.create_orders(orders_args, executor=pool)
+
+    # Post the whole ladder in a single request
+    resp = client.post_orders(
+        [
+            PostOrdersArgs(order=order, orderType=OrderType.GTC)
+            for order in signed_orders
+        ]
+    )
+    print(resp)
+    print("Done!")
+
+
+if __name__ == "__main__":
+    main()
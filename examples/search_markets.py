@@ -6,8 +6,10 @@ from tqdm import tqdm
 from typing import Optional, List, Dict, Any
 from dotenv import load_dotenv
 
+from py_clob_client.catalogue import MarketCatalogue
 from py_clob_client.client import ClobClient
 from py_clob_client.clob_types import ApiCreds
+from py_clob_client.market_index import MarketIndex
 
 # Set up logging
 logging.basicConfig(
@@ -17,8 +19,10 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class MarketSearcher:
-    def __init__(self, client: ClobClient):
+    def __init__(self, client: ClobClient, catalogue: MarketCatalogue):
         self.client = client
+        self.catalogue = catalogue
+        self.index = None
         
     def search_markets(self, keyword: str = "") -> Dict[str, Any]:
         """
@@ -30,52 +34,21 @@ class MarketSearcher:
         Returns:
             Dict containing filtered markets and metadata
         """
-        all_markets = []
-        next_cursor = ""
-        total_markets = 0
-        
-        # Initialize progress bar
-        pbar = tqdm(desc="Loading markets", unit=" markets")
-        
-        # Get all markets first
-        while True:
-            markets_response = self.client.get_markets(next_cursor=next_cursor)
-            if not isinstance(markets_response, dict):
-                logger.error(f"Unexpected response format: {type(markets_response)}")
-                return {"error": "Invalid response format"}
-            
-            markets = markets_response.get("data", [])
-            all_markets.extend(markets)
-            
-            # Update progress bar
-            new_markets = len(markets)
-            total_markets += new_markets
-            pbar.update(new_markets)
-            
-            next_cursor = markets_response.get("next_cursor", "")
-            if not next_cursor or next_cursor == "LTE=":
-                break
-        
-        pbar.close()
-        logger.info(f"Total markets loaded: {total_markets}")
-        
-        # Filter markets if keyword is provided
+        # Refresh the local catalogue, only the pages holding new markets are fetched
+        on_change = self.index.add if self.index is not None else None
+        stats = self.catalogue.refresh(self.client.get_markets, concurrency=8, on_change=on_change)
+        logger.info(f"Catalogue refreshed: {stats.inserted} new, {stats.updated} updated")
+
+        # The index is built once and kept up to date with the markets changed by each refresh
+        if self.index is None:
+            markets = tqdm(self.catalogue.markets(), desc="Indexing markets", unit=" markets")
+            self.index = MarketIndex.from_markets(markets)
+        logger.info(f"Total markets loaded: {len(self.index)}")
+
+        # Filter markets if keyword is provided, see MarketIndex for the query syntax
         if keyword:
             logger.info(f"Filtering markets with keyword: {keyword}")
-            keyword = keyword.lower()
-            filtered_markets = []
-            for market in all_markets:
-                searchable_text = " ".join([
-                    str(market.get("description", "")),
-                    str(market.get("category", "")),
-                    str(market.get("question", "")),
-                    str(market.get("market_slug", ""))
-                ]).lower()
-                
-                if keyword in searchable_text:
-                    filtered_markets.append(self.format_market(market))
-        else:
-            filtered_markets = [self.format_market(market) for market in all_markets]
+        filtered_markets = [self.format_market(market) for market in self.index.search_markets(keyword)]
             
         return {
             "timestamp": datetime.now().isoformat(),
@@ -135,7 +108,7 @@ def main():
     client = ClobClient(host, key=key, chain_id=chain_id, creds=creds)
     
     # Initialize market searcher
-    searcher = MarketSearcher(client)
+    searcher = MarketSearcher(client, MarketCatalogue("market_logs/catalogue.sqlite"))
     
     # Get search parameters
     keyword = input("Enter search keyword (press Enter for all markets): ").strip()
@@ -1,12 +1,14 @@
 import os
 import json
 import asyncio
-import websockets
 import requests
 import pandas as pd
 from datetime import datetime
 from dotenv import load_dotenv
 
+from py_clob_client.ws.connection import ManagedWebSocket
+from py_clob_client.ws.consumer import ConsumerQueue
+
 class PolyMarketBot:
     def __init__(self):
         load_dotenv()
@@ -18,22 +20,27 @@ class PolyMarketBot:
         self.trade_history = []  # Track simulated trade history
 
     async def connect_websocket(self):
-        """Establish WebSocket connection for real-time market data"""
-        async with websockets.connect(self.ws_url) as websocket:
-            # Subscribe to market updates
-            subscribe_msg = {
-                "type": "subscribe",
-                "channels": ["markets", "trades"]
-            }
-            await websocket.send(json.dumps(subscribe_msg))
-            
-            while True:
+        """Establish WebSocket connection for real-time market data, reconnecting on errors"""
+        # Subscribe to market updates, resent on every reconnection
+        subscribe_msg = {
+            "type": "subscribe",
+            "channels": ["markets", "trades"]
+        }
+
+        async def on_open(connection):
+            await connection.send(subscribe_msg)
+
+        messages = ConsumerQueue(maxsize=10000)
+        connection = ManagedWebSocket(self.ws_url, messages.put, on_open)
+        connection.start()
+        try:
+            async for message in messages:
                 try:
-                    message = await websocket.recv()
-                    await self.handle_websocket_message(json.loads(message))
+                    await self.handle_websocket_message(message)
                 except Exception as e:
-                    print(f"WebSocket error: {e}")
-                    break
+                    print(f"WebSocket message error: {e}")
+        finally:
+            await connection.close()
 
     async def handle_websocket_message(self, message):
         """Handle incoming WebSocket messages"""
@@ -0,0 +1,1284 @@
+import asyncio
+import logging
+from concurrent.futures import Executor
+from typing import Optional, Union
+
+from py_order_utils.model import SignedOrder
+
+from .order_builder.builder import OrderBuilder
+from .headers.headers import create_level_1_headers, Level2HeaderBuilder
+from .signer import Signer
+from .config import get_contract_config
+
+from .endpoints import (
+    CANCEL,
+    CANCEL_ORDERS,
+    CANCEL_MARKET_ORDERS,
+    CANCEL_ALL,
+    CREATE_API_KEY,
+    DELETE_API_KEY,
+    DERIVE_API_KEY,
+    GET_API_KEYS,
+    CLOSED_ONLY,
+    GET_LAST_TRADE_PRICE,
+    GET_ORDER,
+    GET_ORDER_BOOK,
+    MID_POINT,
+    ORDERS,
+    POST_ORDER,
+    POST_ORDERS,
+    PRICE,
+    TIME,
+    TRADES,
+    GET_NOTIFICATIONS,
+    DROP_NOTIFICATIONS,
+    GET_BALANCE_ALLOWANCE,
+    UPDATE_BALANCE_ALLOWANCE,
+    IS_ORDER_SCORING,
+    GET_TICK_SIZE,
+    GET_NEG_RISK,
+    ARE_ORDERS_SCORING,
+    GET_SIMPLIFIED_MARKETS,
+    GET_MARKETS,
+    GET_MARKET,
+    GET_SAMPLING_SIMPLIFIED_MARKETS,
+    GET_SAMPLING_MARKETS,
+    GET_MARKET_TRADES_EVENTS,
+    GET_LAST_TRADES_PRICES,
+    MID_POINTS,
+    GET_ORDER_BOOKS,
+    GET_PRICES,
+    GET_SPREAD,
+    GET_SPREADS,
+)
+from .batching import MAX_BATCH_SIZE, RequestCoalescer, afetch_in_chunks
+from .cache import MarketMetadataCache
+from .decoding import (
+    OPEN_ORDER_DECODER,
+    OPEN_ORDERS_PAGE_DECODER,
+    ORDER_BOOK_DECODER,
+    ORDER_BOOKS_DECODER,
+    TRADES_PAGE_DECODER,
+)
+from .instrumentation import (
+    SIGN_L1_HEADERS,
+    SIGN_L2_HEADERS,
+    SIGN_MARKET_ORDER,
+    SIGN_ORDER,
+    SIGN_ORDERS,
+    Instrumentation,
+    timed_signing,
+)
+from .clob_types import (
+    ApiCreds,
+    TradeParams,
+    OpenOrderParams,
+    OrderArgs,
+    RequestArgs,
+    DropNotificationParams,
+    OrderBookSummary,
+    BalanceAllowanceParams,
+    OrderScoringParams,
+    TickSize,
+    CreateOrderOptions,
+    OrdersScoringParams,
+    OrderType,
+    PartialCreateOrderOptions,
+    BookParams,
+    MarketOrderArgs,
+    PostOrdersArgs,
+)
+from .exceptions import PolyApiException, PolyException
+from .http_helpers.helpers import (
+    DEFAULT_TIMEOUT,
+    serialize_body,
+    add_query_trade_params,
+    add_query_open_orders_params,
+    drop_notifications_query_params,
+    add_balance_allowance_params_to_url,
+    add_order_scoring_params_to_url,
+)
+from .http_helpers.async_helpers import (
+    create_async_session,
+    delete,
+    get,
+    post,
+)
+
+from .constants import (
+    L0,
+    L1,
+    L1_AUTH_UNAVAILABLE,
+    L2,
+    L2_AUTH_UNAVAILABLE,
+    START_CURSOR,
+    POST_ORDERS_BATCH_LIMIT,
+)
+from .order_book.compact import CompactOrderBook
+from .order_book.depth import BookDepth
+from .order_book.local_book import LocalOrderBook
+from .http_helpers.rate_limit import RateLimiter
+from .http_helpers.deadline import with_deadline
+from .http_helpers.retry import Retrier
+from .pagination import aiter_pages, aiter_prefetched_pages
+from .utilities import (
+    generate_orderbook_summary_hash,
+    order_to_json,
+    is_tick_size_smaller,
+    is_tick_size_error,
+    price_valid,
+)
+
+
+class AsyncClobClient:
+    def __init__(
+        self,
+        host,
+        chain_id: int = None,
+        key: str = None,
+        creds: ApiCreds = None,
+        signature_type: int = None,
+        funder: str = None,
+        session=None,
+        market_cache: MarketMetadataCache = None,
+        rate_limiter: RateLimiter = None,
+        retrier: Retrier = None,
+        timeout=DEFAULT_TIMEOUT,
+        instrumentation: Instrumentation = None,
+        coalescer: RequestCoalescer = None,
+        batch_size: int = MAX_BATCH_SIZE,
+    ):
+        """
+        Initializes the async clob client
+        The client can be started in 3 modes:
+        1) Level 0: Requires only the clob host url
+                    Allows access to open CLOB endpoints
+
+        2) Level 1: Requires the host, chain_id and a private key.
+                    Allows access to L1 authenticated endpoints + all unauthenticated endpoints
+
+        3) Level 2: Requires the host, chain_id, a private key, and Credentials.
+                    Allows access to all endpoints
+
+        Every endpoint of ClobClient is exposed as a coroutine sharing the same headers, urls and types.
+        An httpx.AsyncClient can be provided as session, see http_helpers.async_helpers.create_async_session.
+        Tick sizes and neg risk flags are kept in market_cache, see cache.MarketMetadataCache.
+        Requests are kept within the limits of rate_limiter if given, see http_helpers.rate_limit.RateLimiter.
+        Failed requests are retried by retrier if given, see http_helpers.retry.Retrier.
+        timeout: seconds, or (connect, read) seconds, allowed to every request.
+        Every call takes a deadline keyword argument, a number of seconds or a Deadline,
+        bounding all the requests it makes, e.g. the book and tick size lookups of create_market_order.
+        DeadlineExceeded is raised once it has passed, see http_helpers.deadline.
+        Request timings, sizes and statuses and signing times are reported to instrumentation if given,
+        see instrumentation.Instrumentation.
+        Batch calls, e.g. get_order_books, are split into requests of at most batch_size tokens sent in parallel.
+        Concurrent per-token calls, e.g. get_midpoint, are merged into batch requests by coalescer if given,
+        see batching.RequestCoalescer.
+        """
+        self.host = host[0:-1] if host.endswith("/") else host
+        self.chain_id = chain_id
+        self.signer = Signer(key, chain_id) if key else None
+        self.creds = creds
+        self.mode = self._get_client_mode()
+        self.__l2_header_builder = None
+        self.session = session if session is not None else create_async_session()
+
+        if self.signer:
+            self.builder = OrderBuilder(
+                self.signer, sig_type=signature_type, funder=funder
+            )
+
+        # local cache
+        self.market_cache = (
+            market_cache if market_cache is not None else MarketMetadataCache()
+        )
+
+        self.rate_limiter = rate_limiter
+        self.retrier = retrier
+        self.timeout = timeout
+        self.instrumentation = instrumentation
+        self.coalescer = coalescer
+        self.batch_size = batch_size
+
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def _get(self, endpoint, headers=None, data=None, decoder=None):
+        return await get(
+            endpoint,
+            self.session,
+            headers=headers,
+            data=data,
+            rate_limiter=self.rate_limiter,
+            retrier=self.retrier,
+            timeout=self.timeout,
+            instrumentation=self.instrumentation,
+            decoder=decoder,
+        )
+
+    async def _post(self, endpoint, headers=None, data=None, decoder=None):
+        return await post(
+            endpoint,
+            self.session,
+            headers=headers,
+            data=data,
+            rate_limiter=self.rate_limiter,
+            retrier=self.retrier,
+            timeout=self.timeout,
+            instrumentation=self.instrumentation,
+            decoder=decoder,
+        )
+
+    async def _delete(self, endpoint, headers=None, data=None, decoder=None):
+        return await delete(
+            endpoint,
+            self.session,
+            headers=headers,
+            data=data,
+            rate_limiter=self.rate_limiter,
+            retrier=self.retrier,
+            timeout=self.timeout,
+            instrumentation=self.instrumentation,
+            decoder=decoder,
+        )
+
+    async def _post_batch(self, endpoint, body: list, decoder=None):
+        """
+        Posts a batch request, split into chunks of at most batch_size items sent in parallel
+        """
+        url = "{}{}".format(self.host, endpoint)
+        return await afetch_in_chunks(
+            lambda chunk: self._post(url, data=chunk, decoder=decoder),
+            body,
+            self.batch_size,
+        )
+
+    async def close(self):
+        """
+        Closes the pooled connections held by the client
+        """
+        await self.session.aclose()
+        if self.retrier is not None:
+            self.retrier.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def _create_level_2_headers(self, request_args: RequestArgs) -> dict:
+        builder = self.__l2_header_builder
+        if builder is None or builder.creds is not self.creds:
+            builder = Level2HeaderBuilder(self.signer, self.creds)
+            self.__l2_header_builder = builder
+        with timed_signing(self.instrumentation, SIGN_L2_HEADERS):
+            return builder.create(request_args)
+
+    def get_address(self):
+        """
+        Returns the public address of the signer
+        """
+        return self.signer.address() if self.signer else None
+
+    def get_collateral_address(self):
+        """
+        Returns the collateral token address
+        """
+        contract_config = get_contract_config(self.chain_id)
+        if contract_config:
+            return contract_config.collateral
+
+    def get_conditional_address(self):
+        """
+        Returns the conditional token address
+        """
+        contract_config = get_contract_config(self.chain_id)
+        if contract_config:
+            return contract_config.conditional_tokens
+
+    def get_exchange_address(self, neg_risk=False):
+        """
+        Returns the exchange address
+        """
+        contract_config = get_contract_config(self.chain_id, neg_risk)
+        if contract_config:
+            return contract_config.exchange
+
+    @with_deadline
+    async def get_ok(self):
+        """
+        Health check: Confirms that the server is up
+        Does not need authentication
+        """
+        return await self._get("{}/".format(self.host))
+
+    @with_deadline
+    async def get_server_time(self):
+        """
+        Returns the current timestamp on the server
+        Does not need authentication
+        """
+        return await self._get("{}{}".format(self.host, TIME))
+
+    @with_deadline
+    async def create_api_key(self, nonce: int = None) -> ApiCreds:
+        """
+        Creates a new CLOB API key for the given
+        """
+        self.assert_level_1_auth()
+
+        endpoint = "{}{}".format(self.host, CREATE_API_KEY)
+        with timed_signing(self.instrumentation, SIGN_L1_HEADERS):
+            headers = create_level_1_headers(self.signer, nonce)
+
+        creds_raw = await self._post(endpoint, headers=headers)
+        try:
+            creds = ApiCreds(
+                api_key=creds_raw["apiKey"],
+                api_secret=creds_raw["secret"],
+                api_passphrase=creds_raw["passphrase"],
+            )
+        except:
+            self.logger.error("Couldn't parse created CLOB creds")
+            return None
+        return creds
+
+    @with_deadline
+    async def derive_api_key(self, nonce: int = None) -> ApiCreds:
+        """
+        Derives an already existing CLOB API key for the given address and nonce
+        """
+        self.assert_level_1_auth()
+
+        endpoint = "{}{}".format(self.host, DERIVE_API_KEY)
+        with timed_signing(self.instrumentation, SIGN_L1_HEADERS):
+            headers = create_level_1_headers(self.signer, nonce)
+
+        creds_raw = await self._get(endpoint, headers=headers)
+        try:
+            creds = ApiCreds(
+                api_key=creds_raw["apiKey"],
+                api_secret=creds_raw["secret"],
+                api_passphrase=creds_raw["passphrase"],
+            )
+        except:
+            self.logger.error("Couldn't parse derived CLOB creds")
+            return None
+        return creds
+
+    @with_deadline
+    async def create_or_derive_api_creds(self, nonce: int = None) -> ApiCreds:
+        """
+        Creates API creds if not already created for nonce, otherwise derives them
+        """
+        try:
+            return await self.create_api_key(nonce)
+        except:
+            return await self.derive_api_key(nonce)
+
+    def set_api_creds(self, creds: ApiCreds):
+        """
+        Sets client api creds
+        """
+        self.creds = creds
+        self.mode = self._get_client_mode()
+
+    @with_deadline
+    async def get_api_keys(self):
+        """
+        Gets the available API keys for this address
+        Level 2 Auth required
+        """
+        self.assert_level_2_auth()
+
+        request_args = RequestArgs(method="GET", request_path=GET_API_KEYS)
+        headers = self._create_level_2_headers(request_args)
+        return await self._get("{}{}".format(self.host, GET_API_KEYS), headers=headers)
+
+    @with_deadline
+    async def get_closed_only_mode(self):
+        """
+        Gets the closed only mode flag for thsi address
+        Level 2 Auth required
+        """
+        self.assert_level_2_auth()
+
+        request_args = RequestArgs(method="GET", request_path=CLOSED_ONLY)
+        headers = self._create_level_2_headers(request_args)
+        return await self._get("{}{}".format(self.host, CLOSED_ONLY), headers=headers)
+
+    @with_deadline
+    async def delete_api_key(self):
+        """
+        Deletes an API key
+        Level 2 Auth required
+        """
+        self.assert_level_2_auth()
+
+        request_args = RequestArgs(method="DELETE", request_path=DELETE_API_KEY)
+        headers = self._create_level_2_headers(request_args)
+        return await self._delete(
+            "{}{}".format(self.host, DELETE_API_KEY), headers=headers
+        )
+
+    @with_deadline
+    async def get_midpoint(self, token_id):
+        """
+        Get the mid market price for the given market
+        With a coalescer, concurrent calls are merged into get_midpoints requests
+        """
+        if self.coalescer is not None:
+            mid = await self.coalescer.call_async(
+                (self.host, MID_POINTS), token_id, self.__fetch_midpoints
+            )
+            return {"mid": mid}
+        return await self._get(
+            "{}{}?token_id={}".format(self.host, MID_POINT, token_id)
+        )
+
+    async def __fetch_midpoints(self, token_ids: list) -> dict:
+        return await self.get_midpoints([BookParams(token_id=t) for t in token_ids])
+
+    @with_deadline
+    async def get_midpoints(self, params: list[BookParams]):
+        """
+        Get the mid market prices for a set of token ids
+        """
+        body = [{"token_id": param.token_id} for param in params]
+        return await self._post_batch(MID_POINTS, body)
+
+    @with_deadline
+    async def get_price(self, token_id, side):
+        """
+        Get the market price for the given market
+        With a coalescer, concurrent calls are merged into get_prices requests
+        """
+        if self.coalescer is not None:
+            price = await self.coalescer.call_async(
+                (self.host, GET_PRICES), (token_id, side), self.__fetch_prices
+            )
+            return {"price": price}
+        return await self._get(
+            "{}{}?token_id={}&side={}".format(self.host, PRICE, token_id, side)
+        )
+
+    async def __fetch_prices(self, params: list) -> dict:
+        prices = await self.get_prices(
+            [BookParams(token_id=token_id, side=side) for token_id, side in params]
+        )
+        return {
+            (token_id, side): prices[token_id][side]
+            for token_id, side in params
+            if side in prices.get(token_id, {})
+        }
+
+    @with_deadline
+    async def get_prices(self, params: list[BookParams]):
+        """
+        Get the market prices for a set
+        """
+        body = [{"token_id": param.token_id, "side": param.side} for param in params]
+        return await self._post_batch(GET_PRICES, body)
+
+    @with_deadline
+    async def get_spread(self, token_id):
+        """
+        Get the spread for the given market
+        With a coalescer, concurrent calls are merged into get_spreads requests
+        """
+        if self.coalescer is not None:
+            spread = await self.coalescer.call_async(
+                (self.host, GET_SPREADS), token_id, self.__fetch_spreads
+            )
+            return {"spread": spread}
+        return await self._get(
+            "{}{}?token_id={}".format(self.host, GET_SPREAD, token_id)
+        )
+
+    async def __fetch_spreads(self, token_ids: list) -> dict:
+        return await self.get_spreads([BookParams(token_id=t) for t in token_ids])
+
+    @with_deadline
+    async def get_spreads(self, params: list[BookParams]):
+        """
+        Get the spreads for a set of token ids
+        """
+        body = [{"token_id": param.token_id} for param in params]
+        return await self._post_batch(GET_SPREADS, body)
+
+    @with_deadline
+    async def get_tick_size(self, token_id: str) -> TickSize:
+        tick_size = self.market_cache.get_tick_size(token_id)
+        if tick_size is not None:
+            return tick_size
+
+        result = await self._get(
+            "{}{}?token_id={}".format(self.host, GET_TICK_SIZE, token_id)
+        )
+        tick_size = str(result["minimum_tick_size"])
+        self.market_cache.update(token_id, tick_size=tick_size)
+
+        return tick_size
+
+    @with_deadline
+    async def get_neg_risk(self, token_id: str) -> bool:
+        neg_risk = self.market_cache.get_neg_risk(token_id)
+        if neg_risk is not None:
+            return neg_risk
+
+        result = await self._get(
+            "{}{}?token_id={}".format(self.host, GET_NEG_RISK, token_id)
+        )
+        self.market_cache.update(token_id, neg_risk=result["neg_risk"])
+
+        return result["neg_risk"]
+
+    @with_deadline
+    async def warm_market_cache(
+        self, token_ids: list[str] = None, concurrency: int = 1
+    ) -> list[str]:
+        """
+        Fills the market cache with the tick size and neg risk of the tokens, walking the markets pages
+        Stops as soon as every token is cached, every market is cached if token_ids is not given
+        Returns the token ids that were not found
+        """
+        remaining = set(token_ids) if token_ids is not None else None
+        markets = self.iter_all_markets(concurrency)
+        try:
+            async for market in markets:
+                cached = self.market_cache.update_from_market(market, remaining)
+                if remaining is not None:
+                    remaining.difference_update(cached)
+                    if not remaining:
+                        break
+        finally:
+            await markets.aclose()
+        return sorted(remaining) if remaining else []
+
+    def invalidate_market_cache(self, token_id: str = None):
+        """
+        Drops the cached metadata of a token, or of every token
+        """
+        self.market_cache.invalidate(token_id)
+
+    def _invalidate_on_tick_size_error(self, order: SignedOrder, error):
+        if is_tick_size_error(error):
+            self.invalidate_market_cache(str(order.order["tokenId"]))
+
+    async def __resolve_tick_size(
+        self, token_id: str, tick_size: TickSize = None
+    ) -> TickSize:
+        min_tick_size = await self.get_tick_size(token_id)
+        if tick_size is not None:
+            if is_tick_size_smaller(tick_size, min_tick_size):
+                raise Exception(
+                    "invalid tick size ("
+                    + str(tick_size)
+                    + "), minimum for the market is "
+                    + str(min_tick_size),
+                )
+        else:
+            tick_size = min_tick_size
+        return tick_size
+
+    async def __resolve_order_options(
+        self, order_args: OrderArgs, options: Optional[PartialCreateOrderOptions]
+    ) -> CreateOrderOptions:
+        tick_size = await self.__resolve_tick_size(
+            order_args.token_id,
+            options.tick_size if options else None,
+        )
+
+        if not price_valid(order_args.price, tick_size):
+            raise Exception(
+                "price ("
+                + str(order_args.price)
+                + "), min: "
+                + str(tick_size)
+                + " - max: "
+                + str(1 - float(tick_size))
+            )
+
+        neg_risk = (
+            options.neg_risk
+            if options and options.neg_risk
+            else await self.get_neg_risk(order_args.token_id)
+        )
+
+        return CreateOrderOptions(
+            tick_size=tick_size,
+            neg_risk=neg_risk,
+        )
+
+    @with_deadline
+    async def create_order(
+        self, order_args: OrderArgs, options: Optional[PartialCreateOrderOptions] = None
+    ):
+        """
+        Creates and signs an order
+        Level 1 Auth required
+        """
+        self.assert_level_1_auth()
+
+        resolved_options = await self.__resolve_order_options(order_args, options)
+        with timed_signing(self.instrumentation, SIGN_ORDER):
+            return self.builder.create_order(order_args, resolved_options)
+
+    @with_deadline
+    async def create_orders(
+        self,
+        orders_args: list[OrderArgs],
+        options: Optional[PartialCreateOrderOptions] = None,
+        executor: Executor = None,
+    ) -> list[SignedOrder]:
+        """
+        Creates and signs a list of orders
+        The pool of client.builder.signing_pool() can be provided to sign them in worker processes
+        Level 1 Auth required
+        """
+        self.assert_level_1_auth()
+
+        orders = [
+            (order_args, await self.__resolve_order_options(order_args, options))
+            for order_args in orders_args
+        ]
+        with timed_signing(self.instrumentation, SIGN_ORDERS):
+            if executor is None:
+                return self.builder.create_orders(orders)
+            return await asyncio.to_thread(self.builder.create_orders, orders, executor)
+
+    @with_deadline
+    async def create_market_order(
+        self,
+        order_args: MarketOrderArgs,
+        options: Optional[PartialCreateOrderOptions] = None,
+    ):
+        """
+        Creates and signs an order
+        Level 1 Auth required
+        """
+        self.assert_level_1_auth()
+
+        # add resolve_order_options, or similar
+        tick_size = await self.__resolve_tick_size(
+            order_args.token_id,
+            options.tick_size if options else None,
+        )
+
+        if order_args.price is None or order_args.price <= 0:
+            order_args.price = await self.calculate_market_price(
+                order_args.token_id, order_args.side, order_args.amount
+            )
+
+        if not price_valid(order_args.price, tick_size):
+            raise Exception(
+                "price ("
+                + str(order_args.price)
+                + "), min: "
+                + str(tick_size)
+                + " - max: "
+                + str(1 - float(tick_size))
+            )
+
+        neg_risk = (
+            options.neg_risk
+            if options and options.neg_risk
+            else await self.get_neg_risk(order_args.token_id)
+        )
+
+        with timed_signing(self.instrumentation, SIGN_MARKET_ORDER):
+            return self.builder.create_market_order(
+                order_args,
+                CreateOrderOptions(
+                    tick_size=tick_size,
+                    neg_risk=neg_risk,
+                ),
+            )
+
+    @with_deadline
+    async def post_order(self, order, orderType: OrderType = OrderType.GTC):
+        """
+        Posts the order
+        """
+        self.assert_level_2_auth()
+        body = serialize_body(order_to_json(order, self.creds.api_key, orderType))
+        headers = self._create_level_2_headers(
+            RequestArgs(method="POST", request_path=POST_ORDER, body=body)
+        )
+        try:
+            return await self._post(
+                "{}{}".format(self.host, POST_ORDER), headers=headers, data=body
+            )
+        except PolyApiException as e:
+            self._invalidate_on_tick_size_error(order, e.error_msg)
+            raise
+
+    @with_deadline
+    async def post_orders(self, args: list[PostOrdersArgs]):
+        """
+        Posts a batch of orders
+        Batches larger than POST_ORDERS_BATCH_LIMIT are split into several requests, sent one after the other
+        If a request fails, its error carries the results of the previous requests in partial_results,
+        and the orders of the failed and following requests in unposted_orders
+        Level 2 Auth required
+        """
+        self.assert_level_2_auth()
+        results = []
+        for i in range(0, len(args), POST_ORDERS_BATCH_LIMIT):
+            chunk = args[i : i + POST_ORDERS_BATCH_LIMIT]
+            body = serialize_body(
+                [
+                    order_to_json(arg.order, self.creds.api_key, arg.orderType)
+                    for arg in chunk
+                ]
+            )
+            headers = self._create_level_2_headers(
+                RequestArgs(method="POST", request_path=POST_ORDERS, body=body)
+            )
+            try:
+                resp = await self._post(
+                    "{}{}".format(self.host, POST_ORDERS), headers=headers, data=body
+                )
+            except PolyException as e:
+                if isinstance(e, PolyApiException):
+                    for arg in chunk:
+                        self._invalidate_on_tick_size_error(arg.order, e.error_msg)
+                e.partial_results = results
+                e.unposted_orders = args[i:]
+                raise
+            resp = resp if isinstance(resp, list) else [resp]
+            for arg, result in zip(chunk, resp):
+                if isinstance(result, dict) and result.get("errorMsg"):
+                    self._invalidate_on_tick_size_error(arg.order, result["errorMsg"])
+            results += resp
+        return results
+
+    @with_deadline
+    async def create_and_post_order(
+        self, order_args: OrderArgs, options: PartialCreateOrderOptions = None
+    ):
+        """
+        Utility function to create and publish an order
+        """
+        ord = await self.create_order(order_args, options)
+        return await self.post_order(ord)
+
+    @with_deadline
+    async def cancel(self, order_id):
+        """
+        Cancels an order
+        Level 2 Auth required
+        """
+        self.assert_level_2_auth()
+        body = serialize_body({"orderID": order_id})
+
+        request_args = RequestArgs(method="DELETE", request_path=CANCEL, body=body)
+        headers = self._create_level_2_headers(request_args)
+        return await self._delete(
+            "{}{}".format(self.host, CANCEL), headers=headers, data=body
+        )
+
+    @with_deadline
+    async def cancel_orders(self, order_ids):
+        """
+        Cancels orders
+        Level 2 Auth required
+        """
+        self.assert_level_2_auth()
+        body = serialize_body(order_ids)
+
+        request_args = RequestArgs(
+            method="DELETE", request_path=CANCEL_ORDERS, body=body
+        )
+        headers = self._create_level_2_headers(request_args)
+        return await self._delete(
+            "{}{}".format(self.host, CANCEL_ORDERS), headers=headers, data=body
+        )
+
+    @with_deadline
+    async def cancel_all(self):
+        """
+        Cancels all available orders for the user
+        Level 2 Auth required
+        """
+        self.assert_level_2_auth()
+        request_args = RequestArgs(method="DELETE", request_path=CANCEL_ALL)
+        headers = self._create_level_2_headers(request_args)
+        return await self._delete("{}{}".format(self.host, CANCEL_ALL), headers=headers)
+
+    @with_deadline
+    async def cancel_market_orders(self, market: str = "", asset_id: str = ""):
+        """
+        Cancels orders
+        Level 2 Auth required
+        """
+        self.assert_level_2_auth()
+        body = serialize_body({"market": market, "asset_id": asset_id})
+
+        request_args = RequestArgs(
+            method="DELETE", request_path=CANCEL_MARKET_ORDERS, body=body
+        )
+        headers = self._create_level_2_headers(request_args)
+        return await self._delete(
+            "{}{}".format(self.host, CANCEL_MARKET_ORDERS), headers=headers, data=body
+        )
+
+    @with_deadline
+    async def get_orders(
+        self,
+        params: OpenOrderParams = None,
+        next_cursor=START_CURSOR,
+        typed: bool = False,
+    ):
+        """
+        Gets orders for the API key
+        With typed, the orders are decoded into OpenOrder instead of dicts
+        Requires Level 2 authentication
+        """
+        return [r async for r in self.iter_orders(params, next_cursor, typed)]
+
+    @with_deadline
+    def iter_orders(
+        self,
+        params: OpenOrderParams = None,
+        next_cursor=START_CURSOR,
+        typed: bool = False,
+    ):
+        """
+        Iterates over the orders for the API key, yielding records page by page
+        The next page is fetched while the current one is consumed
+        With typed, the orders are decoded into OpenOrder instead of dicts
+        Requires Level 2 authentication
+        """
+        self.assert_level_2_auth()
+        return aiter_prefetched_pages(
+            lambda cursor: self.__get_orders_page(params, cursor, typed), next_cursor
+        )
+
+    async def __get_orders_page(
+        self, params: OpenOrderParams, next_cursor: str, typed: bool
+    ):
+        request_args = RequestArgs(method="GET", request_path=ORDERS)
+        headers = self._create_level_2_headers(request_args)
+        url = add_query_open_orders_params(
+            "{}{}".format(self.host, ORDERS), params or OpenOrderParams(), next_cursor
+        )
+        return await self._get(
+            url, headers=headers, decoder=OPEN_ORDERS_PAGE_DECODER if typed else None
+        )
+
+    @with_deadline
+    async def get_order_book(
+        self, token_id, compact: bool = False
+    ) -> Union[OrderBookSummary, CompactOrderBook]:
+        """
+        Fetches the orderbook for the token_id
+        With compact, the levels are parsed into arrays, see CompactOrderBook
+        With a coalescer, concurrent calls are merged into get_order_books requests
+        """
+        if self.coalescer is not None:
+            return await self.coalescer.call_async(
+                (self.host, GET_ORDER_BOOKS, compact),
+                token_id,
+                lambda token_ids: self.__fetch_order_books(token_ids, compact),
+            )
+        url = "{}{}?token_id={}".format(self.host, GET_ORDER_BOOK, token_id)
+        if compact:
+            return CompactOrderBook.from_raw(await self._get(url))
+        return await self._get(url, decoder=ORDER_BOOK_DECODER)
+
+    @with_deadline
+    async def get_order_books(
+        self, params: list[BookParams], compact: bool = False
+    ) -> Union[list[OrderBookSummary], list[CompactOrderBook]]:
+        """
+        Fetches the orderbook for a set of token ids
+        With compact, the levels are parsed into arrays, see CompactOrderBook
+        """
+        body = [{"token_id": param.token_id} for param in params]
+        if compact:
+            raw_obs = await self._post_batch(GET_ORDER_BOOKS, body)
+            return [CompactOrderBook.from_raw(r) for r in raw_obs]
+        return await self._post_batch(
+            GET_ORDER_BOOKS, body, decoder=ORDER_BOOKS_DECODER
+        )
+
+    async def __fetch_order_books(self, token_ids: list, compact: bool) -> dict:
+        books = await self.get_order_books(
+            [BookParams(token_id=t) for t in token_ids], compact
+        )
+        return {book.asset_id: book for book in books}
+
+    def get_order_book_hash(self, orderbook: OrderBookSummary) -> str:
+        """
+        Calculates the hash for the given orderbook
+        """
+        return generate_orderbook_summary_hash(orderbook)
+
+    @with_deadline
+    async def get_order(self, order_id, typed: bool = False):
+        """
+        Fetches the order corresponding to the order_id
+        With typed, the order is decoded into an OpenOrder instead of a dict
+        Requires Level 2 authentication
+        """
+        self.assert_level_2_auth()
+        endpoint = "{}{}".format(GET_ORDER, order_id)
+        request_args = RequestArgs(method="GET", request_path=endpoint)
+        headers = self._create_level_2_headers(request_args)
+        return await self._get(
+            "{}{}".format(self.host, endpoint),
+            headers=headers,
+            decoder=OPEN_ORDER_DECODER if typed else None,
+        )
+
+    @with_deadline
+    async def get_trades(
+        self, params: TradeParams = None, next_cursor=START_CURSOR, typed: bool = False
+    ):
+        """
+        Fetches the trade history for a user
+        With typed, the trades are decoded into Trade instead of dicts
+        Requires Level 2 authentication
+        """
+        return [r async for r in self.iter_trades(params, next_cursor, typed)]
+
+    @with_deadline
+    def iter_trades(
+        self, params: TradeParams = None, next_cursor=START_CURSOR, typed: bool = False
+    ):
+        """
+        Iterates over the trade history for a user, yielding records page by page
+        The next page is fetched while the current one is consumed
+        With typed, the trades are decoded into Trade instead of dicts
+        Requires Level 2 authentication
+        """
+        self.assert_level_2_auth()
+        return aiter_prefetched_pages(
+            lambda cursor: self.__get_trades_page(params, cursor, typed), next_cursor
+        )
+
+    async def __get_trades_page(
+        self, params: TradeParams, next_cursor: str, typed: bool
+    ):
+        request_args = RequestArgs(method="GET", request_path=TRADES)
+        headers = self._create_level_2_headers(request_args)
+        url = add_query_trade_params(
+            "{}{}".format(self.host, TRADES), params or TradeParams(), next_cursor
+        )
+        return await self._get(
+            url, headers=headers, decoder=TRADES_PAGE_DECODER if typed else None
+        )
+
+    @with_deadline
+    async def get_last_trade_price(self, token_id):
+        """
+        Fetches the last trade price token_id
+        """
+        return await self._get(
+            "{}{}?token_id={}".format(self.host, GET_LAST_TRADE_PRICE, token_id)
+        )
+
+    @with_deadline
+    async def get_last_trades_prices(self, params: list[BookParams]):
+        """
+        Fetches the last trades prices for a set of token ids
+        """
+        body = [{"token_id": param.token_id} for param in params]
+        return await self._post_batch(GET_LAST_TRADES_PRICES, body)
+
+    def assert_level_1_auth(self):
+        """
+        Level 1 Poly Auth
+        """
+        if self.mode < L1:
+            raise PolyException(L1_AUTH_UNAVAILABLE)
+
+    def assert_level_2_auth(self):
+        """
+        Level 2 Poly Auth
+        """
+        if self.mode < L2:
+            raise PolyException(L2_AUTH_UNAVAILABLE)
+
+    def _get_client_mode(self):
+        if self.signer is not None and self.creds is not None:
+            return L2
+        if self.signer is not None:
+            return L1
+        return L0
+
+    @with_deadline
+    async def get_notifications(self):
+        """
+        Fetches the notifications for a user
+        Requires Level 2 authentication
+        """
+        self.assert_level_2_auth()
+        request_args = RequestArgs(method="GET", request_path=GET_NOTIFICATIONS)
+        headers = self._create_level_2_headers(request_args)
+        url = "{}{}?signature_type={}".format(
+            self.host, GET_NOTIFICATIONS, self.builder.sig_type
+        )
+        return await self._get(url, headers=headers)
+
+    @with_deadline
+    async def drop_notifications(self, params: DropNotificationParams = None):
+        """
+        Drops the notifications for a user
+        Requires Level 2 authentication
+        """
+        self.assert_level_2_auth()
+        request_args = RequestArgs(method="DELETE", request_path=DROP_NOTIFICATIONS)
+        headers = self._create_level_2_headers(request_args)
+        url = drop_notifications_query_params(
+            "{}{}".format(self.host, DROP_NOTIFICATIONS), params
+        )
+        return await self._delete(url, headers=headers)
+
+    @with_deadline
+    async def get_balance_allowance(self, params: BalanceAllowanceParams = None):
+        """
+        Fetches the balance & allowance for a user
+        Requires Level 2 authentication
+        """
+        self.assert_level_2_auth()
+        request_args = RequestArgs(method="GET", request_path=GET_BALANCE_ALLOWANCE)
+        headers = self._create_level_2_headers(request_args)
+        if params.signature_type == -1:
+            params.signature_type = self.builder.sig_type
+        url = add_balance_allowance_params_to_url(
+            "{}{}".format(self.host, GET_BALANCE_ALLOWANCE), params
+        )
+        return await self._get(url, headers=headers)
+
+    @with_deadline
+    async def update_balance_allowance(self, params: BalanceAllowanceParams = None):
+        """
+        Updates the balance & allowance for a user
+        Requires Level 2 authentication
+        """
+        self.assert_level_2_auth()
+        request_args = RequestArgs(method="GET", request_path=UPDATE_BALANCE_ALLOWANCE)
+        headers = self._create_level_2_headers(request_args)
+        if params.signature_type == -1:
+            params.signature_type = self.builder.sig_type
+        url = add_balance_allowance_params_to_url(
+            "{}{}".format(self.host, UPDATE_BALANCE_ALLOWANCE), params
+        )
+        return await self._get(url, headers=headers)
+
+    @with_deadline
+    async def is_order_scoring(self, params: OrderScoringParams):
+        """
+        Check if the order is currently scoring
+        Requires Level 2 authentication
+        """
+        self.assert_level_2_auth()
+        request_args = RequestArgs(method="GET", request_path=IS_ORDER_SCORING)
+        headers = self._create_level_2_headers(request_args)
+        url = add_order_scoring_params_to_url(
+            "{}{}".format(self.host, IS_ORDER_SCORING), params
+        )
+        return await self._get(url, headers=headers)
+
+    @with_deadline
+    async def are_orders_scoring(self, params: OrdersScoringParams):
+        """
+        Check if the orders are currently scoring
+        Requires Level 2 authentication
+        """
+        self.assert_level_2_auth()
+        body = serialize_body(params.orderIds)
+        request_args = RequestArgs(
+            method="POST", request_path=ARE_ORDERS_SCORING, body=body
+        )
+        headers = self._create_level_2_headers(request_args)
+        return await self._post(
+            "{}{}".format(self.host, ARE_ORDERS_SCORING), headers=headers, data=body
+        )
+
+    @with_deadline
+    async def get_sampling_markets(self, next_cursor="MA=="):
+        """
+        Get the current sampling markets
+        """
+        return await self._get(
+            "{}{}?next_cursor={}".format(self.host, GET_SAMPLING_MARKETS, next_cursor)
+        )
+
+    @with_deadline
+    async def get_sampling_simplified_markets(self, next_cursor="MA=="):
+        """
+        Get the current sampling simplified markets
+        """
+        return await self._get(
+            "{}{}?next_cursor={}".format(
+                self.host, GET_SAMPLING_SIMPLIFIED_MARKETS, next_cursor
+            )
+        )
+
+    @with_deadline
+    async def get_markets(self, next_cursor="MA=="):
+        """
+        Get the current markets
+        """
+        return await self._get(
+            "{}{}?next_cursor={}".format(self.host, GET_MARKETS, next_cursor)
+        )
+
+    @with_deadline
+    async def get_simplified_markets(self, next_cursor="MA=="):
+        """
+        Get the current simplified markets
+        """
+        return await self._get(
+            "{}{}?next_cursor={}".format(self.host, GET_SIMPLIFIED_MARKETS, next_cursor)
+        )
+
+    @with_deadline
+    def iter_all_markets(self, concurrency: int = 1, next_cursor=START_CURSOR):
+        """
+        Asynchronously iterates over all the markets, fetching up to concurrency pages at once
+        """
+        return aiter_pages(self.get_markets, next_cursor, concurrency)
+
+    @with_deadline
+    async def get_all_markets(self, concurrency: int = 1, next_cursor=START_CURSOR):
+        """
+        Get all the markets, walking every page
+        """
+        return [m async for m in self.iter_all_markets(concurrency, next_cursor)]
+
+    @with_deadline
+    def iter_all_simplified_markets(
+        self, concurrency: int = 1, next_cursor=START_CURSOR
+    ):
+        """
+        Asynchronously iterates over all the simplified markets, fetching up to concurrency pages at once
+        """
+        return aiter_pages(self.get_simplified_markets, next_cursor, concurrency)
+
+    @with_deadline
+    async def get_all_simplified_markets(
+        self, concurrency: int = 1, next_cursor=START_CURSOR
+    ):
+        """
+        Get all the simplified markets, walking every page
+        """
+        return [
+            m async for m in self.iter_all_simplified_markets(concurrency, next_cursor)
+        ]
+
+    @with_deadline
+    def iter_all_sampling_markets(self, concurrency: int = 1, next_cursor=START_CURSOR):
+        """
+        Asynchronously iterates over all the sampling markets, fetching up to concurrency pages at once
+        """
+        return aiter_pages(self.get_sampling_markets, next_cursor, concurrency)
+
+    @with_deadline
+    async def get_all_sampling_markets(
+        self, concurrency: int = 1, next_cursor=START_CURSOR
+    ):
+        """
+        Get all the sampling markets, walking every page
+        """
+        return [
+            m async for m in self.iter_all_sampling_markets(concurrency, next_cursor)
+        ]
+
+    @with_deadline
+    def iter_all_sampling_simplified_markets(
+        self, concurrency: int = 1, next_cursor=START_CURSOR
+    ):
+        """
+        Asynchronously iterates over all the sampling simplified markets, fetching up to concurrency pages at once
+        """
+        return aiter_pages(
+            self.get_sampling_simplified_markets, next_cursor, concurrency
+        )
+
+    @with_deadline
+    async def get_all_sampling_simplified_markets(
+        self, concurrency: int = 1, next_cursor=START_CURSOR
+    ):
+        """
+        Get all the sampling simplified markets, walking every page
+        """
+        return [
+            m
+            async for m in self.iter_all_sampling_simplified_markets(
+                concurrency, next_cursor
+            )
+        ]
+
+    @with_deadline
+    async def get_market(self, condition_id):
+        """
+        Get a market by condition_id
+        """
+        return await self._get("{}{}{}".format(self.host, GET_MARKET, condition_id))
+
+    @with_deadline
+    async def get_market_trades_events(self, condition_id):
+        """
+        Get the market's trades events by condition id
+        """
+        return await self._get(
+            "{}{}{}".format(self.host, GET_MARKET_TRADES_EVENTS, condition_id)
+        )
+
+    @with_deadline
+    async def calculate_market_price(
+        self, token_id: str, side: str, amount: float
+    ) -> float:
+        """
+        Calculates the matching price considering an amount and the current orderbook
+        """
+        book = await self.get_order_book(token_id)
+        if book is None:
+            raise Exception("no orderbook")
+        if side == "BUY":
+            if book.asks is None:
+                raise Exception("no match")
+            return self.builder.calculate_buy_market_price(book.asks, amount)
+        else:
+            if book.bids is None:
+                raise Exception("no match")
+            return self.builder.calculate_sell_market_price(book.bids, amount)
+
+    @with_deadline
+    async def get_book_depth(self, token_id: str, side: str) -> BookDepth:
+        """
+        Fetches the orderbook once and returns the depth consumed by a market order on the given side
+        """
+        book = await self.get_order_book(token_id, compact=True)
+        if book is None:
+            raise Exception("no orderbook")
+        return book.depth(side)
+
+    @with_deadline
+    async def get_local_order_book(
+        self, token_id: str, verify_hash: bool = True
+    ) -> LocalOrderBook:
+        """
+        Returns a LocalOrderBook seeded from the current orderbook, to be fed with the
+        messages of the market websocket channel
+        LocalOrderBook.apply is synchronous, so the book can't resync through get_order_book:
+        on a hash mismatch it is marked out of sync until the next book message of the channel
+        """
+        book = LocalOrderBook(token_id, verify_hash=verify_hash)
+        book.seed(await self.get_order_book(token_id), verified=False)
+        return book
+
+    @with_deadline
+    async def calculate_market_prices(
+        self, token_id: str, side: str, amounts: list[float]
+    ) -> list[Optional[float]]:
+        """
+        Calculates the matching price of many amounts against a single orderbook snapshot
+        None is returned for the amounts the orderbook can't match
+        """
+        depth = await self.get_book_depth(token_id, side)
+        return depth.market_prices(amounts)
@@ -0,0 +1,237 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Hashable
+
+from .exceptions import DeadlineExceeded, PolyApiException
+from .http_helpers.deadline import current_deadline
+
+# tokens sent in one request to the batch endpoints, larger calls are split
+MAX_BATCH_SIZE = 500
+# chunks of a split batch call sent at once
+DEFAULT_BATCH_CONCURRENCY = 4
+# seconds during which per-token requests are collected into one batch
+DEFAULT_COALESCE_WINDOW = 0.005
+
+
+def chunks(items: list, size: int) -> list[list]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def merge_results(results: list):
+    """
+    Merges the responses to the chunks of a batch call, lists are concatenated and dicts merged
+    """
+    if all(isinstance(r, dict) for r in results):
+        merged = {}
+        for result in results:
+            merged.update(result)
+        return merged
+    merged = []
+    for result in results:
+        merged.extend(result)
+    return merged
+
+
+def fetch_in_chunks(
+    fetch: Callable[[list], Any],
+    items: list,
+    size: int = MAX_BATCH_SIZE,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+):
+    """
+    Fetches items in chunks of at most size, concurrency chunks at a time, and merges the responses
+    """
+    parts = chunks(items, size)
+    if len(parts) <= 1:
+        return fetch(items)
+
+    executor = ThreadPoolExecutor(max_workers=min(concurrency, len(parts)))
+    try:
+        # each chunk runs in a copy of the caller context, so it sees its deadline_scope
+        futures = [
+            executor.submit(contextvars.copy_context().run, fetch, part)
+            for part in parts
+        ]
+        return merge_results([future.result() for future in futures])
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def afetch_in_chunks(
+    fetch: Callable[[list], Awaitable[Any]],
+    items: list,
+    size: int = MAX_BATCH_SIZE,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+):
+    """
+    Async version of fetch_in_chunks, the chunks are fetched as concurrent tasks
+    """
+    parts = chunks(items, size)
+    if len(parts) <= 1:
+        return await fetch(items)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_part(part: list):
+        async with semaphore:
+            return await fetch(part)
+
+    tasks = [asyncio.ensure_future(fetch_part(part)) for part in parts]
+    try:
+        return merge_results(await asyncio.gather(*tasks))
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+class _Batch:
+    __slots__ = ("fetch", "waiters", "handle")
+
+    def __init__(self, fetch: Callable):
+        self.fetch = fetch
+        # futures of the callers, by param
+        self.waiters: dict[Hashable, list] = {}
+        self.handle = None
+
+
+def _resolve(batch: _Batch, results: dict):
+    for param, waiters in batch.waiters.items():
+        if param in results:
+            outcome, is_error = results[param], False
+        else:
+            outcome = PolyApiException(error_msg="No result for {}".format(param))
+            is_error = True
+        for waiter in waiters:
+            if waiter.done():
+                continue
+            if is_error:
+                waiter.set_exception(outcome)
+            else:
+                waiter.set_result(outcome)
+
+
+def _fail(batch: _Batch, error: BaseException):
+    for waiters in batch.waiters.values():
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_exception(error)
+
+
+class RequestCoalescer:
+    """
+    Merges concurrent per-token requests into requests to the batch endpoints
+
+        client = ClobClient(host, coalescer=RequestCoalescer())
+        # from many threads, sent as a few get_midpoints requests
+        client.get_midpoint(token_id)
+
+    The first request for an endpoint opens a batch, requests made within window seconds join it.
+    The batch is sent when the window closes or once it holds max_batch_size distinct params.
+    Every caller receives the result of its param, or the error of the batch request.
+    Batches are sent outside of the callers' deadlines, each caller waits until its own deadline.
+    """
+
+    def __init__(
+        self,
+        window: float = DEFAULT_COALESCE_WINDOW,
+        max_batch_size: int = MAX_BATCH_SIZE,
+    ):
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        self._batches: dict[Hashable, _Batch] = {}
+        self._async_batches: dict[Hashable, _Batch] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def call(self, key: Hashable, param: Hashable, fetch: Callable[[list], dict]):
+        """
+        Returns the result of param, fetched along with the other params of the batch of key
+        fetch: fetches a list of params and returns their results keyed by param
+        """
+        waiter = Future()
+        with self._lock:
+            batch = self._batches.get(key)
+            if batch is None:
+                batch = self._batches[key] = _Batch(fetch)
+                batch.handle = threading.Timer(self.window, self._flush, (key, batch))
+                batch.handle.daemon = True
+                batch.handle.start()
+            batch.waiters.setdefault(param, []).append(waiter)
+            full = len(batch.waiters) >= self.max_batch_size
+            if full:
+                del self._batches[key]
+        if full:
+            batch.handle.cancel()
+            contextvars.Context().run(self._run, batch)
+
+        deadline = current_deadline()
+        try:
+            return waiter.result(None if deadline is None else deadline.remaining())
+        except concurrent.futures.TimeoutError as e:
+            raise DeadlineExceeded() from e
+
+    def _flush(self, key: Hashable, batch: _Batch):
+        with self._lock:
+            if self._batches.get(key) is not batch:
+                return
+            del self._batches[key]
+        self._run(batch)
+
+    def _run(self, batch: _Batch):
+        try:
+            results = batch.fetch(list(batch.waiters))
+        except Exception as e:
+            _fail(batch, e)
+            return
+        _resolve(batch, results)
+
+    async def call_async(
+        self, key: Hashable, param: Hashable, fetch: Callable[[list], Awaitable[dict]]
+    ):
+        """
+        Async version of call, fetch is a coroutine function
+        """
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        batch = self._async_batches.get(key)
+        if batch is None:
+            batch = self._async_batches[key] = _Batch(fetch)
+            batch.handle = loop.call_later(
+                self.window,
+                self._flush_async,
+                key,
+                batch,
+                context=contextvars.Context(),
+            )
+        batch.waiters.setdefault(param, []).append(waiter)
+        if len(batch.waiters) >= self.max_batch_size:
+            batch.handle.cancel()
+            contextvars.Context().run(self._flush_async, key, batch)
+
+        deadline = current_deadline()
+        try:
+            return await asyncio.wait_for(
+                waiter, None if deadline is None else deadline.remaining()
+            )
+        except asyncio.TimeoutError as e:
+            raise DeadlineExceeded() from e
+
+    def _flush_async(self, key: Hashable, batch: _Batch):
+        if self._async_batches.get(key) is not batch:
+            return
+        del self._async_batches[key]
+        task = asyncio.ensure_future(self._run_async(batch))
+        # keeps a reference until the batch completes
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_async(self, batch: _Batch):
+        try:
+            results = await batch.fetch(list(batch.waiters))
+        except Exception as e:
+            _fail(batch, e)
+            return
+        _resolve(batch, results)
@@ -0,0 +1,176 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields as dataclass_fields
+from typing import Any, Callable, Hashable, Optional
+
+from .clob_types import TickSize
+
+DEFAULT_CACHE_MAXSIZE = 10000
+DEFAULT_CACHE_TTL = 300
+
+
+class TTLCache:
+    """
+    Thread safe LRU cache whose entries expire ttl seconds after being set
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_CACHE_MAXSIZE,
+        ttl: float = DEFAULT_CACHE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= self.clock():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def prune(self) -> int:
+        """
+        Drops the expired entries, returns how many were dropped
+        """
+        with self._lock:
+            now = self.clock()
+            expired = [
+                k for k, (expires_at, _) in self._entries.items() if expires_at <= now
+            ]
+            for key in expired:
+                del self._entries[key]
+            return len(expired)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self):
+        """
+        Number of live entries, the expired ones are pruned first
+        """
+        self.prune()
+        return len(self._entries)
+
+
+@dataclass(frozen=True)
+class MarketMetadata:
+    tick_size: Optional[TickSize] = None
+    neg_risk: Optional[bool] = None
+    condition_id: Optional[str] = None
+
+
+_METADATA_FIELDS = frozenset(f.name for f in dataclass_fields(MarketMetadata))
+
+
+class MarketMetadataCache:
+    """
+    Per token cache of the market metadata needed to create orders
+    Each field expires ttl seconds after it was set, so tick size changes are picked up,
+    and the least recently used tokens are evicted past maxsize
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_CACHE_MAXSIZE,
+        ttl: float = DEFAULT_CACHE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.clock = clock
+        # token id -> {field: (expires_at, value)}, replaced as a whole on update
+        self.entries = TTLCache(maxsize, ttl, clock)
+        self._lock = threading.Lock()
+
+    def get(self, token_id: str) -> MarketMetadata:
+        record = self.entries.get(token_id)
+        if not record:
+            return MarketMetadata()
+        now = self.clock()
+        return MarketMetadata(
+            **{
+                name: value
+                for name, (expires_at, value) in record.items()
+                if expires_at > now
+            }
+        )
+
+    def update(self, token_id: str, **fields):
+        """
+        Sets some of the metadata of a token, e.g. update(token_id, tick_size="0.01")
+        The other fields keep their value and expiry
+        """
+        unknown = fields.keys() - _METADATA_FIELDS
+        if unknown:
+            raise TypeError(f"Unknown market metadata fields: {sorted(unknown)}")
+        with self._lock:
+            expires_at = self.clock() + self.ttl
+            record = dict(self.entries.get(token_id) or {})
+            record.update({name: (expires_at, v) for name, v in fields.items()})
+            self.entries.set(token_id, record)
+
+    def get_tick_size(self, token_id: str) -> Optional[TickSize]:
+        return self.get(token_id).tick_size
+
+    def get_neg_risk(self, token_id: str) -> Optional[bool]:
+        return self.get(token_id).neg_risk
+
+    def update_from_market(self, market: dict, token_ids: set = None) -> list[str]:
+        """
+        Caches the metadata of the tokens of a market, as returned by get_markets
+        token_ids: only cache these tokens, every token of the market if not given
+        Returns the token ids cached
+        """
+        fields = {"condition_id": market.get("condition_id")}
+        if market.get("minimum_tick_size") is not None:
+            fields["tick_size"] = str(market["minimum_tick_size"])
+        if market.get("neg_risk") is not None:
+            fields["neg_risk"] = market["neg_risk"]
+
+        cached = [
+            t["token_id"]
+            for t in market.get("tokens") or []
+            if t.get("token_id") and (token_ids is None or t["token_id"] in token_ids)
+        ]
+        for token_id in cached:
+            self.update(token_id, **fields)
+        return cached
+
+    def invalidate(self, token_id: str = None):
+        """
+        Drops the metadata of a token, or of every token
+        """
+        if token_id is None:
+            self.entries.clear()
+        else:
+            self.entries.invalidate(token_id)
+
+    def __len__(self):
+        return len(self.entries)
@@ -0,0 +1,254 @@
+import hashlib
+import json
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+from .constants import END_CURSOR, START_CURSOR
+from .pagination import iter_pages
+from .utilities import decode_cursor
+
+SCHEMA_VERSION = "1"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS markets (
+    condition_id TEXT PRIMARY KEY,
+    question TEXT,
+    market_slug TEXT,
+    active INTEGER,
+    closed INTEGER,
+    minimum_tick_size TEXT,
+    neg_risk INTEGER,
+    digest TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tokens (
+    token_id TEXT PRIMARY KEY,
+    condition_id TEXT NOT NULL,
+    outcome TEXT
+);
+CREATE INDEX IF NOT EXISTS tokens_condition_id ON tokens (condition_id);
+"""
+
+LAST_CURSOR = "last_cursor"
+
+
+@dataclass
+class RefreshStats:
+    markets: int = 0
+    inserted: int = 0
+    updated: int = 0
+
+
+def market_digest(market: dict) -> str:
+    return hashlib.sha1(
+        json.dumps(market, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+
+
+def _flag(value) -> Optional[int]:
+    return None if value is None else int(bool(value))
+
+
+class MarketCatalogue:
+    """
+    Local copy of the markets catalogue, stored in a SQLite file keyed by condition id and token id
+
+        catalogue = MarketCatalogue("markets.sqlite")
+        catalogue.refresh(client.get_markets, concurrency=8)
+        market = catalogue.get_market_by_token(token_id)
+
+    A refresh resumes from the last page seen, so only the pages holding new markets are fetched,
+    a full refresh walks every page to pick up changes to existing markets.
+    In both cases only the new or changed markets are written
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+            version = self._get_meta("schema_version")
+            if version is None:
+                self._set_meta("schema_version", SCHEMA_VERSION)
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row["value"] if row else None
+
+    def _set_meta(self, key: str, value: str):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    @property
+    def last_cursor(self) -> Optional[str]:
+        """
+        Cursor of the last page holding markets, where an incremental refresh resumes
+        """
+        return self._get_meta(LAST_CURSOR)
+
+    def refresh(
+        self,
+        fetch: Callable[[str], dict],
+        full: bool = False,
+        concurrency: int = 1,
+        on_change: Callable[[dict], None] = None,
+    ) -> RefreshStats:
+        """
+        Fetches the markets pages and stores the new or changed markets
+        fetch: returns the raw page for a cursor, e.g. ClobClient.get_markets
+        full: walk every page instead of resuming from the last one
+        on_change: called with every new or changed market, e.g. MarketIndex.add
+        """
+        start = START_CURSOR if full else self.last_cursor or START_CURSOR
+        pages = {}
+
+        def fetch_page(cursor: str) -> dict:
+            page = fetch(cursor)
+            if page["data"]:
+                pages[cursor] = page["next_cursor"]
+            return page
+
+        stats = RefreshStats()
+        with self.conn:
+            for market in iter_pages(fetch_page, start, concurrency):
+                stats.markets += 1
+                if self._upsert(market, stats) and on_change is not None:
+                    on_change(market)
+
+            last_cursor = _last_cursor(pages)
+            if last_cursor is not None:
+                self._set_meta(LAST_CURSOR, last_cursor)
+        return stats
+
+    def _upsert(self, market: dict, stats: RefreshStats) -> bool:
+        condition_id = market.get("condition_id")
+        if not condition_id:
+            return False
+
+        digest = market_digest(market)
+        row = self.conn.execute(
+            "SELECT digest FROM markets WHERE condition_id = ?", (condition_id,)
+        ).fetchone()
+        if row is not None and row["digest"] == digest:
+            return False
+
+        tick_size = market.get("minimum_tick_size")
+        self.conn.execute(
+            "INSERT OR REPLACE INTO markets (condition_id, question, market_slug, active, "
+            "closed, minimum_tick_size, neg_risk, digest, updated_at, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                condition_id,
+                market.get("question"),
+                market.get("market_slug"),
+                _flag(market.get("active")),
+                _flag(market.get("closed")),
+                None if tick_size is None else str(tick_size),
+                _flag(market.get("neg_risk")),
+                digest,
+                time.time(),
+                json.dumps(market, separators=(",", ":")),
+            ),
+        )
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO tokens (token_id, condition_id, outcome) VALUES (?, ?, ?)",
+            [
+                (token["token_id"], condition_id, token.get("outcome"))
+                for token in market.get("tokens") or []
+                if token.get("token_id")
+            ],
+        )
+        if row is None:
+            stats.inserted += 1
+        else:
+            stats.updated += 1
+        return True
+
+    def get_market(self, condition_id: str) -> Optional[dict]:
+        row = self.conn.execute(
+            "SELECT data FROM markets WHERE condition_id = ?", (condition_id,)
+        ).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def get_market_by_token(self, token_id: str) -> Optional[dict]:
+        row = self.conn.execute(
+            "SELECT m.data FROM tokens t JOIN markets m ON m.condition_id = t.condition_id "
+            "WHERE t.token_id = ?",
+            (token_id,),
+        ).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def get_token_ids(self, condition_id: str) -> list[str]:
+        rows = self.conn.execute(
+            "SELECT token_id FROM tokens WHERE condition_id = ?", (condition_id,)
+        )
+        return [row["token_id"] for row in rows]
+
+    def markets(self, active: bool = None, closed: bool = None) -> Iterator[dict]:
+        """
+        Iterates over the stored markets, optionally filtered on their active and closed flags
+        """
+        query, args = "SELECT data FROM markets", []
+        filters = []
+        if active is not None:
+            filters.append("active = ?")
+            args.append(int(active))
+        if closed is not None:
+            filters.append("closed = ?")
+            args.append(int(closed))
+        if filters:
+            query += " WHERE " + " AND ".join(filters)
+        for row in self.conn.execute(query, args):
+            yield json.loads(row["data"])
+
+    def search(self, keyword: str) -> list[dict]:
+        """
+        Markets whose question or slug contain the keyword, case insensitive
+        """
+        escaped = keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        pattern = "%" + escaped + "%"
+        rows = self.conn.execute(
+            "SELECT data FROM markets "
+            "WHERE question LIKE ? ESCAPE '\\' OR market_slug LIKE ? ESCAPE '\\'",
+            (pattern, pattern),
+        )
+        return [json.loads(row["data"]) for row in rows]
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM markets").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _last_cursor(pages: dict) -> Optional[str]:
+    """
+    Cursor of the last page holding markets among the fetched pages
+    """
+    if not pages:
+        return None
+    offsets = {cursor: decode_cursor(cursor) for cursor in pages}
+    if all(offset is not None for offset in offsets.values()):
+        return max(offsets, key=offsets.get)
+    # opaque cursors, the last page is the one ending the walk
+    for cursor, next_cursor in pages.items():
+        if next_cursor == END_CURSOR or next_cursor not in pages:
+            return cursor
+    return None
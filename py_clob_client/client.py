@@ -1,8 +1,12 @@
 import logging
-from typing import Optional
+from concurrent.futures import Executor
+from typing import Optional, Union
+
+import requests
+from py_order_utils.model import SignedOrder
 
 from .order_builder.builder import OrderBuilder
-from .headers.headers import create_level_1_headers, create_level_2_headers
+from .headers.headers import create_level_1_headers, Level2HeaderBuilder
 from .signer import Signer
 from .config import get_contract_config
 
@@ -22,6 +26,7 @@ from .endpoints import (
     MID_POINT,
     ORDERS,
     POST_ORDER,
+    POST_ORDERS,
     PRICE,
     TIME,
     TRADES,
@@ -46,6 +51,24 @@ from .endpoints import (
     GET_SPREAD,
     GET_SPREADS,
 )
+from .batching import MAX_BATCH_SIZE, RequestCoalescer, fetch_in_chunks
+from .cache import MarketMetadataCache
+from .decoding import (
+    OPEN_ORDER_DECODER,
+    OPEN_ORDERS_PAGE_DECODER,
+    ORDER_BOOK_DECODER,
+    ORDER_BOOKS_DECODER,
+    TRADES_PAGE_DECODER,
+)
+from .instrumentation import (
+    SIGN_L1_HEADERS,
+    SIGN_L2_HEADERS,
+    SIGN_MARKET_ORDER,
+    SIGN_ORDER,
+    SIGN_ORDERS,
+    Instrumentation,
+    timed_signing,
+)
 from .clob_types import (
     ApiCreds,
     TradeParams,
@@ -63,25 +86,44 @@ from .clob_types import (
     PartialCreateOrderOptions,
     BookParams,
     MarketOrderArgs,
+    PostOrdersArgs,
 )
-from .exceptions import PolyException
+from .exceptions import PolyApiException, PolyException
 from .http_helpers.helpers import (
+    DEFAULT_TIMEOUT,
     add_query_trade_params,
     add_query_open_orders_params,
     delete,
     get,
     post,
+    serialize_body,
+    create_session,
     drop_notifications_query_params,
     add_balance_allowance_params_to_url,
     add_order_scoring_params_to_url,
 )
 
-from .constants import L0, L1, L1_AUTH_UNAVAILABLE, L2, L2_AUTH_UNAVAILABLE, END_CURSOR
+from .constants import (
+    L0,
+    L1,
+    L1_AUTH_UNAVAILABLE,
+    L2,
+    L2_AUTH_UNAVAILABLE,
+    START_CURSOR,
+    POST_ORDERS_BATCH_LIMIT,
+)
+from .order_book.compact import CompactOrderBook
+from .order_book.depth import BookDepth
+from .order_book.local_book import LocalOrderBook
+from .http_helpers.rate_limit import RateLimiter
+from .http_helpers.deadline import with_deadline
+from .http_helpers.retry import Retrier
+from .pagination import iter_pages, iter_prefetched_pages
 from .utilities import (
-    parse_raw_orderbook_summary,
     generate_orderbook_summary_hash,
     order_to_json,
     is_tick_size_smaller,
+    is_tick_size_error,
     price_valid,
 )
 
@@ -95,6 +137,14 @@ class ClobClient:
         creds: ApiCreds = None,
         signature_type: int = None,
         funder: str = None,
+        session: requests.Session = None,
+        market_cache: MarketMetadataCache = None,
+        rate_limiter: RateLimiter = None,
+        retrier: Retrier = None,
+        timeout=DEFAULT_TIMEOUT,
+        instrumentation: Instrumentation = None,
+        coalescer: RequestCoalescer = None,
+        batch_size: int = MAX_BATCH_SIZE,
     ):
         """
         Initializes the clob client
@@ -107,12 +157,29 @@ class ClobClient:
 
         3) Level 2: Requires the host, chain_id, a private key, and Credentials.
                     Allows access to all endpoints
+
+        An http session can be provided to control connection pooling, see http_helpers.create_session.
+        Connections are kept alive and reused across requests.
+        Tick sizes and neg risk flags are kept in market_cache, see cache.MarketMetadataCache.
+        Requests are kept within the limits of rate_limiter if given, see http_helpers.rate_limit.RateLimiter.
+        Failed requests are retried by retrier if given, see http_helpers.retry.Retrier.
+        timeout: seconds, or (connect, read) seconds, allowed to every request.
+        Every call takes a deadline keyword argument, a number of seconds or a Deadline,
+        bounding all the requests it makes, e.g. the book and tick size lookups of create_market_order.
+        DeadlineExceeded is raised once it has passed, see http_helpers.deadline.
+        Request timings, sizes and statuses and signing times are reported to instrumentation if given,
+        see instrumentation.Instrumentation.
+        Batch calls, e.g. get_order_books, are split into requests of at most batch_size tokens sent in parallel.
+        Concurrent per-token calls, e.g. get_midpoint, are merged into batch requests by coalescer if given,
+        see batching.RequestCoalescer.
         """
         self.host = host[0:-1] if host.endswith("/") else host
         self.chain_id = chain_id
         self.signer = Signer(key, chain_id) if key else None
         self.creds = creds
         self.mode = self._get_client_mode()
+        self.__l2_header_builder = None
+        self.session = session if session is not None else create_session()
 
         if self.signer:
             self.builder = OrderBuilder(
@@ -120,11 +187,85 @@ class ClobClient:
             )
 
         # local cache
-        self.__tick_sizes = {}
-        self.__neg_risk = {}
+        self.market_cache = (
+            market_cache if market_cache is not None else MarketMetadataCache()
+        )
+
+        self.rate_limiter = rate_limiter
+        self.retrier = retrier
+        self.timeout = timeout
+        self.instrumentation = instrumentation
+        self.coalescer = coalescer
+        self.batch_size = batch_size
 
         self.logger = logging.getLogger(self.__class__.__name__)
 
+    def _get(self, endpoint, headers=None, data=None, decoder=None):
+        return get(
+            endpoint,
+            headers=headers,
+            data=data,
+            session=self.session,
+            rate_limiter=self.rate_limiter,
+            retrier=self.retrier,
+            timeout=self.timeout,
+            instrumentation=self.instrumentation,
+            decoder=decoder,
+        )
+
+    def _post(self, endpoint, headers=None, data=None, decoder=None):
+        return post(
+            endpoint,
+            headers=headers,
+            data=data,
+            session=self.session,
+            rate_limiter=self.rate_limiter,
+            retrier=self.retrier,
+            timeout=self.timeout,
+            instrumentation=self.instrumentation,
+            decoder=decoder,
+        )
+
+    def _delete(self, endpoint, headers=None, data=None, decoder=None):
+        return delete(
+            endpoint,
+            headers=headers,
+            data=data,
+            session=self.session,
+            rate_limiter=self.rate_limiter,
+            retrier=self.retrier,
+            timeout=self.timeout,
+            instrumentation=self.instrumentation,
+            decoder=decoder,
+        )
+
+    def _post_batch(self, endpoint, body: list, decoder=None):
+        """
+        Posts a batch request, split into chunks of at most batch_size items sent in parallel
+        """
+        url = "{}{}".format(self.host, endpoint)
+        return fetch_in_chunks(
+            lambda chunk: self._post(url, data=chunk, decoder=decoder),
+            body,
+            self.batch_size,
+        )
+
+    def close(self):
+        """
+        Closes the pooled connections held by the client
+        """
+        self.session.close()
+        if self.retrier is not None:
+            self.retrier.close()
+
+    def _create_level_2_headers(self, request_args: RequestArgs) -> dict:
+        builder = self.__l2_header_builder
+        if builder is None or builder.creds is not self.creds:
+            builder = Level2HeaderBuilder(self.signer, self.creds)
+            self.__l2_header_builder = builder
+        with timed_signing(self.instrumentation, SIGN_L2_HEADERS):
+            return builder.create(request_args)
+
     def get_address(self):
         """
         Returns the public address of the signer
@@ -155,20 +296,23 @@ class ClobClient:
         if contract_config:
             return contract_config.exchange
 
+    @with_deadline
     def get_ok(self):
         """
         Health check: Confirms that the server is up
         Does not need authentication
         """
-        return get("{}/".format(self.host))
+        return self._get("{}/".format(self.host))
 
+    @with_deadline
     def get_server_time(self):
         """
         Returns the current timestamp on the server
         Does not need authentication
         """
-        return get("{}{}".format(self.host, TIME))
+        return self._get("{}{}".format(self.host, TIME))
 
+    @with_deadline
     def create_api_key(self, nonce: int = None) -> ApiCreds:
         """
         Creates a new CLOB API key for the given
@@ -176,9 +320,10 @@ class ClobClient:
         self.assert_level_1_auth()
 
         endpoint = "{}{}".format(self.host, CREATE_API_KEY)
-        headers = create_level_1_headers(self.signer, nonce)
+        with timed_signing(self.instrumentation, SIGN_L1_HEADERS):
+            headers = create_level_1_headers(self.signer, nonce)
 
-        creds_raw = post(endpoint, headers=headers)
+        creds_raw = self._post(endpoint, headers=headers)
         try:
             creds = ApiCreds(
                 api_key=creds_raw["apiKey"],
@@ -190,6 +335,7 @@ class ClobClient:
             return None
         return creds
 
+    @with_deadline
     def derive_api_key(self, nonce: int = None) -> ApiCreds:
         """
         Derives an already existing CLOB API key for the given address and nonce
@@ -197,9 +343,10 @@ class ClobClient:
         self.assert_level_1_auth()
 
         endpoint = "{}{}".format(self.host, DERIVE_API_KEY)
-        headers = create_level_1_headers(self.signer, nonce)
+        with timed_signing(self.instrumentation, SIGN_L1_HEADERS):
+            headers = create_level_1_headers(self.signer, nonce)
 
-        creds_raw = get(endpoint, headers=headers)
+        creds_raw = self._get(endpoint, headers=headers)
         try:
             creds = ApiCreds(
                 api_key=creds_raw["apiKey"],
@@ -211,6 +358,7 @@ class ClobClient:
             return None
         return creds
 
+    @with_deadline
     def create_or_derive_api_creds(self, nonce: int = None) -> ApiCreds:
         """
         Creates API creds if not already created for nonce, otherwise derives them
@@ -227,6 +375,7 @@ class ClobClient:
         self.creds = creds
         self.mode = self._get_client_mode()
 
+    @with_deadline
     def get_api_keys(self):
         """
         Gets the available API keys for this address
@@ -235,9 +384,10 @@ class ClobClient:
         self.assert_level_2_auth()
 
         request_args = RequestArgs(method="GET", request_path=GET_API_KEYS)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        return get("{}{}".format(self.host, GET_API_KEYS), headers=headers)
+        headers = self._create_level_2_headers(request_args)
+        return self._get("{}{}".format(self.host, GET_API_KEYS), headers=headers)
 
+    @with_deadline
     def get_closed_only_mode(self):
         """
         Gets the closed only mode flag for thsi address
@@ -246,9 +396,10 @@ class ClobClient:
         self.assert_level_2_auth()
 
         request_args = RequestArgs(method="GET", request_path=CLOSED_ONLY)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        return get("{}{}".format(self.host, CLOSED_ONLY), headers=headers)
+        headers = self._create_level_2_headers(request_args)
+        return self._get("{}{}".format(self.host, CLOSED_ONLY), headers=headers)
 
+    @with_deadline
     def delete_api_key(self):
         """
         Deletes an API key
@@ -257,66 +408,147 @@ class ClobClient:
         self.assert_level_2_auth()
 
         request_args = RequestArgs(method="DELETE", request_path=DELETE_API_KEY)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        return delete("{}{}".format(self.host, DELETE_API_KEY), headers=headers)
+        headers = self._create_level_2_headers(request_args)
+        return self._delete("{}{}".format(self.host, DELETE_API_KEY), headers=headers)
 
+    @with_deadline
     def get_midpoint(self, token_id):
         """
         Get the mid market price for the given market
+        With a coalescer, concurrent calls are merged into get_midpoints requests
         """
-        return get("{}{}?token_id={}".format(self.host, MID_POINT, token_id))
+        if self.coalescer is not None:
+            mid = self.coalescer.call(
+                (self.host, MID_POINTS), token_id, self.__fetch_midpoints
+            )
+            return {"mid": mid}
+        return self._get("{}{}?token_id={}".format(self.host, MID_POINT, token_id))
 
+    def __fetch_midpoints(self, token_ids: list) -> dict:
+        return self.get_midpoints([BookParams(token_id=t) for t in token_ids])
+
+    @with_deadline
     def get_midpoints(self, params: list[BookParams]):
         """
         Get the mid market prices for a set of token ids
         """
         body = [{"token_id": param.token_id} for param in params]
-        return post("{}{}".format(self.host, MID_POINTS), data=body)
+        return self._post_batch(MID_POINTS, body)
 
+    @with_deadline
     def get_price(self, token_id, side):
         """
         Get the market price for the given market
+        With a coalescer, concurrent calls are merged into get_prices requests
         """
-        return get("{}{}?token_id={}&side={}".format(self.host, PRICE, token_id, side))
+        if self.coalescer is not None:
+            price = self.coalescer.call(
+                (self.host, GET_PRICES), (token_id, side), self.__fetch_prices
+            )
+            return {"price": price}
+        return self._get(
+            "{}{}?token_id={}&side={}".format(self.host, PRICE, token_id, side)
+        )
 
+    def __fetch_prices(self, params: list) -> dict:
+        prices = self.get_prices(
+            [BookParams(token_id=token_id, side=side) for token_id, side in params]
+        )
+        return {
+            (token_id, side): prices[token_id][side]
+            for token_id, side in params
+            if side in prices.get(token_id, {})
+        }
+
+    @with_deadline
     def get_prices(self, params: list[BookParams]):
         """
         Get the market prices for a set
         """
         body = [{"token_id": param.token_id, "side": param.side} for param in params]
-        return post("{}{}".format(self.host, GET_PRICES), data=body)
+        return self._post_batch(GET_PRICES, body)
 
+    @with_deadline
     def get_spread(self, token_id):
         """
         Get the spread for the given market
+        With a coalescer, concurrent calls are merged into get_spreads requests
         """
-        return get("{}{}?token_id={}".format(self.host, GET_SPREAD, token_id))
+        if self.coalescer is not None:
+            spread = self.coalescer.call(
+                (self.host, GET_SPREADS), token_id, self.__fetch_spreads
+            )
+            return {"spread": spread}
+        return self._get("{}{}?token_id={}".format(self.host, GET_SPREAD, token_id))
 
+    def __fetch_spreads(self, token_ids: list) -> dict:
+        return self.get_spreads([BookParams(token_id=t) for t in token_ids])
+
+    @with_deadline
     def get_spreads(self, params: list[BookParams]):
         """
         Get the spreads for a set of token ids
         """
         body = [{"token_id": param.token_id} for param in params]
-        return post("{}{}".format(self.host, GET_SPREADS), data=body)
+        return self._post_batch(GET_SPREADS, body)
 
+    @with_deadline
     def get_tick_size(self, token_id: str) -> TickSize:
-        if token_id in self.__tick_sizes:
-            return self.__tick_sizes[token_id]
+        tick_size = self.market_cache.get_tick_size(token_id)
+        if tick_size is not None:
+            return tick_size
 
-        result = get("{}{}?token_id={}".format(self.host, GET_TICK_SIZE, token_id))
-        self.__tick_sizes[token_id] = str(result["minimum_tick_size"])
+        result = self._get(
+            "{}{}?token_id={}".format(self.host, GET_TICK_SIZE, token_id)
+        )
+        tick_size = str(result["minimum_tick_size"])
+        self.market_cache.update(token_id, tick_size=tick_size)
 
-        return self.__tick_sizes[token_id]
+        return tick_size
 
+    @with_deadline
     def get_neg_risk(self, token_id: str) -> bool:
-        if token_id in self.__neg_risk:
-            return self.__neg_risk[token_id]
+        neg_risk = self.market_cache.get_neg_risk(token_id)
+        if neg_risk is not None:
+            return neg_risk
 
-        result = get("{}{}?token_id={}".format(self.host, GET_NEG_RISK, token_id))
-        self.__neg_risk[token_id] = result["neg_risk"]
+        result = self._get("{}{}?token_id={}".format(self.host, GET_NEG_RISK, token_id))
+        self.market_cache.update(token_id, neg_risk=result["neg_risk"])
 
         return result["neg_risk"]
 
+    @with_deadline
+    def warm_market_cache(
+        self, token_ids: list[str] = None, concurrency: int = 1
+    ) -> list[str]:
+        """
+        Fills the market cache with the tick size and neg risk of the tokens, walking the markets pages
+        Stops as soon as every token is cached, every market is cached if token_ids is not given
+        Returns the token ids that were not found
+        """
+        remaining = set(token_ids) if token_ids is not None else None
+        markets = self.iter_all_markets(concurrency)
+        try:
+            for market in markets:
+                cached = self.market_cache.update_from_market(market, remaining)
+                if remaining is not None:
+                    remaining.difference_update(cached)
+                    if not remaining:
+                        break
+        finally:
+            markets.close()
+        return sorted(remaining) if remaining else []
+
+    def invalidate_market_cache(self, token_id: str = None):
+        """
+        Drops the cached metadata of a token, or of every token
+        """
+        self.market_cache.invalidate(token_id)
+
+    def _invalidate_on_tick_size_error(self, order: SignedOrder, error):
+        if is_tick_size_error(error):
+            self.invalidate_market_cache(str(order.order["tokenId"]))
+
     def __resolve_tick_size(
         self, token_id: str, tick_size: TickSize = None
     ) -> TickSize:
@@ -333,16 +565,9 @@ class ClobClient:
             tick_size = min_tick_size
         return tick_size
 
-    def create_order(
-        self, order_args: OrderArgs, options: Optional[PartialCreateOrderOptions] = None
-    ):
-        """
-        Creates and signs an order
-        Level 1 Auth required
-        """
-        self.assert_level_1_auth()
-
-        # add resolve_order_options, or similar
+    def __resolve_order_options(
+        self, order_args: OrderArgs, options: Optional[PartialCreateOrderOptions]
+    ) -> CreateOrderOptions:
         tick_size = self.__resolve_tick_size(
             order_args.token_id,
             options.tick_size if options else None,
@@ -364,14 +589,47 @@ class ClobClient:
             else self.get_neg_risk(order_args.token_id)
         )
 
-        return self.builder.create_order(
-            order_args,
-            CreateOrderOptions(
-                tick_size=tick_size,
-                neg_risk=neg_risk,
-            ),
+        return CreateOrderOptions(
+            tick_size=tick_size,
+            neg_risk=neg_risk,
         )
 
+    @with_deadline
+    def create_order(
+        self, order_args: OrderArgs, options: Optional[PartialCreateOrderOptions] = None
+    ):
+        """
+        Creates and signs an order
+        Level 1 Auth required
+        """
+        self.assert_level_1_auth()
+
+        resolved_options = self.__resolve_order_options(order_args, options)
+        with timed_signing(self.instrumentation, SIGN_ORDER):
+            return self.builder.create_order(order_args, resolved_options)
+
+    @with_deadline
+    def create_orders(
+        self,
+        orders_args: list[OrderArgs],
+        options: Optional[PartialCreateOrderOptions] = None,
+        executor: Executor = None,
+    ) -> list[SignedOrder]:
+        """
+        Creates and signs a list of orders
+        The pool of client.builder.signing_pool() can be provided to sign them in worker processes
+        Level 1 Auth required
+        """
+        self.assert_level_1_auth()
+
+        orders = [
+            (order_args, self.__resolve_order_options(order_args, options))
+            for order_args in orders_args
+        ]
+        with timed_signing(self.instrumentation, SIGN_ORDERS):
+            return self.builder.create_orders(orders, executor)
+
+    @with_deadline
     def create_market_order(
         self,
         order_args: MarketOrderArgs,
@@ -410,27 +668,74 @@ class ClobClient:
             else self.get_neg_risk(order_args.token_id)
         )
 
-        return self.builder.create_market_order(
-            order_args,
-            CreateOrderOptions(
-                tick_size=tick_size,
-                neg_risk=neg_risk,
-            ),
-        )
+        with timed_signing(self.instrumentation, SIGN_MARKET_ORDER):
+            return self.builder.create_market_order(
+                order_args,
+                CreateOrderOptions(
+                    tick_size=tick_size,
+                    neg_risk=neg_risk,
+                ),
+            )
 
+    @with_deadline
     def post_order(self, order, orderType: OrderType = OrderType.GTC):
         """
         Posts the order
         """
         self.assert_level_2_auth()
-        body = order_to_json(order, self.creds.api_key, orderType)
-        headers = create_level_2_headers(
-            self.signer,
-            self.creds,
-            RequestArgs(method="POST", request_path=POST_ORDER, body=body),
+        body = serialize_body(order_to_json(order, self.creds.api_key, orderType))
+        headers = self._create_level_2_headers(
+            RequestArgs(method="POST", request_path=POST_ORDER, body=body)
         )
-        return post("{}{}".format(self.host, POST_ORDER), headers=headers, data=body)
+        try:
+            return self._post(
+                "{}{}".format(self.host, POST_ORDER), headers=headers, data=body
+            )
+        except PolyApiException as e:
+            self._invalidate_on_tick_size_error(order, e.error_msg)
+            raise
 
+    @with_deadline
+    def post_orders(self, args: list[PostOrdersArgs]):
+        """
+        Posts a batch of orders
+        Batches larger than POST_ORDERS_BATCH_LIMIT are split into several requests, sent one after the other
+        If a request fails, its error carries the results of the previous requests in partial_results,
+        and the orders of the failed and following requests in unposted_orders
+        Level 2 Auth required
+        """
+        self.assert_level_2_auth()
+        results = []
+        for i in range(0, len(args), POST_ORDERS_BATCH_LIMIT):
+            chunk = args[i : i + POST_ORDERS_BATCH_LIMIT]
+            body = serialize_body(
+                [
+                    order_to_json(arg.order, self.creds.api_key, arg.orderType)
+                    for arg in chunk
+                ]
+            )
+            headers = self._create_level_2_headers(
+                RequestArgs(method="POST", request_path=POST_ORDERS, body=body)
+            )
+            try:
+                resp = self._post(
+                    "{}{}".format(self.host, POST_ORDERS), headers=headers, data=body
+                )
+            except PolyException as e:
+                if isinstance(e, PolyApiException):
+                    for arg in chunk:
+                        self._invalidate_on_tick_size_error(arg.order, e.error_msg)
+                e.partial_results = results
+                e.unposted_orders = args[i:]
+                raise
+            resp = resp if isinstance(resp, list) else [resp]
+            for arg, result in zip(chunk, resp):
+                if isinstance(result, dict) and result.get("errorMsg"):
+                    self._invalidate_on_tick_size_error(arg.order, result["errorMsg"])
+            results += resp
+        return results
+
+    @with_deadline
     def create_and_post_order(
         self, order_args: OrderArgs, options: PartialCreateOrderOptions = None
     ):
@@ -440,34 +745,39 @@ class ClobClient:
         ord = self.create_order(order_args, options)
         return self.post_order(ord)
 
+    @with_deadline
     def cancel(self, order_id):
         """
         Cancels an order
         Level 2 Auth required
         """
         self.assert_level_2_auth()
-        body = {"orderID": order_id}
+        body = serialize_body({"orderID": order_id})
 
         request_args = RequestArgs(method="DELETE", request_path=CANCEL, body=body)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        return delete("{}{}".format(self.host, CANCEL), headers=headers, data=body)
+        headers = self._create_level_2_headers(request_args)
+        return self._delete(
+            "{}{}".format(self.host, CANCEL), headers=headers, data=body
+        )
 
+    @with_deadline
     def cancel_orders(self, order_ids):
         """
         Cancels orders
         Level 2 Auth required
         """
         self.assert_level_2_auth()
-        body = order_ids
+        body = serialize_body(order_ids)
 
         request_args = RequestArgs(
             method="DELETE", request_path=CANCEL_ORDERS, body=body
         )
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        return delete(
+        headers = self._create_level_2_headers(request_args)
+        return self._delete(
             "{}{}".format(self.host, CANCEL_ORDERS), headers=headers, data=body
         )
 
+    @with_deadline
     def cancel_all(self):
         """
         Cancels all available orders for the user
@@ -475,60 +785,107 @@ class ClobClient:
         """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="DELETE", request_path=CANCEL_ALL)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        return delete("{}{}".format(self.host, CANCEL_ALL), headers=headers)
+        headers = self._create_level_2_headers(request_args)
+        return self._delete("{}{}".format(self.host, CANCEL_ALL), headers=headers)
 
+    @with_deadline
     def cancel_market_orders(self, market: str = "", asset_id: str = ""):
         """
         Cancels orders
         Level 2 Auth required
         """
         self.assert_level_2_auth()
-        body = {"market": market, "asset_id": asset_id}
+        body = serialize_body({"market": market, "asset_id": asset_id})
 
         request_args = RequestArgs(
             method="DELETE", request_path=CANCEL_MARKET_ORDERS, body=body
         )
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        return delete(
+        headers = self._create_level_2_headers(request_args)
+        return self._delete(
             "{}{}".format(self.host, CANCEL_MARKET_ORDERS), headers=headers, data=body
         )
 
-    def get_orders(self, params: OpenOrderParams = None, next_cursor="MA=="):
+    @with_deadline
+    def get_orders(
+        self,
+        params: OpenOrderParams = None,
+        next_cursor=START_CURSOR,
+        typed: bool = False,
+    ):
         """
         Gets orders for the API key
+        With typed, the orders are decoded into OpenOrder instead of dicts
         Requires Level 2 authentication
         """
-        self.assert_level_2_auth()
-        request_args = RequestArgs(method="GET", request_path=ORDERS)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        return list(self.iter_orders(params, next_cursor, typed))
 
-        results = []
-        next_cursor = next_cursor if next_cursor is not None else "MA=="
-        while next_cursor != END_CURSOR:
-            url = add_query_open_orders_params(
-                "{}{}".format(self.host, ORDERS), params, next_cursor
-            )
-            response = get(url, headers=headers)
-            next_cursor = response["next_cursor"]
-            results += response["data"]
+    @with_deadline
+    def iter_orders(
+        self,
+        params: OpenOrderParams = None,
+        next_cursor=START_CURSOR,
+        typed: bool = False,
+    ):
+        """
+        Iterates over the orders for the API key, yielding records page by page
+        The next page is fetched while the current one is consumed
+        With typed, the orders are decoded into OpenOrder instead of dicts
+        Requires Level 2 authentication
+        """
+        self.assert_level_2_auth()
+        return iter_prefetched_pages(
+            lambda cursor: self.__get_orders_page(params, cursor, typed), next_cursor
+        )
 
-        return results
+    def __get_orders_page(self, params: OpenOrderParams, next_cursor: str, typed: bool):
+        request_args = RequestArgs(method="GET", request_path=ORDERS)
+        headers = self._create_level_2_headers(request_args)
+        url = add_query_open_orders_params(
+            "{}{}".format(self.host, ORDERS), params or OpenOrderParams(), next_cursor
+        )
+        return self._get(
+            url, headers=headers, decoder=OPEN_ORDERS_PAGE_DECODER if typed else None
+        )
 
-    def get_order_book(self, token_id) -> OrderBookSummary:
+    @with_deadline
+    def get_order_book(
+        self, token_id, compact: bool = False
+    ) -> Union[OrderBookSummary, CompactOrderBook]:
         """
         Fetches the orderbook for the token_id
-        """
-        raw_obs = get("{}{}?token_id={}".format(self.host, GET_ORDER_BOOK, token_id))
-        return parse_raw_orderbook_summary(raw_obs)
+        With compact, the levels are parsed into arrays, see CompactOrderBook
+        With a coalescer, concurrent calls are merged into get_order_books requests
+        """
+        if self.coalescer is not None:
+            return self.coalescer.call(
+                (self.host, GET_ORDER_BOOKS, compact),
+                token_id,
+                lambda token_ids: self.__fetch_order_books(token_ids, compact),
+            )
+        url = "{}{}?token_id={}".format(self.host, GET_ORDER_BOOK, token_id)
+        if compact:
+            return CompactOrderBook.from_raw(self._get(url))
+        return self._get(url, decoder=ORDER_BOOK_DECODER)
 
-    def get_order_books(self, params: list[BookParams]) -> list[OrderBookSummary]:
+    @with_deadline
+    def get_order_books(
+        self, params: list[BookParams], compact: bool = False
+    ) -> Union[list[OrderBookSummary], list[CompactOrderBook]]:
         """
         Fetches the orderbook for a set of token ids
+        With compact, the levels are parsed into arrays, see CompactOrderBook
         """
         body = [{"token_id": param.token_id} for param in params]
-        raw_obs = post("{}{}".format(self.host, GET_ORDER_BOOKS), data=body)
-        return [parse_raw_orderbook_summary(r) for r in raw_obs]
+        if compact:
+            raw_obs = self._post_batch(GET_ORDER_BOOKS, body)
+            return [CompactOrderBook.from_raw(r) for r in raw_obs]
+        return self._post_batch(GET_ORDER_BOOKS, body, decoder=ORDER_BOOKS_DECODER)
+
+    def __fetch_order_books(self, token_ids: list, compact: bool) -> dict:
+        books = self.get_order_books(
+            [BookParams(token_id=t) for t in token_ids], compact
+        )
+        return {book.asset_id: book for book in books}
 
     def get_order_book_hash(self, orderbook: OrderBookSummary) -> str:
         """
@@ -536,50 +893,75 @@ class ClobClient:
         """
         return generate_orderbook_summary_hash(orderbook)
 
-    def get_order(self, order_id):
+    @with_deadline
+    def get_order(self, order_id, typed: bool = False):
         """
         Fetches the order corresponding to the order_id
+        With typed, the order is decoded into an OpenOrder instead of a dict
         Requires Level 2 authentication
         """
         self.assert_level_2_auth()
         endpoint = "{}{}".format(GET_ORDER, order_id)
         request_args = RequestArgs(method="GET", request_path=endpoint)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        return get("{}{}".format(self.host, endpoint), headers=headers)
+        headers = self._create_level_2_headers(request_args)
+        return self._get(
+            "{}{}".format(self.host, endpoint),
+            headers=headers,
+            decoder=OPEN_ORDER_DECODER if typed else None,
+        )
 
-    def get_trades(self, params: TradeParams = None, next_cursor="MA=="):
+    @with_deadline
+    def get_trades(
+        self, params: TradeParams = None, next_cursor=START_CURSOR, typed: bool = False
+    ):
         """
         Fetches the trade history for a user
+        With typed, the trades are decoded into Trade instead of dicts
         Requires Level 2 authentication
         """
-        self.assert_level_2_auth()
-        request_args = RequestArgs(method="GET", request_path=TRADES)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        return list(self.iter_trades(params, next_cursor, typed))
 
-        results = []
-        next_cursor = next_cursor if next_cursor is not None else "MA=="
-        while next_cursor != END_CURSOR:
-            url = add_query_trade_params(
-                "{}{}".format(self.host, TRADES), params, next_cursor
-            )
-            response = get(url, headers=headers)
-            next_cursor = response["next_cursor"]
-            results += response["data"]
+    @with_deadline
+    def iter_trades(
+        self, params: TradeParams = None, next_cursor=START_CURSOR, typed: bool = False
+    ):
+        """
+        Iterates over the trade history for a user, yielding records page by page
+        The next page is fetched while the current one is consumed
+        With typed, the trades are decoded into Trade instead of dicts
+        Requires Level 2 authentication
+        """
+        self.assert_level_2_auth()
+        return iter_prefetched_pages(
+            lambda cursor: self.__get_trades_page(params, cursor, typed), next_cursor
+        )
 
-        return results
+    def __get_trades_page(self, params: TradeParams, next_cursor: str, typed: bool):
+        request_args = RequestArgs(method="GET", request_path=TRADES)
+        headers = self._create_level_2_headers(request_args)
+        url = add_query_trade_params(
+            "{}{}".format(self.host, TRADES), params or TradeParams(), next_cursor
+        )
+        return self._get(
+            url, headers=headers, decoder=TRADES_PAGE_DECODER if typed else None
+        )
 
+    @with_deadline
     def get_last_trade_price(self, token_id):
         """
         Fetches the last trade price token_id
         """
-        return get("{}{}?token_id={}".format(self.host, GET_LAST_TRADE_PRICE, token_id))
+        return self._get(
+            "{}{}?token_id={}".format(self.host, GET_LAST_TRADE_PRICE, token_id)
+        )
 
+    @with_deadline
     def get_last_trades_prices(self, params: list[BookParams]):
         """
         Fetches the last trades prices for a set of token ids
         """
         body = [{"token_id": param.token_id} for param in params]
-        return post("{}{}".format(self.host, GET_LAST_TRADES_PRICES), data=body)
+        return self._post_batch(GET_LAST_TRADES_PRICES, body)
 
     def assert_level_1_auth(self):
         """
@@ -602,6 +984,7 @@ class ClobClient:
             return L1
         return L0
 
+    @with_deadline
     def get_notifications(self):
         """
         Fetches the notifications for a user
@@ -609,12 +992,13 @@ class ClobClient:
         """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="GET", request_path=GET_NOTIFICATIONS)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._create_level_2_headers(request_args)
         url = "{}{}?signature_type={}".format(
             self.host, GET_NOTIFICATIONS, self.builder.sig_type
         )
-        return get(url, headers=headers)
+        return self._get(url, headers=headers)
 
+    @with_deadline
     def drop_notifications(self, params: DropNotificationParams = None):
         """
         Drops the notifications for a user
@@ -622,12 +1006,13 @@ class ClobClient:
         """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="DELETE", request_path=DROP_NOTIFICATIONS)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._create_level_2_headers(request_args)
         url = drop_notifications_query_params(
             "{}{}".format(self.host, DROP_NOTIFICATIONS), params
         )
-        return delete(url, headers=headers)
+        return self._delete(url, headers=headers)
 
+    @with_deadline
     def get_balance_allowance(self, params: BalanceAllowanceParams = None):
         """
         Fetches the balance & allowance for a user
@@ -635,14 +1020,15 @@ class ClobClient:
         """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="GET", request_path=GET_BALANCE_ALLOWANCE)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._create_level_2_headers(request_args)
         if params.signature_type == -1:
             params.signature_type = self.builder.sig_type
         url = add_balance_allowance_params_to_url(
             "{}{}".format(self.host, GET_BALANCE_ALLOWANCE), params
         )
-        return get(url, headers=headers)
+        return self._get(url, headers=headers)
 
+    @with_deadline
     def update_balance_allowance(self, params: BalanceAllowanceParams = None):
         """
         Updates the balance & allowance for a user
@@ -650,14 +1036,15 @@ class ClobClient:
         """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="GET", request_path=UPDATE_BALANCE_ALLOWANCE)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._create_level_2_headers(request_args)
         if params.signature_type == -1:
             params.signature_type = self.builder.sig_type
         url = add_balance_allowance_params_to_url(
             "{}{}".format(self.host, UPDATE_BALANCE_ALLOWANCE), params
         )
-        return get(url, headers=headers)
+        return self._get(url, headers=headers)
 
+    @with_deadline
     def is_order_scoring(self, params: OrderScoringParams):
         """
         Check if the order is currently scoring
@@ -665,71 +1052,149 @@ class ClobClient:
         """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="GET", request_path=IS_ORDER_SCORING)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._create_level_2_headers(request_args)
         url = add_order_scoring_params_to_url(
             "{}{}".format(self.host, IS_ORDER_SCORING), params
         )
-        return get(url, headers=headers)
+        return self._get(url, headers=headers)
 
+    @with_deadline
     def are_orders_scoring(self, params: OrdersScoringParams):
         """
         Check if the orders are currently scoring
         Requires Level 2 authentication
         """
         self.assert_level_2_auth()
-        body = params.orderIds
+        body = serialize_body(params.orderIds)
         request_args = RequestArgs(
             method="POST", request_path=ARE_ORDERS_SCORING, body=body
         )
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        return post(
+        headers = self._create_level_2_headers(request_args)
+        return self._post(
             "{}{}".format(self.host, ARE_ORDERS_SCORING), headers=headers, data=body
         )
 
+    @with_deadline
     def get_sampling_markets(self, next_cursor="MA=="):
         """
         Get the current sampling markets
         """
-        return get(
+        return self._get(
             "{}{}?next_cursor={}".format(self.host, GET_SAMPLING_MARKETS, next_cursor)
         )
 
+    @with_deadline
     def get_sampling_simplified_markets(self, next_cursor="MA=="):
         """
         Get the current sampling simplified markets
         """
-        return get(
+        return self._get(
             "{}{}?next_cursor={}".format(
                 self.host, GET_SAMPLING_SIMPLIFIED_MARKETS, next_cursor
             )
         )
 
+    @with_deadline
     def get_markets(self, next_cursor="MA=="):
         """
         Get the current markets
         """
-        return get("{}{}?next_cursor={}".format(self.host, GET_MARKETS, next_cursor))
+        return self._get(
+            "{}{}?next_cursor={}".format(self.host, GET_MARKETS, next_cursor)
+        )
 
+    @with_deadline
     def get_simplified_markets(self, next_cursor="MA=="):
         """
         Get the current simplified markets
         """
-        return get(
+        return self._get(
             "{}{}?next_cursor={}".format(self.host, GET_SIMPLIFIED_MARKETS, next_cursor)
         )
 
+    @with_deadline
+    def iter_all_markets(self, concurrency: int = 1, next_cursor=START_CURSOR):
+        """
+        Iterates over all the markets, fetching up to concurrency pages in parallel
+        """
+        return iter_pages(self.get_markets, next_cursor, concurrency)
+
+    @with_deadline
+    def get_all_markets(self, concurrency: int = 1, next_cursor=START_CURSOR):
+        """
+        Get all the markets, walking every page
+        """
+        return list(self.iter_all_markets(concurrency, next_cursor))
+
+    @with_deadline
+    def iter_all_simplified_markets(
+        self, concurrency: int = 1, next_cursor=START_CURSOR
+    ):
+        """
+        Iterates over all the simplified markets, fetching up to concurrency pages in parallel
+        """
+        return iter_pages(self.get_simplified_markets, next_cursor, concurrency)
+
+    @with_deadline
+    def get_all_simplified_markets(
+        self, concurrency: int = 1, next_cursor=START_CURSOR
+    ):
+        """
+        Get all the simplified markets, walking every page
+        """
+        return list(self.iter_all_simplified_markets(concurrency, next_cursor))
+
+    @with_deadline
+    def iter_all_sampling_markets(self, concurrency: int = 1, next_cursor=START_CURSOR):
+        """
+        Iterates over all the sampling markets, fetching up to concurrency pages in parallel
+        """
+        return iter_pages(self.get_sampling_markets, next_cursor, concurrency)
+
+    @with_deadline
+    def get_all_sampling_markets(self, concurrency: int = 1, next_cursor=START_CURSOR):
+        """
+        Get all the sampling markets, walking every page
+        """
+        return list(self.iter_all_sampling_markets(concurrency, next_cursor))
+
+    @with_deadline
+    def iter_all_sampling_simplified_markets(
+        self, concurrency: int = 1, next_cursor=START_CURSOR
+    ):
+        """
+        Iterates over all the sampling simplified markets, fetching up to concurrency pages in parallel
+        """
+        return iter_pages(
+            self.get_sampling_simplified_markets, next_cursor, concurrency
+        )
+
+    @with_deadline
+    def get_all_sampling_simplified_markets(
+        self, concurrency: int = 1, next_cursor=START_CURSOR
+    ):
+        """
+        Get all the sampling simplified markets, walking every page
+        """
+        return list(self.iter_all_sampling_simplified_markets(concurrency, next_cursor))
+
+    @with_deadline
     def get_market(self, condition_id):
         """
         Get a market by condition_id
         """
-        return get("{}{}{}".format(self.host, GET_MARKET, condition_id))
+        return self._get("{}{}{}".format(self.host, GET_MARKET, condition_id))
 
+    @with_deadline
     def get_market_trades_events(self, condition_id):
         """
         Get the market's trades events by condition id
         """
-        return get("{}{}{}".format(self.host, GET_MARKET_TRADES_EVENTS, condition_id))
+        return self._get(
+            "{}{}{}".format(self.host, GET_MARKET_TRADES_EVENTS, condition_id)
+        )
 
+    @with_deadline
     def calculate_market_price(self, token_id: str, side: str, amount: float) -> float:
         """
         Calculates the matching price considering an amount and the current orderbook
@@ -745,3 +1210,36 @@ class ClobClient:
             if book.bids is None:
                 raise Exception("no match")
             return self.builder.calculate_sell_market_price(book.bids, amount)
+
+    @with_deadline
+    def get_book_depth(self, token_id: str, side: str) -> BookDepth:
+        """
+        Fetches the orderbook once and returns the depth consumed by a market order on the given side
+        """
+        book = self.get_order_book(token_id, compact=True)
+        if book is None:
+            raise Exception("no orderbook")
+        return book.depth(side)
+
+    @with_deadline
+    def get_local_order_book(
+        self, token_id: str, verify_hash: bool = True
+    ) -> LocalOrderBook:
+        """
+        Returns a LocalOrderBook seeded from the current orderbook, to be fed with the
+        messages of the market websocket channel. It resyncs through get_order_book
+        """
+        book = LocalOrderBook(token_id, self.get_order_book, verify_hash)
+        book.seed(self.get_order_book(token_id), verified=False)
+        return book
+
+    @with_deadline
+    def calculate_market_prices(
+        self, token_id: str, side: str, amounts: list[float]
+    ) -> list[Optional[float]]:
+        """
+        Calculates the matching price of many amounts against a single orderbook snapshot
+        None is returned for the amounts the orderbook can't match
+        """
+        depth = self.get_book_depth(token_id, side)
+        return depth.market_prices(amounts)
@@ -3,6 +3,8 @@ from dataclasses import dataclass, asdict
 from json import dumps
 from typing import Literal, Optional
 
+from py_order_utils.model import SignedOrder
+
 from .constants import ZERO_ADDRESS
 
 
@@ -162,6 +164,127 @@ class OrderBookSummary:
         return dumps(self.__dict__, separators=(",", ":"))
 
 
+@dataclass
+class OrderEvent:
+    """
+    Order update of the user websocket channel
+    """
+
+    type: str
+    """
+    PLACEMENT, UPDATE or CANCELLATION
+    """
+
+    id: str
+    market: str = None
+    asset_id: str = None
+    side: str = None
+    price: str = None
+    original_size: str = None
+    size_matched: str = None
+    outcome: str = None
+    owner: str = None
+    timestamp: str = None
+    associate_trades: list[str] = None
+
+
+@dataclass
+class MakerOrderFill:
+    order_id: str
+    owner: str = None
+    matched_amount: str = None
+    price: str = None
+    asset_id: str = None
+    outcome: str = None
+
+
+@dataclass
+class TradeEvent:
+    """
+    Trade update of the user websocket channel
+    """
+
+    id: str
+    status: str = None
+    """
+    MATCHED, MINED, CONFIRMED, RETRYING or FAILED
+    """
+
+    market: str = None
+    asset_id: str = None
+    side: str = None
+    size: str = None
+    price: str = None
+    outcome: str = None
+    owner: str = None
+    taker_order_id: str = None
+    maker_orders: list[MakerOrderFill] = None
+    matchtime: str = None
+    timestamp: str = None
+
+
+@dataclass
+class OpenOrder:
+    """
+    Order returned by get_order and get_orders
+    """
+
+    id: str
+    status: Optional[str] = None
+    owner: Optional[str] = None
+    maker_address: Optional[str] = None
+    market: Optional[str] = None
+    asset_id: Optional[str] = None
+    side: Optional[str] = None
+    original_size: Optional[str] = None
+    size_matched: Optional[str] = None
+    price: Optional[str] = None
+    outcome: Optional[str] = None
+    expiration: Optional[str] = None
+    order_type: Optional[str] = None
+    associate_trades: Optional[list[str]] = None
+    created_at: Optional[int] = None
+
+
+@dataclass
+class MakerOrder:
+    order_id: str
+    owner: Optional[str] = None
+    maker_address: Optional[str] = None
+    matched_amount: Optional[str] = None
+    price: Optional[str] = None
+    fee_rate_bps: Optional[str] = None
+    asset_id: Optional[str] = None
+    outcome: Optional[str] = None
+    side: Optional[str] = None
+
+
+@dataclass
+class Trade:
+    """
+    Trade returned by get_trades
+    """
+
+    id: str
+    taker_order_id: Optional[str] = None
+    market: Optional[str] = None
+    asset_id: Optional[str] = None
+    side: Optional[str] = None
+    size: Optional[str] = None
+    fee_rate_bps: Optional[str] = None
+    price: Optional[str] = None
+    status: Optional[str] = None
+    match_time: Optional[str] = None
+    last_update: Optional[str] = None
+    outcome: Optional[str] = None
+    bucket_index: Optional[int] = None
+    owner: Optional[str] = None
+    maker_address: Optional[str] = None
+    maker_orders: Optional[list[MakerOrder]] = None
+    transaction_hash: Optional[str] = None
+    trader_side: Optional[str] = None
+
+
 class AssetType(enumerate):
     COLLATERAL = "COLLATERAL"
     CONDITIONAL = "CONDITIONAL"
@@ -180,6 +303,19 @@ class OrderType(enumerate):
     GTD = "GTD"
 
 
+@dataclass
+class PostOrdersArgs:
+    order: SignedOrder
+    """
+    Signed order to post
+    """
+
+    orderType: OrderType = OrderType.GTC
+    """
+    Type of the order, defaults to GTC
+    """
+
+
 @dataclass
 class OrderScoringParams:
     orderId: str
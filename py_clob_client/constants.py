@@ -19,4 +19,8 @@ ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
 AMOY = 80002
 POLYGON = 137
 
+# maximum number of orders posted in a single batch
+POST_ORDERS_BATCH_LIMIT = 15
+
+START_CURSOR = "MA=="
 END_CURSOR = "LTE="
@@ -0,0 +1,77 @@
+import json
+from typing import Any, Callable, TypedDict
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+from .clob_types import OpenOrder, OrderBookSummary, Trade
+from .utilities import (
+    parse_raw_open_order,
+    parse_raw_orderbook_summary,
+    parse_raw_trade,
+)
+
+
+def decode_json(content: bytes):
+    """
+    Parses a json response into dicts and lists, with orjson when installed
+    Raises ValueError if the content is not json
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+class TypedDecoder:
+    """
+    Decodes json responses into a type, e.g. list[OrderBookSummary]
+    With msgspec installed, the dataclasses are built straight from the bytes without intermediate dicts.
+    Otherwise, or if a response does not match the type, the json is parsed and handed to parse
+    """
+
+    def __init__(self, type, parse: Callable[[Any], Any], use_msgspec: bool = True):
+        self.type = type
+        self.parse = parse
+        self._decoder = None
+        if use_msgspec and msgspec is not None:
+            self._decoder = msgspec.json.Decoder(type)
+
+    def __call__(self, content: bytes):
+        if self._decoder is not None:
+            try:
+                return self._decoder.decode(content)
+            except msgspec.DecodeError:
+                pass
+        return self.parse(decode_json(content))
+
+
+def page_decoder(name: str, item_type, parse_item: Callable[[Any], Any]):
+    """
+    Decodes a page of records, {"data": [...], "next_cursor": "..."}, into item_type
+    """
+    page = TypedDict(name, {"data": list[item_type], "next_cursor": str})
+    return TypedDecoder(
+        page,
+        lambda raw: {
+            "data": [parse_item(r) for r in raw["data"]],
+            "next_cursor": raw["next_cursor"],
+        },
+    )
+
+
+ORDER_BOOK_DECODER = TypedDecoder(OrderBookSummary, parse_raw_orderbook_summary)
+ORDER_BOOKS_DECODER = TypedDecoder(
+    list[OrderBookSummary], lambda raw: [parse_raw_orderbook_summary(r) for r in raw]
+)
+OPEN_ORDER_DECODER = TypedDecoder(OpenOrder, parse_raw_open_order)
+OPEN_ORDERS_PAGE_DECODER = page_decoder(
+    "OpenOrdersPage", OpenOrder, parse_raw_open_order
+)
+TRADES_PAGE_DECODER = page_decoder("TradesPage", Trade, parse_raw_trade)
@@ -10,6 +10,7 @@ GET_ORDER_BOOKS = "/books"
 GET_ORDER = "/data/order/"
 ORDERS = "/data/orders"
 POST_ORDER = "/order"
+POST_ORDERS = "/orders"
 CANCEL = "/order"
 CANCEL_ORDERS = "/orders"
 CANCEL_ALL = "/cancel-all"
@@ -1,7 +1,14 @@
+import time
+from email.utils import parsedate_to_datetime
+
 from requests import Response
 
 
 class PolyException(Exception):
+    # set by post_orders when one of its requests fails, see ClobClient.post_orders
+    partial_results = None
+    unposted_orders = None
+
     def __init__(self, msg):
         self.msg = msg
 
@@ -12,9 +19,11 @@ class PolyApiException(PolyException):
         if resp is not None:
             self.status_code = resp.status_code
             self.error_msg = self._get_message(resp)
+            self.retry_after = self._get_retry_after(resp)
         if error_msg is not None:
             self.error_msg = error_msg
             self.status_code = None
+            self.retry_after = None
 
     def _get_message(self, resp: Response):
         try:
@@ -22,6 +31,22 @@ class PolyApiException(PolyException):
         except Exception:
             return resp.text
 
+    def _get_retry_after(self, resp: Response):
+        """
+        Seconds to wait before retrying, from the Retry-After header if any
+        """
+        value = (getattr(resp, "headers", None) or {}).get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return None
+
     def __repr__(self):
         return "PolyApiException[status_code={}, error_message={}]".format(
             self.status_code, self.error_msg
@@ -29,3 +54,11 @@ class PolyApiException(PolyException):
 
     def __str__(self):
         return self.__repr__()
+
+
+class DeadlineExceeded(PolyException):
+    def __init__(self, msg="Deadline exceeded"):
+        super().__init__(msg)
+
+    def __str__(self):
+        return self.msg
@@ -0,0 +1,309 @@
+import csv
+import json
+import logging
+from functools import partial
+from typing import Iterable, Iterator
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+from .clob_types import OrderBookSummary
+from .exceptions import PolyException
+
+logger = logging.getLogger(__name__)
+
+PYARROW_UNAVAILABLE = "pyarrow is needed to export to parquet: pip install pyarrow"
+
+CSV = "csv"
+PARQUET = "parquet"
+
+DEFAULT_BATCH_SIZE = 10000
+
+# default number of outcome tokens flattened into token_<i>_* columns
+MARKET_TOKENS = 2
+
+TOKEN_FIELDS = {
+    "id": "string",
+    "outcome": "string",
+    "price": "float",
+    "winner": "bool",
+}
+
+# column name -> type, one of string, float, int or bool
+_MARKET_FIELDS = {
+    "condition_id": "string",
+    "question_id": "string",
+    "question": "string",
+    "description": "string",
+    "market_slug": "string",
+    "category": "string",
+    "end_date_iso": "string",
+    "game_start_time": "string",
+    "active": "bool",
+    "closed": "bool",
+    "archived": "bool",
+    "accepting_orders": "bool",
+    "enable_order_book": "bool",
+    "neg_risk": "bool",
+    "neg_risk_market_id": "string",
+    "minimum_order_size": "float",
+    "minimum_tick_size": "float",
+    "maker_base_fee": "float",
+    "taker_base_fee": "float",
+    "seconds_delay": "int",
+    "rewards_min_size": "float",
+    "rewards_max_spread": "float",
+    "tags": "string",
+}
+
+
+def market_columns(tokens: int = MARKET_TOKENS) -> dict[str, str]:
+    """
+    Columns of the exported markets, with token_<i>_* columns for the first tokens outcome tokens
+    """
+    return {
+        **_MARKET_FIELDS,
+        **{
+            f"token_{i}_{field}": type
+            for i in range(tokens)
+            for field, type in TOKEN_FIELDS.items()
+        },
+    }
+
+
+MARKET_COLUMNS = market_columns()
+
+TRADE_COLUMNS = {
+    "id": "string",
+    "taker_order_id": "string",
+    "market": "string",
+    "asset_id": "string",
+    "side": "string",
+    "size": "float",
+    "price": "float",
+    "fee_rate_bps": "float",
+    "status": "string",
+    "match_time": "int",
+    "last_update": "int",
+    "outcome": "string",
+    "owner": "string",
+    "maker_address": "string",
+    "trader_side": "string",
+    "transaction_hash": "string",
+    "bucket_index": "int",
+    "maker_orders": "int",
+}
+
+BOOK_COLUMNS = {
+    "market": "string",
+    "asset_id": "string",
+    "timestamp": "int",
+    "hash": "string",
+    "side": "string",
+    "level": "int",
+    "price": "float",
+    "size": "float",
+}
+
+
+def flatten_market(market: dict, tokens: int = MARKET_TOKENS) -> dict:
+    """
+    Flattens a market, as returned by get_markets, into market_columns(tokens)
+    Tokens beyond the first tokens are dropped with a warning
+    """
+    row = {column: market.get(column) for column in _MARKET_FIELDS}
+    rewards = market.get("rewards") or {}
+    row["rewards_min_size"] = rewards.get("min_size")
+    row["rewards_max_spread"] = rewards.get("max_spread")
+    tags = market.get("tags")
+    row["tags"] = ",".join(str(tag) for tag in tags) if tags else None
+
+    market_tokens = market.get("tokens") or []
+    if len(market_tokens) > tokens:
+        logger.warning(
+            "market %s has %d tokens, only the first %d are exported",
+            market.get("condition_id"),
+            len(market_tokens),
+            tokens,
+        )
+    for i in range(tokens):
+        token = market_tokens[i] if i < len(market_tokens) else {}
+        row[f"token_{i}_id"] = token.get("token_id")
+        row[f"token_{i}_outcome"] = token.get("outcome")
+        row[f"token_{i}_price"] = token.get("price")
+        row[f"token_{i}_winner"] = token.get("winner")
+    return row
+
+
+def flatten_trade(trade: dict) -> dict:
+    """
+    Flattens a trade, as returned by get_trades, into TRADE_COLUMNS
+    Maker orders are counted
+    """
+    row = {column: trade.get(column) for column in TRADE_COLUMNS}
+    row["maker_orders"] = len(trade.get("maker_orders") or [])
+    return row
+
+
+def flatten_book(book: OrderBookSummary) -> Iterator[dict]:
+    """
+    Flattens an orderbook into one BOOK_COLUMNS row per level
+    """
+    for side, levels in (("BUY", book.bids or []), ("SELL", book.asks or [])):
+        for level, summary in enumerate(levels):
+            yield {
+                "market": book.market,
+                "asset_id": book.asset_id,
+                "timestamp": book.timestamp,
+                "hash": book.hash,
+                "side": side,
+                "level": level,
+                "price": summary.price,
+                "size": summary.size,
+            }
+
+
+def _convert(value, type: str):
+    if value is None or value == "":
+        return None
+    if type == "string":
+        return value if isinstance(value, str) else json.dumps(value)
+    if type == "float":
+        return float(value)
+    if type == "int":
+        return int(value)
+    if type == "bool":
+        if isinstance(value, str):
+            return value.lower() == "true"
+        return bool(value)
+    raise ValueError(f"unknown column type {type}")
+
+
+class CsvExportWriter:
+    def __init__(self, path: str, columns: dict[str, str]):
+        self.columns = columns
+        self.file = open(path, "w", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(columns)
+
+    def write(self, rows: list[dict]):
+        self.writer.writerows(
+            [[_convert(row.get(c), t) for c, t in self.columns.items()] for row in rows]
+        )
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetExportWriter:
+    def __init__(self, path: str, columns: dict[str, str]):
+        if pyarrow is None:
+            raise PolyException(PYARROW_UNAVAILABLE)
+
+        types = {
+            "string": pyarrow.string(),
+            "float": pyarrow.float64(),
+            "int": pyarrow.int64(),
+            "bool": pyarrow.bool_(),
+        }
+        self.columns = columns
+        self.schema = pyarrow.schema([(c, types[t]) for c, t in columns.items()])
+        self.writer = pyarrow.parquet.ParquetWriter(path, self.schema)
+
+    def write(self, rows: list[dict]):
+        batch = pyarrow.RecordBatch.from_pydict(
+            {
+                c: [_convert(row.get(c), t) for row in rows]
+                for c, t in self.columns.items()
+            },
+            schema=self.schema,
+        )
+        self.writer.write_batch(batch)
+
+    def close(self):
+        self.writer.close()
+
+
+def export_rows(
+    rows: Iterable[dict],
+    path: str,
+    columns: dict[str, str],
+    format: str = CSV,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    Streams flat rows to a csv or parquet file with a fixed schema, batch_size rows at a time
+    Returns the number of rows written
+    """
+    if format == CSV:
+        writer = CsvExportWriter(path, columns)
+    elif format == PARQUET:
+        writer = ParquetExportWriter(path, columns)
+    else:
+        raise ValueError(f"format must be '{CSV}' or '{PARQUET}'")
+
+    count = 0
+    batch = []
+    try:
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                writer.write(batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            writer.write(batch)
+            count += len(batch)
+    finally:
+        writer.close()
+    return count
+
+
+def export_markets(
+    markets: Iterable[dict],
+    path: str,
+    format: str = CSV,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    tokens: int = MARKET_TOKENS,
+) -> int:
+    """
+    Exports markets, e.g. ClobClient.iter_all_markets(), see market_columns
+    tokens: number of outcome tokens exported per market, markets with more are truncated with a warning
+    """
+    return export_rows(
+        map(partial(flatten_market, tokens=tokens), markets),
+        path,
+        market_columns(tokens),
+        format,
+        batch_size,
+    )
+
+
+def export_trades(
+    trades: Iterable[dict],
+    path: str,
+    format: str = CSV,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    Exports trades, e.g. ClobClient.iter_trades(), see TRADE_COLUMNS
+    """
+    return export_rows(
+        map(flatten_trade, trades), path, TRADE_COLUMNS, format, batch_size
+    )
+
+
+def export_order_books(
+    books: Iterable[OrderBookSummary],
+    path: str,
+    format: str = CSV,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    Exports the levels of orderbooks, e.g. ClobClient.get_order_books(params), see BOOK_COLUMNS
+    """
+    rows = (row for book in books for row in flatten_book(book))
+    return export_rows(rows, path, BOOK_COLUMNS, format, batch_size)
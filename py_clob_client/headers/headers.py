@@ -1,8 +1,9 @@
 from ..clob_types import ApiCreds, RequestArgs
-from ..signing.hmac import build_hmac_signature
+from ..signing.hmac import build_hmac_signature, HmacSigner
 from ..signer import Signer
 from ..signing.eip712 import sign_clob_auth_message
 from datetime import datetime
+import time
 
 POLY_ADDRESS = "POLY_ADDRESS"
 POLY_SIGNATURE = "POLY_SIGNATURE"
@@ -54,3 +55,35 @@ def create_level_2_headers(signer: Signer, creds: ApiCreds, request_args: Reques
         POLY_API_KEY: creds.api_key,
         POLY_PASSPHRASE: creds.api_passphrase,
     }
+
+
+class Level2HeaderBuilder:
+    """
+    Creates Level 2 Poly headers, reusing the HMAC key and the static header values across requests
+    """
+
+    def __init__(self, signer: Signer, creds: ApiCreds):
+        self.signer = signer
+        self.creds = creds
+        self.hmac_signer = HmacSigner(creds.api_secret)
+        self.static_headers = {
+            POLY_ADDRESS: signer.address(),
+            POLY_API_KEY: creds.api_key,
+            POLY_PASSPHRASE: creds.api_passphrase,
+        }
+
+    def create(self, request_args: RequestArgs) -> dict:
+        """
+        Creates Level 2 Poly headers for a request
+        """
+        timestamp = int(time.time())
+
+        headers = dict(self.static_headers)
+        headers[POLY_SIGNATURE] = self.hmac_signer.sign(
+            timestamp,
+            request_args.method,
+            request_args.request_path,
+            request_args.body,
+        )
+        headers[POLY_TIMESTAMP] = str(timestamp)
+        return headers
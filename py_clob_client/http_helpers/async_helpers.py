@@ -0,0 +1,287 @@
+import time
+from typing import Any, Callable, Optional
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+from .deadline import (
+    Deadline,
+    as_deadline,
+    bounded_timeout,
+    current_deadline,
+    earliest,
+)
+from .helpers import (
+    GET,
+    POST,
+    DELETE,
+    handle_response,
+    overloadHeaders,
+    request_error,
+    serialize_body,
+)
+from ..exceptions import PolyException
+from ..instrumentation import (
+    CONNECT,
+    QUEUE,
+    SERVER,
+    TLS,
+    TRANSFER,
+    RequestMetrics,
+    request_metrics,
+)
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+
+HTTPX_UNAVAILABLE = "httpx is needed to use the async client: pip install httpx"
+
+
+def create_async_session(
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    http2: bool = False,
+) -> "httpx.AsyncClient":
+    """
+    Creates a pooled async http session
+    max_connections: maximum number of concurrent connections
+    max_keepalive_connections: maximum number of idle connections kept alive
+    """
+    if httpx is None:
+        raise PolyException(HTTPX_UNAVAILABLE)
+
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+    )
+    return httpx.AsyncClient(limits=limits, http2=http2)
+
+
+def _httpx_timeout(timeout):
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+class _PhaseTrace:
+    """
+    httpx trace extension, timing the steps of a request
+    """
+
+    def __init__(self):
+        self.events: dict[str, float] = {}
+
+    async def __call__(self, event_name: str, info: dict):
+        # e.g. connection.connect_tcp.started or http11.receive_response_body.complete
+        _, _, step = event_name.partition(".")
+        self.events.setdefault(step, time.perf_counter())
+
+    def _between(self, start: str, end: str) -> Optional[float]:
+        if start in self.events and end in self.events:
+            return self.events[end] - self.events[start]
+        return None
+
+    def phases(self) -> dict[str, float]:
+        phases = {
+            CONNECT: self._between("connect_tcp.started", "connect_tcp.complete"),
+            TLS: self._between("start_tls.started", "start_tls.complete"),
+            SERVER: self._between(
+                "send_request_headers.started", "receive_response_headers.complete"
+            ),
+            TRANSFER: self._between(
+                "receive_response_body.started", "receive_response_body.complete"
+            ),
+        }
+        return {phase: t for phase, t in phases.items() if t is not None}
+
+
+async def _send(
+    endpoint: str,
+    method: str,
+    headers: dict,
+    body,
+    session,
+    rate_limiter,
+    timeout,
+    deadline: Optional[Deadline],
+    metrics: Optional[RequestMetrics],
+    decoder: Optional[Callable[[bytes], Any]],
+):
+    try:
+        if deadline is not None:
+            deadline.check()
+        queued = time.perf_counter()
+        if rate_limiter is not None:
+            await rate_limiter.acquire_async(method, endpoint, deadline)
+        kwargs = {}
+        timeout = bounded_timeout(timeout, deadline)
+        if timeout is not None:
+            # the timeout of the session applies otherwise
+            kwargs["timeout"] = _httpx_timeout(timeout)
+        trace = None
+        if metrics is not None:
+            if rate_limiter is not None:
+                metrics.phases[QUEUE] = time.perf_counter() - queued
+            trace = _PhaseTrace()
+            kwargs["extensions"] = {"trace": trace}
+        resp = await session.request(
+            method=method, url=endpoint, headers=headers, content=body, **kwargs
+        )
+        received = time.perf_counter()
+        if metrics is not None:
+            metrics.phases.update(trace.phases())
+    except httpx.HTTPError as e:
+        raise request_error(deadline) from e
+    return handle_response(resp, endpoint, rate_limiter, metrics, received, decoder)
+
+
+async def request(
+    endpoint: str,
+    method: str,
+    session,
+    headers=None,
+    data=None,
+    rate_limiter=None,
+    retrier=None,
+    timeout=None,
+    deadline=None,
+    instrumentation=None,
+    decoder=None,
+):
+    """
+    rate_limiter: waits for the budget of the endpoint before sending, see rate_limit.RateLimiter
+    retrier: retries or hedges the request according to its policy, see retry.Retrier
+    timeout: seconds, or (connect, read) seconds, of every attempt
+    deadline: Deadline or seconds by which the request must complete, raises DeadlineExceeded past it.
+    The deadline of the enclosing deadline_scope applies as well
+    instrumentation: receives the metrics of the request, see instrumentation.Instrumentation
+    decoder: builds the result from the response bytes, e.g. decoding.TypedDecoder.
+    By default the json is parsed into dicts, the text is returned if it is not json
+    """
+    headers = overloadHeaders(method, headers)
+    body = serialize_body(data) if data else None
+    deadline = earliest(as_deadline(deadline), current_deadline())
+    attempts = []
+
+    def send():
+        metrics = None
+        if instrumentation is not None:
+            metrics = RequestMetrics(method, endpoint, request_bytes=len(body or b""))
+            attempts.append(metrics)
+        return _send(
+            endpoint,
+            method,
+            headers,
+            body,
+            session,
+            rate_limiter,
+            timeout,
+            deadline,
+            metrics,
+            decoder,
+        )
+
+    if instrumentation is None:
+        if retrier is None:
+            return await send()
+        return await retrier.call_async(method, endpoint, send, deadline)
+
+    start = time.perf_counter()
+    error = None
+    try:
+        if retrier is None:
+            return await send()
+        return await retrier.call_async(method, endpoint, send, deadline)
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        instrumentation.on_request(
+            request_metrics(
+                method, endpoint, attempts, time.perf_counter() - start, error
+            )
+        )
+
+
+async def post(
+    endpoint,
+    session,
+    headers=None,
+    data=None,
+    rate_limiter=None,
+    retrier=None,
+    timeout=None,
+    deadline=None,
+    instrumentation=None,
+    decoder=None,
+):
+    return await request(
+        endpoint,
+        POST,
+        session,
+        headers,
+        data,
+        rate_limiter,
+        retrier,
+        timeout,
+        deadline,
+        instrumentation,
+        decoder,
+    )
+
+
+async def get(
+    endpoint,
+    session,
+    headers=None,
+    data=None,
+    rate_limiter=None,
+    retrier=None,
+    timeout=None,
+    deadline=None,
+    instrumentation=None,
+    decoder=None,
+):
+    return await request(
+        endpoint,
+        GET,
+        session,
+        headers,
+        data,
+        rate_limiter,
+        retrier,
+        timeout,
+        deadline,
+        instrumentation,
+        decoder,
+    )
+
+
+async def delete(
+    endpoint,
+    session,
+    headers=None,
+    data=None,
+    rate_limiter=None,
+    retrier=None,
+    timeout=None,
+    deadline=None,
+    instrumentation=None,
+    decoder=None,
+):
+    return await request(
+        endpoint,
+        DELETE,
+        session,
+        headers,
+        data,
+        rate_limiter,
+        retrier,
+        timeout,
+        deadline,
+        instrumentation,
+        decoder,
+    )
@@ -0,0 +1,146 @@
+import contextvars
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+from typing import Optional, Union
+
+from ..exceptions import DeadlineExceeded
+
+# smallest timeout handed to the http libraries, which reject zero
+MIN_TIMEOUT = 0.001
+
+_current_deadline: contextvars.ContextVar[Optional["Deadline"]] = (
+    contextvars.ContextVar("clob_deadline", default=None)
+)
+
+
+class Deadline:
+    """
+    Point in time by which a call, and every request it makes, must complete
+    """
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, expires_at: float):
+        self.expires_at = expires_at
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        return cls(time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def check(self):
+        """
+        Raises DeadlineExceeded once the deadline has passed
+        """
+        if self.expired:
+            raise DeadlineExceeded()
+
+    def __repr__(self):
+        return "Deadline(remaining={:.3f})".format(self.remaining())
+
+
+def as_deadline(deadline: Union[Deadline, float, None]) -> Optional[Deadline]:
+    """
+    A deadline is given either as a Deadline or as a number of seconds from now
+    """
+    if deadline is None or isinstance(deadline, Deadline):
+        return deadline
+    return Deadline.after(deadline)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current_deadline.get()
+
+
+def earliest(*deadlines: Optional[Deadline]) -> Optional[Deadline]:
+    deadlines = [d for d in deadlines if d is not None]
+    return min(deadlines, key=lambda d: d.expires_at) if deadlines else None
+
+
+@contextmanager
+def deadline_scope(deadline: Union[Deadline, float, None]):
+    """
+    Bounds the requests made in the block, nested scopes can only shorten the deadline
+    """
+    deadline = earliest(as_deadline(deadline), current_deadline())
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def _scoped_iter(iterator, deadline: Deadline):
+    try:
+        while True:
+            with deadline_scope(deadline):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+    finally:
+        iterator.close()
+
+
+async def _scoped_aiter(iterator, deadline: Deadline):
+    try:
+        while True:
+            with deadline_scope(deadline):
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    return
+            yield item
+    finally:
+        await iterator.aclose()
+
+
+def with_deadline(func):
+    """
+    Adds a deadline keyword argument to a client method, bounding every request made by the call
+    Iterators returned by the method are bounded while they are consumed
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def wrapper(*args, deadline=None, **kwargs):
+            with deadline_scope(deadline):
+                return await func(*args, **kwargs)
+
+    else:
+
+        @functools.wraps(func)
+        def wrapper(*args, deadline=None, **kwargs):
+            with deadline_scope(deadline) as scoped:
+                result = func(*args, **kwargs)
+            if scoped is not None:
+                if inspect.isgenerator(result):
+                    return _scoped_iter(result, scoped)
+                if inspect.isasyncgen(result):
+                    return _scoped_aiter(result, scoped)
+            return result
+
+    return wrapper
+
+
+def bounded_timeout(timeout, deadline: Optional[Deadline]):
+    """
+    Shortens a timeout, in seconds or as (connect, read) seconds, to the time left before the deadline
+    """
+    if deadline is None:
+        return timeout
+    remaining = max(deadline.remaining(), MIN_TIMEOUT)
+    if timeout is None:
+        return remaining
+    if isinstance(timeout, tuple):
+        return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+    return min(timeout, remaining)
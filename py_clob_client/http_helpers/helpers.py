@@ -1,4 +1,14 @@
+import json
+import time
+from typing import Any, Callable, Optional
+
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 from py_clob_client.clob_types import (
     DropNotificationParams,
@@ -9,13 +19,81 @@ from py_clob_client.clob_types import (
     OpenOrderParams,
 )
 
-from ..exceptions import PolyApiException
+from ..decoding import decode_json
+from ..exceptions import DeadlineExceeded, PolyApiException, PolyException
+from ..instrumentation import (
+    DECODE,
+    QUEUE,
+    SERVER,
+    TRANSFER,
+    RequestMetrics,
+    request_metrics,
+)
+from .deadline import (
+    Deadline,
+    as_deadline,
+    bounded_timeout,
+    current_deadline,
+    earliest,
+)
 
 GET = "GET"
 POST = "POST"
 DELETE = "DELETE"
 PUT = "PUT"
 
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_MAX_RETRIES = 0
+
+# seconds to open a connection and to wait for a response
+DEFAULT_CONNECT_TIMEOUT = 5
+DEFAULT_READ_TIMEOUT = 30
+DEFAULT_TIMEOUT = (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT)
+
+
+def create_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    pool_block: bool = False,
+) -> requests.Session:
+    """
+    Creates a pooled http session which keeps connections to the CLOB warm
+    pool_connections: number of per-host connection pools to cache
+    pool_maxsize: maximum number of connections kept alive per host
+    max_retries: retries on connection errors, performed by urllib3
+    pool_block: blocks when every connection to a host is in use instead of opening a new one
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=max_retries,
+        pool_block=pool_block,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# shared session used when a caller does not provide its own
+_default_session = create_session()
+
+
+def serialize_body(body) -> bytes:
+    """
+    Serializes a request body to compact json, once
+    The same bytes are signed and sent on the wire. Uses orjson when installed
+    """
+    if isinstance(body, bytes):
+        return body
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    if orjson is not None:
+        return orjson.dumps(body)
+    return json.dumps(body, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
 
 def overloadHeaders(method: str, headers: dict) -> dict:
     if headers is None:
@@ -32,34 +110,235 @@ def overloadHeaders(method: str, headers: dict) -> dict:
     return headers
 
 
-def request(endpoint: str, method: str, headers=None, data=None):
-    try:
-        headers = overloadHeaders(method, headers)
-        resp = requests.request(
-            method=method, url=endpoint, headers=headers, json=data if data else None
-        )
-        if resp.status_code != 200:
-            raise PolyApiException(resp)
-
+def handle_response(
+    resp,
+    endpoint: str,
+    rate_limiter,
+    metrics: Optional[RequestMetrics],
+    received: float,
+    decoder: Optional[Callable[[bytes], Any]],
+):
+    """
+    Builds the result of a response, for the sync and async transports
+    Raises PolyApiException on an error status, a 429 pauses the endpoint in the rate limiter
+    """
+    if metrics is not None:
+        metrics.status_code = resp.status_code
+        metrics.response_bytes = len(resp.content)
+    if resp.status_code != 200:
+        exc = PolyApiException(resp)
+        if rate_limiter is not None and resp.status_code == 429:
+            rate_limiter.on_rate_limited(endpoint, exc.retry_after)
+        raise exc
+
+    if decoder is not None:
+        result = decoder(resp.content)
+    else:
         try:
-            return resp.json()
-        except requests.JSONDecodeError:
-            return resp.text
+            result = decode_json(resp.content)
+        except ValueError:
+            result = resp.text
+    if metrics is not None:
+        metrics.phases[DECODE] = time.perf_counter() - received
+    return result
 
-    except requests.RequestException:
-        raise PolyApiException(error_msg="Request exception!")
 
+def request_error(deadline: Optional[Deadline]) -> PolyException:
+    """
+    Error raised when a request fails without a response, DeadlineExceeded past the deadline
+    """
+    if deadline is not None and deadline.expired:
+        return DeadlineExceeded()
+    return PolyApiException(error_msg="Request exception!")
+
+
+def _send(
+    endpoint: str,
+    method: str,
+    headers: dict,
+    body,
+    session,
+    rate_limiter,
+    timeout,
+    deadline: Optional[Deadline],
+    metrics: Optional[RequestMetrics],
+    decoder: Optional[Callable[[bytes], Any]],
+):
+    try:
+        if deadline is not None:
+            deadline.check()
+        queued = time.perf_counter()
+        if rate_limiter is not None:
+            rate_limiter.acquire(method, endpoint, deadline)
+        sent = time.perf_counter()
+        resp = session.request(
+            method=method,
+            url=endpoint,
+            headers=headers,
+            data=body,
+            timeout=bounded_timeout(timeout, deadline),
+        )
+        received = time.perf_counter()
+        if metrics is not None:
+            if rate_limiter is not None:
+                metrics.phases[QUEUE] = sent - queued
+            # elapsed stops at the response headers, and includes connecting on a new connection
+            server = min(resp.elapsed.total_seconds(), received - sent)
+            metrics.phases[SERVER] = server
+            metrics.phases[TRANSFER] = received - sent - server
+    except requests.RequestException as e:
+        raise request_error(deadline) from e
+    return handle_response(resp, endpoint, rate_limiter, metrics, received, decoder)
+
+
+def request(
+    endpoint: str,
+    method: str,
+    headers=None,
+    data=None,
+    session=None,
+    rate_limiter=None,
+    retrier=None,
+    timeout=None,
+    deadline=None,
+    instrumentation=None,
+    decoder=None,
+):
+    """
+    rate_limiter: waits for the budget of the endpoint before sending, see rate_limit.RateLimiter
+    retrier: retries or hedges the request according to its policy, see retry.Retrier
+    timeout: seconds, or (connect, read) seconds, of every attempt
+    deadline: Deadline or seconds by which the request must complete, raises DeadlineExceeded past it.
+    The deadline of the enclosing deadline_scope applies as well
+    instrumentation: receives the metrics of the request, see instrumentation.Instrumentation
+    decoder: builds the result from the response bytes, e.g. decoding.TypedDecoder.
+    By default the json is parsed into dicts, the text is returned if it is not json
+    """
+    headers = overloadHeaders(method, headers)
+    session = session if session is not None else _default_session
+    body = serialize_body(data) if data else None
+    deadline = earliest(as_deadline(deadline), current_deadline())
+    attempts = []
+
+    def send():
+        metrics = None
+        if instrumentation is not None:
+            metrics = RequestMetrics(method, endpoint, request_bytes=len(body or b""))
+            attempts.append(metrics)
+        return _send(
+            endpoint,
+            method,
+            headers,
+            body,
+            session,
+            rate_limiter,
+            timeout,
+            deadline,
+            metrics,
+            decoder,
+        )
 
-def post(endpoint, headers=None, data=None):
-    return request(endpoint, POST, headers, data)
-
+    if instrumentation is None:
+        if retrier is None:
+            return send()
+        return retrier.call(method, endpoint, send, deadline)
 
-def get(endpoint, headers=None, data=None):
-    return request(endpoint, GET, headers, data)
+    start = time.perf_counter()
+    error = None
+    try:
+        if retrier is None:
+            return send()
+        return retrier.call(method, endpoint, send, deadline)
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        instrumentation.on_request(
+            request_metrics(
+                method, endpoint, attempts, time.perf_counter() - start, error
+            )
+        )
 
 
-def delete(endpoint, headers=None, data=None):
-    return request(endpoint, DELETE, headers, data)
+def post(
+    endpoint,
+    headers=None,
+    data=None,
+    session=None,
+    rate_limiter=None,
+    retrier=None,
+    timeout=None,
+    deadline=None,
+    instrumentation=None,
+    decoder=None,
+):
+    return request(
+        endpoint,
+        POST,
+        headers,
+        data,
+        session,
+        rate_limiter,
+        retrier,
+        timeout,
+        deadline,
+        instrumentation,
+        decoder,
+    )
+
+
+def get(
+    endpoint,
+    headers=None,
+    data=None,
+    session=None,
+    rate_limiter=None,
+    retrier=None,
+    timeout=None,
+    deadline=None,
+    instrumentation=None,
+    decoder=None,
+):
+    return request(
+        endpoint,
+        GET,
+        headers,
+        data,
+        session,
+        rate_limiter,
+        retrier,
+        timeout,
+        deadline,
+        instrumentation,
+        decoder,
+    )
+
+
+def delete(
+    endpoint,
+    headers=None,
+    data=None,
+    session=None,
+    rate_limiter=None,
+    retrier=None,
+    timeout=None,
+    deadline=None,
+    instrumentation=None,
+    decoder=None,
+):
+    return request(
+        endpoint,
+        DELETE,
+        headers,
+        data,
+        session,
+        rate_limiter,
+        retrier,
+        timeout,
+        deadline,
+        instrumentation,
+        decoder,
+    )
 
 
 def build_query_params(url: str, param: str, val: str) -> str:
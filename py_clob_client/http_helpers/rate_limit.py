@@ -0,0 +1,296 @@
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+from urllib.parse import urlsplit
+
+from ..endpoints import (
+    CANCEL,
+    CANCEL_ALL,
+    CANCEL_MARKET_ORDERS,
+    CANCEL_ORDERS,
+    GET_MARKETS,
+    GET_ORDER_BOOK,
+    GET_ORDER_BOOKS,
+    POST_ORDER,
+    POST_ORDERS,
+    TRADES,
+)
+from ..exceptions import DeadlineExceeded
+from .deadline import Deadline
+from .helpers import DELETE, POST
+
+# lower is served first
+PRIORITY_CANCEL = 0
+PRIORITY_ORDER = 1
+PRIORITY_MARKET_DATA = 2
+
+# every endpoint not in a family of its own
+DEFAULT_FAMILY = "*"
+
+# pause applied on a 429 without a Retry-After header
+DEFAULT_RETRY_AFTER = 1.0
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    rate: float
+    burst: float
+
+
+# conservative requests per second and burst per endpoint family, tune to the allowance of the account
+DEFAULT_RATE_LIMITS = {
+    GET_ORDER_BOOK: RateLimit(rate=50, burst=100),
+    GET_ORDER_BOOKS: RateLimit(rate=10, burst=20),
+    POST_ORDER: RateLimit(rate=50, burst=100),
+    POST_ORDERS: RateLimit(rate=10, burst=20),
+    TRADES: RateLimit(rate=10, burst=20),
+    GET_MARKETS: RateLimit(rate=10, burst=20),
+    DEFAULT_FAMILY: RateLimit(rate=20, burst=50),
+}
+
+
+@dataclass
+class BucketUsage:
+    rate: float
+    burst: float
+    available: float
+    queued: int
+    retry_after: float
+
+
+def request_priority(method: str, path: str) -> int:
+    """
+    Cancels go first, then new orders, then everything else
+    """
+    if method == DELETE and path in (
+        CANCEL,
+        CANCEL_ORDERS,
+        CANCEL_ALL,
+        CANCEL_MARKET_ORDERS,
+    ):
+        return PRIORITY_CANCEL
+    if method == POST and path in (POST_ORDER, POST_ORDERS):
+        return PRIORITY_ORDER
+    return PRIORITY_MARKET_DATA
+
+
+class TokenBucket:
+    """
+    Thread safe token bucket, refilled with rate tokens per second up to burst
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0 or burst <= 0:
+            raise ValueError("rate and burst must be positive")
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.tokens = float(burst)
+        self.updated = clock()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """
+        Takes tokens if they are available and returns 0,
+        else returns the seconds until they are
+        """
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            if now < self.blocked_until:
+                return self.blocked_until - now
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return 0.0
+            return (tokens - self.tokens) / self.rate
+
+    def pause(self, seconds: float):
+        """
+        Empties the bucket and hands out no token for the next seconds
+        """
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            self.tokens = 0.0
+            self.blocked_until = max(self.blocked_until, now + seconds)
+
+    def usage(self) -> tuple[float, float]:
+        """
+        Available tokens and seconds left of a pause
+        """
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            return self.tokens, max(self.blocked_until - now, 0.0)
+
+
+class _Family:
+    def __init__(self, limit: RateLimit, clock: Callable[[], float]):
+        self.bucket = TokenBucket(limit.rate, limit.burst, clock)
+        self.condition = threading.Condition()
+        self.waiters: list[tuple[int, int]] = []
+        self.async_condition: Optional[asyncio.Condition] = None
+        self.async_waiters: list[tuple[int, int]] = []
+
+
+def _leave(waiters: list, ticket: tuple[int, int]):
+    if waiters[0] == ticket:
+        heapq.heappop(waiters)
+    else:
+        waiters.remove(ticket)
+        heapq.heapify(waiters)
+
+
+def _bounded_wait(wait: Optional[float], deadline: Optional[Deadline]):
+    """
+    Time to wait for a token, None to wait for a notification, bounded by the deadline
+    """
+    if deadline is None:
+        return wait
+    remaining = deadline.remaining()
+    if remaining <= 0 or (wait is not None and wait > remaining):
+        raise DeadlineExceeded()
+    return remaining if wait is None else wait
+
+
+class RateLimiter:
+    """
+    Client side scheduler keeping requests within per endpoint family rate limits
+
+        client = ClobClient(host, rate_limiter=RateLimiter())
+
+    Every family of endpoints has its own token bucket, see DEFAULT_RATE_LIMITS,
+    the endpoints matching no family share the DEFAULT_FAMILY bucket, or are not limited if it is missing.
+    Calls waiting on a bucket are served by priority, cancels before new orders before market data,
+    and a 429 pauses the bucket for the Retry-After of the response.
+    A limiter is shared by the threads of a sync client or the tasks of an async client
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, RateLimit] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        limits = DEFAULT_RATE_LIMITS if limits is None else limits
+        self.families = {
+            family: _Family(limit, clock) for family, limit in limits.items()
+        }
+        # longest first, so /books is not matched by /book
+        self._prefixes = sorted(
+            (f for f in self.families if f != DEFAULT_FAMILY), key=len, reverse=True
+        )
+        self._seq = itertools.count()
+
+    def family(self, endpoint: str) -> Optional[str]:
+        """
+        Family of an endpoint url, None if it is not limited
+        """
+        path = urlsplit(endpoint).path
+        for prefix in self._prefixes:
+            if path == prefix or path.startswith(prefix + "/"):
+                return prefix
+        return DEFAULT_FAMILY if DEFAULT_FAMILY in self.families else None
+
+    def _ticket(self, method: str, endpoint: str) -> tuple[int, int]:
+        priority = request_priority(method, urlsplit(endpoint).path)
+        return priority, next(self._seq)
+
+    def acquire(self, method: str, endpoint: str, deadline: Deadline = None):
+        """
+        Blocks until the request may be sent
+        Raises DeadlineExceeded if the deadline would pass before
+        """
+        name = self.family(endpoint)
+        if name is None:
+            return
+        family = self.families[name]
+        ticket = self._ticket(method, endpoint)
+        with family.condition:
+            heapq.heappush(family.waiters, ticket)
+            try:
+                while True:
+                    wait = None
+                    if family.waiters[0] == ticket:
+                        wait = family.bucket.try_acquire()
+                        if wait == 0:
+                            return
+                    family.condition.wait(_bounded_wait(wait, deadline))
+            finally:
+                _leave(family.waiters, ticket)
+                family.condition.notify_all()
+
+    async def acquire_async(
+        self, method: str, endpoint: str, deadline: Deadline = None
+    ):
+        """
+        Waits until the request may be sent
+        Raises DeadlineExceeded if the deadline would pass before
+        """
+        name = self.family(endpoint)
+        if name is None:
+            return
+        family = self.families[name]
+        if family.async_condition is None:
+            family.async_condition = asyncio.Condition()
+        condition = family.async_condition
+        ticket = self._ticket(method, endpoint)
+        async with condition:
+            heapq.heappush(family.async_waiters, ticket)
+            try:
+                while True:
+                    wait = None
+                    if family.async_waiters[0] == ticket:
+                        wait = family.bucket.try_acquire()
+                        if wait == 0:
+                            return
+                    wait = _bounded_wait(wait, deadline)
+                    if wait is None:
+                        await condition.wait()
+                        continue
+                    try:
+                        await asyncio.wait_for(condition.wait(), wait)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                _leave(family.async_waiters, ticket)
+                condition.notify_all()
+
+    def on_rate_limited(self, endpoint: str, retry_after: float = None):
+        """
+        Pauses the bucket of an endpoint after a 429
+        """
+        name = self.family(endpoint)
+        if name is not None:
+            self.families[name].bucket.pause(
+                DEFAULT_RETRY_AFTER if retry_after is None else retry_after
+            )
+
+    def usage(self) -> dict[str, BucketUsage]:
+        """
+        Current budget of every family
+        """
+        usage = {}
+        for name, family in self.families.items():
+            available, retry_after = family.bucket.usage()
+            usage[name] = BucketUsage(
+                rate=family.bucket.rate,
+                burst=family.bucket.burst,
+                available=available,
+                queued=len(family.waiters) + len(family.async_waiters),
+                retry_after=retry_after,
+            )
+        return usage
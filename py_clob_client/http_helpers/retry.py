@@ -0,0 +1,303 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+from urllib.parse import urlsplit
+
+from ..endpoints import (
+    GET_LAST_TRADES_PRICES,
+    GET_ORDER_BOOK,
+    GET_ORDER_BOOKS,
+    GET_PRICES,
+    GET_SPREADS,
+    MID_POINT,
+    MID_POINTS,
+    PRICE,
+)
+from ..exceptions import PolyApiException
+from ..utilities import backoff_delay
+from .deadline import Deadline
+from .helpers import DELETE, GET, POST
+
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# hedge delay used until enough latencies were seen to estimate their p95
+DEFAULT_HEDGE_DELAY = 0.25
+HEDGE_PERCENTILE = 0.95
+HEDGE_MIN_SAMPLES = 20
+LATENCY_WINDOW = 200
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    max_retries: attempts made after the first one
+    min_backoff, max_backoff: bounds of the jittered exponential backoff between attempts, in seconds
+    retry_statuses: http statuses retried, connection errors and timeouts are always retried
+    hedge: sends a second request if the first has not returned after hedge_delay, the first response wins
+    hedge_delay: seconds, the p95 latency of the endpoint if not given
+    """
+
+    max_retries: int = 0
+    min_backoff: float = 0.05
+    max_backoff: float = 1.0
+    retry_statuses: tuple[int, ...] = DEFAULT_RETRY_STATUSES
+    hedge: bool = False
+    hedge_delay: Optional[float] = None
+
+
+NO_RETRY = RetryPolicy()
+READ_RETRY = RetryPolicy(max_retries=2)
+HEDGED_READ_RETRY = RetryPolicy(max_retries=2, hedge=True)
+
+# reads sent as POST, with the ids in the body
+POST_READS = (
+    GET_ORDER_BOOKS,
+    MID_POINTS,
+    GET_PRICES,
+    GET_SPREADS,
+    GET_LAST_TRADES_PRICES,
+)
+
+# latency critical reads
+DEFAULT_RETRY_POLICIES = {
+    (GET, GET_ORDER_BOOK): HEDGED_READ_RETRY,
+    (POST, GET_ORDER_BOOKS): HEDGED_READ_RETRY,
+    (GET, MID_POINT): HEDGED_READ_RETRY,
+    (GET, PRICE): HEDGED_READ_RETRY,
+}
+
+
+def is_idempotent(method: str, path: str) -> bool:
+    """
+    Whether a request can be sent again without side effects
+    Cancels are, orders and other writes are not
+    """
+    return method in (GET, DELETE) or (method == POST and path in POST_READS)
+
+
+def is_retryable(exc: PolyApiException, policy: RetryPolicy) -> bool:
+    # no status code: the request failed or timed out before a response was read
+    return exc.status_code is None or exc.status_code in policy.retry_statuses
+
+
+class LatencyTracker:
+    """
+    Latencies of the last successful requests of every endpoint
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.window = window
+        self._latencies: dict[tuple[str, str], deque] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: tuple[str, str], latency: float):
+        with self._lock:
+            latencies = self._latencies.get(key)
+            if latencies is None:
+                latencies = self._latencies[key] = deque(maxlen=self.window)
+            latencies.append(latency)
+
+    def percentile(
+        self, key: tuple[str, str], q: float, min_samples: int = HEDGE_MIN_SAMPLES
+    ) -> Optional[float]:
+        """
+        q-th percentile of the latencies of an endpoint, None until min_samples were recorded
+        """
+        with self._lock:
+            latencies = sorted(self._latencies.get(key, ()))
+        if not latencies or len(latencies) < min_samples:
+            return None
+        return latencies[int(q * (len(latencies) - 1))]
+
+
+class Retrier:
+    """
+    Retries failed requests according to per endpoint policies
+
+        client = ClobClient(host, retrier=Retrier())
+
+    Policies are looked up by method and path in policies, see DEFAULT_RETRY_POLICIES,
+    then idempotent requests get the read policy and the others, e.g. POST /order, the write policy,
+    so orders are never sent twice unless asked for.
+    Hedged reads fire a second request after the p95 latency of the endpoint and return the first response.
+    The sync client sends hedged reads from a dedicated pool of max_hedge_workers threads
+    """
+
+    def __init__(
+        self,
+        policies: dict[tuple[str, str], RetryPolicy] = None,
+        read: RetryPolicy = READ_RETRY,
+        write: RetryPolicy = NO_RETRY,
+        max_hedge_workers: int = 8,
+    ):
+        self.policies = DEFAULT_RETRY_POLICIES if policies is None else policies
+        self.read = read
+        self.write = write
+        self.latencies = LatencyTracker()
+        self.max_hedge_workers = max_hedge_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def policy(self, method: str, endpoint: str) -> RetryPolicy:
+        path = urlsplit(endpoint).path
+        policy = self.policies.get((method, path))
+        if policy is not None:
+            return policy
+        return self.read if is_idempotent(method, path) else self.write
+
+    def hedge_delay(self, key: tuple[str, str], policy: RetryPolicy) -> float:
+        if policy.hedge_delay is not None:
+            return policy.hedge_delay
+        delay = self.latencies.percentile(key, HEDGE_PERCENTILE)
+        return DEFAULT_HEDGE_DELAY if delay is None else delay
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self.max_hedge_workers, thread_name_prefix="clob-hedge"
+                )
+            return self._executor
+
+    def _backoff(self, attempt: int, policy: RetryPolicy, exc: PolyApiException):
+        delay = backoff_delay(attempt, policy.min_backoff, policy.max_backoff)
+        return max(delay, exc.retry_after or 0.0)
+
+    def call(
+        self,
+        method: str,
+        endpoint: str,
+        send: Callable[[], object],
+        deadline: Deadline = None,
+    ):
+        """
+        Calls send, which makes the request, until it succeeds or the policy gives up
+        No retry is made past the deadline
+        """
+        policy = self.policy(method, endpoint)
+        key = (method, urlsplit(endpoint).path)
+
+        def timed_send():
+            start = time.monotonic()
+            result = send()
+            self.latencies.record(key, time.monotonic() - start)
+            return result
+
+        attempt = 0
+        while True:
+            try:
+                if policy.hedge:
+                    return self._hedged(timed_send, self.hedge_delay(key, policy))
+                return timed_send()
+            except PolyApiException as exc:
+                if attempt >= policy.max_retries or not is_retryable(exc, policy):
+                    raise
+                delay = self._backoff(attempt, policy, exc)
+                if deadline is not None and delay >= deadline.remaining():
+                    raise
+                time.sleep(delay)
+                attempt += 1
+
+    def _hedged(self, send: Callable[[], object], delay: float):
+        """
+        Sends the request on the executor, and a hedge if it has not returned after delay
+        The first successful response is returned, the other request completes in the background
+        """
+        executor = self._get_executor()
+        started = threading.Event()
+
+        def primary():
+            started.set()
+            return send()
+
+        pending = {executor.submit(primary)}
+        try:
+            # the delay counts from the start of the request, not from the time spent waiting for a worker
+            started.wait()
+            done, _ = wait(pending, timeout=delay)
+            if not done:
+                pending.add(executor.submit(send))
+
+            error = None
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is None:
+                        return future.result()
+                    error = error or future.exception()
+            raise error
+        finally:
+            # a hedge still waiting for a worker is dropped
+            for future in pending:
+                future.cancel()
+
+    async def call_async(
+        self,
+        method: str,
+        endpoint: str,
+        send: Callable[[], Awaitable],
+        deadline: Deadline = None,
+    ):
+        """
+        Awaits send, which makes the request, until it succeeds or the policy gives up
+        No retry is made past the deadline
+        """
+        policy = self.policy(method, endpoint)
+        key = (method, urlsplit(endpoint).path)
+
+        async def timed_send():
+            start = time.monotonic()
+            result = await send()
+            self.latencies.record(key, time.monotonic() - start)
+            return result
+
+        attempt = 0
+        while True:
+            try:
+                if policy.hedge:
+                    return await self._hedged_async(
+                        timed_send, self.hedge_delay(key, policy)
+                    )
+                return await timed_send()
+            except PolyApiException as exc:
+                if attempt >= policy.max_retries or not is_retryable(exc, policy):
+                    raise
+                delay = self._backoff(attempt, policy, exc)
+                if deadline is not None and delay >= deadline.remaining():
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _hedged_async(self, send: Callable[[], Awaitable], delay: float):
+        pending = {asyncio.ensure_future(send())}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if not done:
+                pending.add(asyncio.ensure_future(send()))
+
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def close(self):
+        """
+        Shuts the hedging threads down
+        """
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
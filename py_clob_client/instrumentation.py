@@ -0,0 +1,262 @@
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from typing import Optional
+from urllib.parse import urlsplit
+
+try:
+    import prometheus_client
+except ImportError:  # pragma: no cover
+    prometheus_client = None
+
+try:
+    from opentelemetry import metrics as otel_metrics
+except ImportError:  # pragma: no cover
+    otel_metrics = None
+
+from .endpoints import GET_MARKET, GET_MARKET_TRADES_EVENTS, GET_ORDER
+from .exceptions import PolyException
+
+PROMETHEUS_UNAVAILABLE = "prometheus_client is needed to export metrics to prometheus: pip install prometheus_client"
+OPENTELEMETRY_UNAVAILABLE = "opentelemetry-api is needed to export metrics to opentelemetry: pip install opentelemetry-api"
+
+# phases of a request, in seconds
+QUEUE = "queue"  # waiting for the rate limiter
+CONNECT = "connect"  # dns resolution and tcp connection, async client only
+TLS = "tls"  # tls handshake, async client only
+SERVER = "server"  # from sending the request to the response headers
+TRANSFER = "transfer"  # reading the response body
+DECODE = "decode"  # parsing the json response
+
+# operations whose signing time is reported
+SIGN_L1_HEADERS = "l1_headers"
+SIGN_L2_HEADERS = "l2_headers"
+SIGN_ORDER = "order"
+SIGN_ORDERS = "orders"
+SIGN_MARKET_ORDER = "market_order"
+
+# endpoints ending with an id, labelled by their prefix to keep the number of labels bounded
+ID_ENDPOINTS = (GET_MARKET, GET_ORDER, GET_MARKET_TRADES_EVENTS)
+
+
+def endpoint_label(path: str) -> str:
+    for prefix in ID_ENDPOINTS:
+        if path.startswith(prefix) and len(path) > len(prefix):
+            return prefix + "{id}"
+    return path
+
+
+@dataclass
+class RequestMetrics:
+    """
+    Metrics of a request, across its retries
+    endpoint: path of the request, ids replaced by {id}
+    attempts: requests sent, more than one when retried or hedged
+    phases: seconds spent in each phase of the attempt that returned, see SERVER
+    duration: seconds from the call to its return, backoffs included
+    status_code: None if no response was received
+    error: the exception raised, if any
+    """
+
+    method: str
+    endpoint: str
+    status_code: Optional[int] = None
+    attempts: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    phases: dict[str, float] = field(default_factory=dict)
+    duration: float = 0.0
+    error: Optional[Exception] = None
+
+    @property
+    def retries(self) -> int:
+        return max(self.attempts - 1, 0)
+
+
+def request_metrics(
+    method: str,
+    endpoint: str,
+    attempts: list[RequestMetrics],
+    duration: float,
+    error: Optional[Exception],
+) -> RequestMetrics:
+    """
+    Metrics of a request from those of its attempts, the phases are the ones of the attempt that succeeded,
+    or of the last one
+    """
+    metrics = next((a for a in attempts if a.status_code == 200), None)
+    if metrics is None:
+        metrics = attempts[-1] if attempts else RequestMetrics(method, endpoint)
+    return replace(
+        metrics,
+        endpoint=endpoint_label(urlsplit(endpoint).path),
+        phases=dict(metrics.phases),
+        attempts=len(attempts),
+        duration=duration,
+        error=error,
+    )
+
+
+class Instrumentation:
+    """
+    Receives the metrics of the client, override the callbacks to export them
+
+        client = ClobClient(host, instrumentation=PrometheusInstrumentation())
+
+    Callbacks run on the thread, or event loop, making the request and must be fast
+    """
+
+    def on_request(self, metrics: RequestMetrics):
+        pass
+
+    def on_signing(self, operation: str, seconds: float):
+        pass
+
+
+@contextmanager
+def timed_signing(instrumentation: Optional[Instrumentation], operation: str):
+    """
+    Reports the time spent in the block to instrumentation.on_signing
+    """
+    if instrumentation is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        instrumentation.on_signing(operation, time.perf_counter() - start)
+
+
+class PrometheusInstrumentation(Instrumentation):
+    """
+    Exports the metrics as prometheus histograms and counters, labelled by method and endpoint
+    """
+
+    def __init__(self, registry=None, namespace: str = "clob"):
+        if prometheus_client is None:
+            raise PolyException(PROMETHEUS_UNAVAILABLE)
+
+        registry = registry if registry is not None else prometheus_client.REGISTRY
+        labels = ["method", "endpoint"]
+        self.requests = prometheus_client.Counter(
+            "requests",
+            "Requests made, by status",
+            labels + ["status"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.retries = prometheus_client.Counter(
+            "request_retries",
+            "Requests sent again after a failure or hedged",
+            labels,
+            namespace=namespace,
+            registry=registry,
+        )
+        self.duration = prometheus_client.Histogram(
+            "request_duration_seconds",
+            "Duration of the requests, retries included",
+            labels,
+            namespace=namespace,
+            registry=registry,
+        )
+        self.phases = prometheus_client.Histogram(
+            "request_phase_seconds",
+            "Duration of each phase of the requests",
+            labels + ["phase"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.request_bytes = prometheus_client.Histogram(
+            "request_size_bytes",
+            "Size of the request bodies",
+            labels,
+            buckets=(0, 256, 1024, 4096, 16384, 65536, 262144),
+            namespace=namespace,
+            registry=registry,
+        )
+        self.response_bytes = prometheus_client.Histogram(
+            "response_size_bytes",
+            "Size of the response bodies",
+            labels,
+            buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+            namespace=namespace,
+            registry=registry,
+        )
+        self.signing = prometheus_client.Histogram(
+            "signing_seconds",
+            "Time spent signing orders and headers",
+            ["operation"],
+            namespace=namespace,
+            registry=registry,
+        )
+
+    def on_request(self, metrics: RequestMetrics):
+        labels = (metrics.method, metrics.endpoint)
+        status = "error" if metrics.status_code is None else str(metrics.status_code)
+        self.requests.labels(*labels, status).inc()
+        if metrics.retries:
+            self.retries.labels(*labels).inc(metrics.retries)
+        self.duration.labels(*labels).observe(metrics.duration)
+        for phase, seconds in metrics.phases.items():
+            self.phases.labels(*labels, phase).observe(seconds)
+        self.request_bytes.labels(*labels).observe(metrics.request_bytes)
+        self.response_bytes.labels(*labels).observe(metrics.response_bytes)
+
+    def on_signing(self, operation: str, seconds: float):
+        self.signing.labels(operation).observe(seconds)
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """
+    Records the metrics with opentelemetry instruments, the sdk configured by the application exports them
+    """
+
+    def __init__(self, meter=None):
+        if otel_metrics is None:
+            raise PolyException(OPENTELEMETRY_UNAVAILABLE)
+
+        meter = meter if meter is not None else otel_metrics.get_meter("py_clob_client")
+        self.requests = meter.create_counter(
+            "clob.requests", description="Requests made, by status"
+        )
+        self.retries = meter.create_counter(
+            "clob.request.retries",
+            description="Requests sent again after a failure or hedged",
+        )
+        self.duration = meter.create_histogram(
+            "clob.request.duration",
+            unit="s",
+            description="Duration of the requests, retries included",
+        )
+        self.phases = meter.create_histogram(
+            "clob.request.phase.duration",
+            unit="s",
+            description="Duration of each phase of the requests",
+        )
+        self.request_bytes = meter.create_histogram(
+            "clob.request.size", unit="By", description="Size of the request bodies"
+        )
+        self.response_bytes = meter.create_histogram(
+            "clob.response.size", unit="By", description="Size of the response bodies"
+        )
+        self.signing = meter.create_histogram(
+            "clob.signing.duration",
+            unit="s",
+            description="Time spent signing orders and headers",
+        )
+
+    def on_request(self, metrics: RequestMetrics):
+        attributes = {"method": metrics.method, "endpoint": metrics.endpoint}
+        status = "error" if metrics.status_code is None else str(metrics.status_code)
+        self.requests.add(1, {**attributes, "status": status})
+        if metrics.retries:
+            self.retries.add(metrics.retries, attributes)
+        self.duration.record(metrics.duration, attributes)
+        for phase, seconds in metrics.phases.items():
+            self.phases.record(seconds, {**attributes, "phase": phase})
+        self.request_bytes.record(metrics.request_bytes, attributes)
+        self.response_bytes.record(metrics.response_bytes, attributes)
+
+    def on_signing(self, operation: str, seconds: float):
+        self.signing.record(seconds, {"operation": operation})
@@ -0,0 +1,258 @@
+import heapq
+import re
+from bisect import bisect_left, insort
+from typing import Iterable, Optional
+
+# fields indexed for keyword search, with the weight of a match in each
+FIELD_BOOSTS = {
+    "question": 3.0,
+    "market_slug": 2.0,
+    "category": 1.5,
+    "tags": 1.5,
+    "outcomes": 1.5,
+    "description": 1.0,
+    "condition_id": 1.0,
+}
+
+# boolean fields with a set of markets per value, so filtering on them is a set lookup
+FLAG_FIELDS = ("active", "closed", "accepting_orders")
+
+OR = "OR"
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Splits a text into lowercase words
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def _field_text(market: dict, field: str) -> str:
+    if field == "outcomes":
+        # tokens read back from a csv are a string, their outcomes are not indexed
+        tokens = market.get("tokens")
+        if not isinstance(tokens, (list, tuple)):
+            return ""
+        return " ".join(
+            str(t.get("outcome") or "") for t in tokens if isinstance(t, dict)
+        )
+    value = market.get(field)
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        return " ".join(str(v) for v in value)
+    return str(value)
+
+
+class MarketIndex:
+    """
+    Inverted index over markets, for keyword searches with filters
+
+    Queries are made of words, all of which must match, case insensitive
+    - word*: any word starting with the prefix
+    - -word: excludes the markets matching the word
+    - a b OR c: markets matching a and b, or c
+    Results are ranked by the sum of the boosts of the fields each word matched in, see FIELD_BOOSTS
+    """
+
+    def __init__(self, field_boosts: dict[str, float] = None):
+        self.field_boosts = field_boosts or FIELD_BOOSTS
+        self.markets: dict[str, dict] = {}
+        self.postings: dict[str, dict[str, float]] = {}
+        self.terms: list[str] = []
+        self.flags: dict[str, dict[bool, set[str]]] = {
+            field: {True: set(), False: set()} for field in FLAG_FIELDS
+        }
+        self._doc_terms: dict[str, list[str]] = {}
+
+    @classmethod
+    def from_markets(
+        cls, markets: Iterable[dict], field_boosts: dict[str, float] = None
+    ) -> "MarketIndex":
+        index = cls(field_boosts)
+        for market in markets:
+            index.add(market)
+        return index
+
+    def add(self, market: dict):
+        """
+        Indexes a market, replacing its previous version if any
+        """
+        condition_id = market.get("condition_id")
+        if not condition_id:
+            return
+        self.remove(condition_id)
+
+        scores: dict[str, float] = {}
+        for field, boost in self.field_boosts.items():
+            for term in tokenize(_field_text(market, field)):
+                scores[term] = scores.get(term, 0.0) + boost
+
+        for term, score in scores.items():
+            postings = self.postings.get(term)
+            if postings is None:
+                postings = self.postings[term] = {}
+                insort(self.terms, term)
+            postings[condition_id] = score
+
+        for field, values in self.flags.items():
+            values[bool(market.get(field))].add(condition_id)
+        self.markets[condition_id] = market
+        self._doc_terms[condition_id] = list(scores)
+
+    def remove(self, condition_id: str):
+        """
+        Removes a market from the index
+        """
+        terms = self._doc_terms.pop(condition_id, None)
+        if terms is None:
+            return
+        market = self.markets.pop(condition_id)
+        for field, values in self.flags.items():
+            values[bool(market.get(field))].discard(condition_id)
+        for term in terms:
+            postings = self.postings[term]
+            del postings[condition_id]
+            if not postings:
+                del self.postings[term]
+                del self.terms[bisect_left(self.terms, term)]
+
+    def _match(self, word: str) -> dict[str, float]:
+        """
+        Scores of the markets matching a query word
+        """
+        prefix = word.endswith("*")
+        terms = tokenize(word)
+        if not terms:
+            return {}
+
+        matched = None
+        for i, term in enumerate(terms):
+            if prefix and i == len(terms) - 1:
+                # markets matching several of the words share the score of the last one
+                postings = {}
+                i = bisect_left(self.terms, term)
+                while i < len(self.terms) and self.terms[i].startswith(term):
+                    postings.update(self.postings[self.terms[i]])
+                    i += 1
+            else:
+                postings = self.postings.get(term, {})
+
+            if matched is None:
+                matched = dict(postings)
+            else:
+                matched = {
+                    condition_id: score + postings[condition_id]
+                    for condition_id, score in matched.items()
+                    if condition_id in postings
+                }
+        return matched
+
+    def _search_group(self, words: list[str], candidates: set) -> dict[str, float]:
+        included = [w for w in words if not w.startswith("-")]
+        excluded = [w[1:] for w in words if w.startswith("-") and len(w) > 1]
+
+        if included:
+            matches = [self._match(w) for w in included]
+            matches.sort(key=len)
+            scores = matches[0]
+            for match in matches[1:]:
+                scores = {
+                    condition_id: score + match[condition_id]
+                    for condition_id, score in scores.items()
+                    if condition_id in match
+                }
+        else:
+            scores = dict.fromkeys(candidates, 0.0)
+
+        for word in excluded:
+            for condition_id in self._match(word):
+                scores.pop(condition_id, None)
+        return scores
+
+    def search(
+        self,
+        query: str = "",
+        active: bool = None,
+        closed: bool = None,
+        accepting_orders: bool = None,
+        end_after: str = None,
+        end_before: str = None,
+        tick_size: float = None,
+        limit: Optional[int] = None,
+    ) -> list[str]:
+        """
+        Condition ids of the markets matching the query and the filters, best matches first
+        end_after, end_before: iso dates compared with the end_date_iso of the markets
+        An empty query matches every market
+        """
+        groups = [[]]
+        for word in query.split():
+            if word == OR:
+                groups.append([])
+            else:
+                groups[-1].append(word)
+        groups = [group for group in groups if group] or [[]]
+
+        flag_sets = [
+            self.flags[field][bool(value)]
+            for field, value in zip(FLAG_FIELDS, (active, closed, accepting_orders))
+            if value is not None
+        ]
+        candidates = min(flag_sets, key=len) if flag_sets else self.markets
+
+        if len(groups) == 1:
+            scores = self._search_group(groups[0], candidates)
+        else:
+            scores = {}
+            for group in groups:
+                for condition_id, score in self._search_group(
+                    group, candidates
+                ).items():
+                    scores[condition_id] = max(scores.get(condition_id, 0.0), score)
+
+        matched = scores.keys()
+        for flag_set in flag_sets:
+            matched = matched & flag_set
+
+        check_dates = end_after is not None or end_before is not None
+        results = []
+        for condition_id in matched:
+            if check_dates or tick_size is not None:
+                market = self.markets[condition_id]
+                if check_dates:
+                    end_date = market.get("end_date_iso")
+                    if not end_date:
+                        continue
+                    if end_after is not None and end_date < end_after:
+                        continue
+                    if end_before is not None and end_date > end_before:
+                        continue
+                if tick_size is not None and (
+                    market.get("minimum_tick_size") is None
+                    or float(market["minimum_tick_size"]) != float(tick_size)
+                ):
+                    continue
+            results.append((-scores[condition_id], condition_id))
+
+        if limit is not None:
+            results = heapq.nsmallest(limit, results)
+        else:
+            results.sort()
+        return [condition_id for _, condition_id in results]
+
+    def search_markets(self, query: str = "", **filters) -> list[dict]:
+        """
+        Same as search, returning the markets
+        """
+        return [self.markets[c] for c in self.search(query, **filters)]
+
+    def get(self, condition_id: str) -> Optional[dict]:
+        return self.markets.get(condition_id)
+
+    def __contains__(self, condition_id: str) -> bool:
+        return condition_id in self.markets
+
+    def __len__(self):
+        return len(self.markets)
@@ -0,0 +1,180 @@
+from array import array
+from typing import Iterable
+
+from ..clob_types import OrderBookSummary, OrderSummary
+from ..order_builder.constants import BUY, SELL
+from .depth import BookDepth
+
+
+def format_decimal(x: float) -> str:
+    """
+    Formats a parsed price or size back to the decimal string sent by the CLOB, e.g. 100.0 -> "100"
+    """
+    s = repr(x)
+    return s[:-2] if s.endswith(".0") else s
+
+
+# separates the prices, or the sizes, of the levels of a side
+SEPARATOR = ","
+
+
+def _join_levels(levels: list) -> tuple[str, str]:
+    return (
+        SEPARATOR.join([level["price"] for level in levels]),
+        SEPARATOR.join([level["size"] for level in levels]),
+    )
+
+
+def _split(text: str) -> list[str]:
+    return text.split(SEPARATOR) if text else []
+
+
+def _parse_floats(text: str) -> array:
+    return array("d", map(float, _split(text)))
+
+
+class CompactOrderBook:
+    """
+    Memory efficient order book: the price and size strings sent by the CLOB, e.g. "0.50",
+    are kept joined in one string per side and field instead of one OrderSummary per level
+    Conversions and hashes split them back, so they match the /book response exactly.
+    The float arrays used for depth are parsed on first use and kept
+    """
+
+    __slots__ = (
+        "market",
+        "asset_id",
+        "timestamp",
+        "hash",
+        "bid_price_text",
+        "bid_size_text",
+        "ask_price_text",
+        "ask_size_text",
+        "_floats",
+    )
+
+    def __init__(
+        self,
+        market: str,
+        asset_id: str,
+        timestamp: str,
+        hash: str,
+        bid_price_text: str,
+        bid_size_text: str,
+        ask_price_text: str,
+        ask_size_text: str,
+    ):
+        """
+        *_text: the prices, or sizes, of the levels of a side joined by SEPARATOR, in the order of the /book endpoint
+        """
+        self.market = market
+        self.asset_id = asset_id
+        self.timestamp = timestamp
+        self.hash = hash
+        self.bid_price_text = bid_price_text
+        self.bid_size_text = bid_size_text
+        self.ask_price_text = ask_price_text
+        self.ask_size_text = ask_size_text
+        # parsed float arrays, by text slot
+        self._floats: dict[str, array] = None
+
+    @classmethod
+    def from_raw(cls, raw_obs: dict) -> "CompactOrderBook":
+        """
+        Parses a raw orderbook, as returned by the /book endpoint
+        """
+        bid_prices, bid_sizes = _join_levels(raw_obs["bids"])
+        ask_prices, ask_sizes = _join_levels(raw_obs["asks"])
+        return cls(
+            market=raw_obs["market"],
+            asset_id=raw_obs["asset_id"],
+            timestamp=raw_obs["timestamp"],
+            hash=raw_obs["hash"],
+            bid_price_text=bid_prices,
+            bid_size_text=bid_sizes,
+            ask_price_text=ask_prices,
+            ask_size_text=ask_sizes,
+        )
+
+    def _parsed(self, slot: str) -> array:
+        if self._floats is None:
+            self._floats = {}
+        floats = self._floats.get(slot)
+        if floats is None:
+            floats = self._floats[slot] = _parse_floats(getattr(self, slot))
+        return floats
+
+    @property
+    def bid_prices(self) -> array:
+        return self._parsed("bid_price_text")
+
+    @property
+    def bid_sizes(self) -> array:
+        return self._parsed("bid_size_text")
+
+    @property
+    def ask_prices(self) -> array:
+        return self._parsed("ask_price_text")
+
+    @property
+    def ask_sizes(self) -> array:
+        return self._parsed("ask_size_text")
+
+    def bid_strings(self) -> Iterable[tuple[str, str]]:
+        """
+        (price, size) strings of the bids, as sent by the CLOB
+        """
+        return zip(_split(self.bid_price_text), _split(self.bid_size_text))
+
+    def ask_strings(self) -> Iterable[tuple[str, str]]:
+        """
+        (price, size) strings of the asks, as sent by the CLOB
+        """
+        return zip(_split(self.ask_price_text), _split(self.ask_size_text))
+
+    @property
+    def bids(self) -> list[OrderSummary]:
+        return [
+            OrderSummary(price=price, size=size) for price, size in self.bid_strings()
+        ]
+
+    @property
+    def asks(self) -> list[OrderSummary]:
+        return [
+            OrderSummary(price=price, size=size) for price, size in self.ask_strings()
+        ]
+
+    def to_summary(self) -> OrderBookSummary:
+        """
+        Converts the book to an OrderBookSummary
+        """
+        return OrderBookSummary(
+            market=self.market,
+            asset_id=self.asset_id,
+            timestamp=self.timestamp,
+            bids=self.bids,
+            asks=self.asks,
+            hash=self.hash,
+        )
+
+    def depth(self, side: str) -> BookDepth:
+        """
+        Returns the depth consumed by a market order on the given side, see BookDepth.from_positions
+        """
+        if side == BUY:
+            return BookDepth(BUY, self.ask_prices.tolist(), self.ask_sizes.tolist())
+        if side == SELL:
+            return BookDepth(
+                SELL, self.bid_prices.tolist()[::-1], self.bid_sizes.tolist()[::-1]
+            )
+        raise ValueError(f"side must be '{BUY}' or '{SELL}'")
+
+    def __repr__(self):
+        return "CompactOrderBook(market={}, asset_id={}, timestamp={}, bids={}, asks={}, hash={})".format(
+            self.market,
+            self.asset_id,
+            self.timestamp,
+            len(_split(self.bid_price_text)),
+            len(_split(self.ask_price_text)),
+            self.hash,
+        )
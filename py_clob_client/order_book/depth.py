@@ -0,0 +1,117 @@
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Optional
+
+from ..clob_types import OrderSummary
+from ..order_builder.constants import BUY, SELL
+
+
+class BookDepth:
+    """
+    Numeric view of the side of an order book consumed by a market order
+    Prices and sizes are parsed once, cumulative sizes and notionals are precomputed
+    so any number of amounts can be evaluated with a binary search each
+    """
+
+    def __init__(self, side: str, prices: list[float], sizes: list[float]):
+        """
+        side: side of the market order, BUY consumes asks and SELL consumes bids
+        prices, sizes: levels in matching order
+        """
+        if side not in (BUY, SELL):
+            raise ValueError(f"side must be '{BUY}' or '{SELL}'")
+
+        self.side = side
+        self.prices = prices
+        self.sizes = sizes
+        self.cum_sizes = list(accumulate(sizes))
+        self.cum_notionals = list(
+            accumulate(price * size for price, size in zip(prices, sizes))
+        )
+
+        # levels sorted by price, used to query the depth at a limit price
+        levels = sorted(zip(prices, sizes))
+        self.sorted_prices = [price for price, _ in levels]
+        self.sorted_cum_sizes = list(accumulate(size for _, size in levels))
+
+    @classmethod
+    def from_positions(cls, side: str, positions: list[OrderSummary]) -> "BookDepth":
+        """
+        Builds the depth from the asks (BUY) or the bids (SELL) of an OrderBookSummary
+        Levels are matched in the same order as OrderBuilder.calculate_buy_market_price
+        and OrderBuilder.calculate_sell_market_price
+        """
+        positions = positions or []
+        if side == SELL:
+            positions = list(reversed(positions))
+        return cls(
+            side,
+            [float(p.price) for p in positions],
+            [float(p.size) for p in positions],
+        )
+
+    @property
+    def cumulative(self) -> list[float]:
+        """
+        Cumulative amounts matched by a market order: notional for BUY, shares for SELL
+        """
+        return self.cum_notionals if self.side == BUY else self.cum_sizes
+
+    def market_prices(self, amounts: list[float]) -> list[Optional[float]]:
+        """
+        Price of the last level touched when matching each amount, None if the book is too thin
+        BUY amounts are in collateral, SELL amounts in shares, as in MarketOrderArgs
+        """
+        cumulative = self.cumulative
+        prices = []
+        for amount in amounts:
+            i = bisect_left(cumulative, amount)
+            prices.append(self.prices[i] if i < len(cumulative) else None)
+        return prices
+
+    def vwaps(self, amounts: list[float]) -> list[Optional[float]]:
+        """
+        Volume weighted average fill price of each amount, None if the book is too thin
+        """
+        cumulative = self.cumulative
+        vwaps = []
+        for amount in amounts:
+            i = bisect_left(cumulative, amount)
+            if i >= len(cumulative) or amount <= 0:
+                vwaps.append(None)
+                continue
+
+            prev_sizes = self.cum_sizes[i - 1] if i > 0 else 0.0
+            prev_notionals = self.cum_notionals[i - 1] if i > 0 else 0.0
+            if self.side == BUY:
+                shares = prev_sizes + (amount - prev_notionals) / self.prices[i]
+                vwaps.append(amount / shares)
+            else:
+                notional = prev_notionals + (amount - prev_sizes) * self.prices[i]
+                vwaps.append(notional / amount)
+        return vwaps
+
+    def slippages(self, amounts: list[float]) -> list[Optional[float]]:
+        """
+        Distance between the vwap of each amount and the price of the first level
+        """
+        return [
+            abs(vwap - self.prices[0]) if vwap is not None else None
+            for vwap in self.vwaps(amounts)
+        ]
+
+    def depths_at_prices(self, limit_prices: list[float]) -> list[float]:
+        """
+        Shares available at or better than each limit price
+        At or below the limit for BUY, at or above for SELL
+        """
+        depths = []
+        total = self.sorted_cum_sizes[-1] if self.sorted_cum_sizes else 0.0
+        for limit_price in limit_prices:
+            if self.side == BUY:
+                i = bisect_right(self.sorted_prices, limit_price)
+                depths.append(self.sorted_cum_sizes[i - 1] if i > 0 else 0.0)
+            else:
+                i = bisect_left(self.sorted_prices, limit_price)
+                depths.append(total - (self.sorted_cum_sizes[i - 1] if i > 0 else 0.0))
+        return depths
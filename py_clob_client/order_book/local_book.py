@@ -0,0 +1,362 @@
+import hashlib
+import logging
+from bisect import bisect_left, insort
+from typing import Callable, Optional
+
+from ..clob_types import OrderBookSummary, OrderSummary
+from ..order_builder.constants import BUY, SELL
+from ..utilities import book_hash_message, encode_book_levels
+from .depth import BookDepth
+
+logger = logging.getLogger(__name__)
+
+BOOK_EVENT = "book"
+PRICE_CHANGE_EVENT = "price_change"
+
+
+class _BookSide:
+    """
+    Price levels of one side of the book, sorted by price ascending
+    The decimal strings sent by the CLOB are kept so the book hash can be recomputed,
+    and the levels are listed ascending, or descending if reverse, like the /book endpoint
+    Inserting or removing a level moves the prices after it, O(n) in the number of levels,
+    which stays cheap for the few hundred levels of a CLOB book
+    """
+
+    __slots__ = ("prices", "levels", "reverse", "_encoded")
+
+    def __init__(self, reverse: bool = False):
+        self.prices: list[float] = []
+        self.levels: dict[float, tuple[str, str]] = {}
+        self.reverse = reverse
+        # json of the levels hashed by the CLOB, reset by every change
+        self._encoded: Optional[str] = None
+
+    def clear(self):
+        self.prices.clear()
+        self.levels.clear()
+        self._encoded = None
+
+    def set(self, price: str, size: str):
+        """
+        Sets the size of a level, a size of 0 removes it
+        """
+        key = float(price)
+        self._encoded = None
+        if float(size) == 0:
+            if self.levels.pop(key, None) is not None:
+                del self.prices[bisect_left(self.prices, key)]
+            return
+
+        if key not in self.levels:
+            insort(self.prices, key)
+        self.levels[key] = (price, size)
+
+    def ordered(self) -> list[tuple[str, str]]:
+        prices = reversed(self.prices) if self.reverse else self.prices
+        return [self.levels[p] for p in prices]
+
+    def encoded(self) -> str:
+        """
+        Json of the levels as hashed by the CLOB, cached until the side changes
+        """
+        if self._encoded is None:
+            self._encoded = encode_book_levels(self.ordered())
+        return self._encoded
+
+    def summaries(self) -> list[OrderSummary]:
+        return [OrderSummary(price=price, size=size) for price, size in self.ordered()]
+
+    def sizes(self, prices: list[float]) -> list[float]:
+        return [float(self.levels[p][1]) for p in prices]
+
+    def __len__(self):
+        return len(self.prices)
+
+
+class LocalOrderBook:
+    """
+    Order book of a token kept up to date from the deltas of the market websocket channel
+    The book is seeded from a snapshot, REST or websocket, and every delta carrying a hash
+    is checked against it. On a mismatch, or a delta received before any snapshot,
+    the book is resynced from resync if given, otherwise it is marked out of sync
+    and ignores deltas until the next snapshot. A failed resync is logged and also leaves
+    the book out of sync
+    After a resync, the book is unverified until a delta hash matches or a websocket snapshot
+    is received, deltas without a hash applied meanwhile are logged
+    """
+
+    def __init__(
+        self,
+        asset_id: str,
+        resync: Callable[[str], OrderBookSummary] = None,
+        verify_hash: bool = True,
+    ):
+        """
+        asset_id: token id of the book
+        resync: fetches a fresh snapshot of the book, e.g. ClobClient.get_order_book
+        verify_hash: check the hash sent with each delta
+        """
+        self.asset_id = asset_id
+        self.resync = resync
+        self.verify_hash = verify_hash
+
+        self.market: Optional[str] = None
+        self.timestamp: Optional[str] = None
+        self.hash: Optional[str] = None
+        self.synced = False
+        self.verified = False
+        self.bids = _BookSide()
+        self.asks = _BookSide(reverse=True)
+
+    def seed(self, orderbook: OrderBookSummary, verified: bool = True):
+        """
+        Replaces the content of the book with a snapshot
+        verified: whether the snapshot is known to match the deltas that follow it
+        """
+        self.bids.clear()
+        self.asks.clear()
+        for level in orderbook.bids or []:
+            self.bids.set(level.price, level.size)
+        for level in orderbook.asks or []:
+            self.asks.set(level.price, level.size)
+
+        self.market = orderbook.market
+        self.timestamp = orderbook.timestamp
+        self.hash = orderbook.hash
+        self.synced = True
+        self.verified = verified
+
+    def apply(self, message: dict) -> bool:
+        """
+        Applies a message of the market channel for this asset
+        Returns whether the book is in sync afterwards
+        """
+        event_type = message.get("event_type")
+        if event_type == BOOK_EVENT:
+            self.seed(
+                OrderBookSummary(
+                    market=message.get("market"),
+                    asset_id=message.get("asset_id", self.asset_id),
+                    timestamp=message.get("timestamp"),
+                    bids=_parse_levels(message.get("bids", message.get("buys"))),
+                    asks=_parse_levels(message.get("asks", message.get("sells"))),
+                    hash=message.get("hash"),
+                )
+            )
+            return True
+
+        if event_type == PRICE_CHANGE_EVENT:
+            changes = message.get("changes")
+            if changes is None:
+                changes = [
+                    change
+                    for change in message.get("price_changes", [])
+                    if change.get("asset_id") == self.asset_id
+                ]
+            hash = message.get("hash")
+            if hash is None and changes:
+                hash = changes[-1].get("hash")
+            return self.apply_changes(changes, message.get("timestamp"), hash)
+
+        return self.synced
+
+    def apply_changes(
+        self, changes: list[dict], timestamp: str = None, hash: str = None
+    ) -> bool:
+        """
+        Applies price level changes, each with a price, a side (BUY for bids, SELL for asks) and a new size
+        Returns whether the book is in sync afterwards
+        """
+        if not self.synced:
+            return self._resync("delta received before a snapshot")
+
+        if (
+            timestamp is not None
+            and self.timestamp
+            and int(timestamp) < int(self.timestamp)
+        ):
+            # older than the current book, already included in it
+            return True
+
+        for change in changes:
+            side = self.bids if change["side"] == BUY else self.asks
+            side.set(change["price"], change["size"])
+
+        if timestamp is not None:
+            self.timestamp = timestamp
+
+        if hash is None:
+            if self.verify_hash and not self.verified:
+                logger.warning(
+                    "order book %s: delta without a hash applied after a resync",
+                    self.asset_id,
+                )
+            return True
+
+        self.hash = hash
+        if self.verify_hash:
+            if self.compute_hash() != hash:
+                return self._resync("hash mismatch")
+            self.verified = True
+        return True
+
+    def _resync(self, reason: str) -> bool:
+        logger.warning("order book %s out of sync: %s", self.asset_id, reason)
+        self.synced = False
+        if self.resync is None:
+            return False
+        try:
+            snapshot = self.resync(self.asset_id)
+        except Exception:
+            logger.exception("order book %s resync failed", self.asset_id)
+            return False
+        # deltas may have been missed between the snapshot and the next message
+        self.seed(snapshot, verified=False)
+        return True
+
+    def compute_hash(self) -> str:
+        """
+        Hash of the current content of the book, see generate_orderbook_summary_hash
+        Only the sides changed since the last call are encoded again
+        """
+        message = book_hash_message(
+            self.market,
+            self.asset_id,
+            self.timestamp,
+            self.bids.encoded(),
+            self.asks.encoded(),
+        )
+        return hashlib.sha1(message).hexdigest()
+
+    def to_summary(self) -> OrderBookSummary:
+        """
+        Converts the book to an OrderBookSummary, levels in the same order as the /book endpoint
+        """
+        return OrderBookSummary(
+            market=self.market,
+            asset_id=self.asset_id,
+            timestamp=self.timestamp,
+            bids=self.bids.summaries(),
+            asks=self.asks.summaries(),
+            hash=self.hash,
+        )
+
+    @property
+    def best_bid(self) -> Optional[float]:
+        return self.bids.prices[-1] if self.bids.prices else None
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        return self.asks.prices[0] if self.asks.prices else None
+
+    @property
+    def midpoint(self) -> Optional[float]:
+        if not self.bids.prices or not self.asks.prices:
+            return None
+        return (self.best_bid + self.best_ask) / 2
+
+    @property
+    def spread(self) -> Optional[float]:
+        if not self.bids.prices or not self.asks.prices:
+            return None
+        return self.best_ask - self.best_bid
+
+    def size_at(self, side: str, price: float) -> float:
+        """
+        Size resting at a price level, side BUY for the bids and SELL for the asks
+        """
+        level = (self.bids if side == BUY else self.asks).levels.get(float(price))
+        return float(level[1]) if level is not None else 0.0
+
+    def depth(self, side: str) -> BookDepth:
+        """
+        Returns the depth consumed by a market order on the given side, see BookDepth.from_positions
+        """
+        if side == BUY:
+            prices = self.asks.prices[::-1]
+            return BookDepth(BUY, prices, self.asks.sizes(prices))
+        if side == SELL:
+            prices = self.bids.prices[::-1]
+            return BookDepth(SELL, prices, self.bids.sizes(prices))
+        raise ValueError(f"side must be '{BUY}' or '{SELL}'")
+
+    def market_price(self, side: str, amount: float) -> Optional[float]:
+        """
+        Price of a market order of the given amount, None if the book is too thin
+        """
+        return self.depth(side).market_prices([amount])[0]
+
+    def __repr__(self):
+        return "LocalOrderBook(asset_id={}, synced={}, bids={}, asks={}, timestamp={})".format(
+            self.asset_id,
+            self.synced,
+            len(self.bids),
+            len(self.asks),
+            self.timestamp,
+        )
+
+
+class LocalOrderBooks:
+    """
+    Local order books of several tokens, fed with the messages of the market channel
+    """
+
+    def __init__(
+        self,
+        resync: Callable[[str], OrderBookSummary] = None,
+        verify_hash: bool = True,
+    ):
+        self.resync = resync
+        self.verify_hash = verify_hash
+        self.books: dict[str, LocalOrderBook] = {}
+
+    def book(self, asset_id: str) -> LocalOrderBook:
+        """
+        Returns the book of a token, created on first use
+        """
+        book = self.books.get(asset_id)
+        if book is None:
+            book = LocalOrderBook(asset_id, self.resync, self.verify_hash)
+            self.books[asset_id] = book
+        return book
+
+    def apply(self, message) -> list[str]:
+        """
+        Applies a message, or a list of messages, of the market channel
+        Returns the asset ids of the books that changed
+        """
+        if isinstance(message, list):
+            updated = []
+            for m in message:
+                updated.extend(self.apply(m))
+            return updated
+
+        if message.get("event_type") not in (BOOK_EVENT, PRICE_CHANGE_EVENT):
+            return []
+
+        if "price_changes" in message:
+            asset_ids = list(
+                dict.fromkeys(c.get("asset_id") for c in message["price_changes"])
+            )
+        else:
+            asset_ids = [message.get("asset_id")]
+
+        for asset_id in asset_ids:
+            self.book(asset_id).apply(message)
+        return asset_ids
+
+    def __getitem__(self, asset_id: str) -> LocalOrderBook:
+        return self.books[asset_id]
+
+    def __contains__(self, asset_id: str) -> bool:
+        return asset_id in self.books
+
+    def __len__(self):
+        return len(self.books)
+
+
+def _parse_levels(levels: Optional[list]) -> list[OrderSummary]:
+    return [
+        OrderSummary(price=level["price"], size=level["size"]) for level in levels or []
+    ]
@@ -1,7 +1,13 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+from eth_utils import keccak
 from py_order_utils.builders import OrderBuilder as UtilsOrderBuilder
 from py_order_utils.signer import Signer as UtilsSigner
+from py_order_utils.utils import prepend_zx
 from py_order_utils.model import (
     EOA,
+    Order,
     OrderData,
     SignedOrder,
     BUY as UtilsBuy,
@@ -34,6 +40,24 @@ ROUNDING_CONFIG: dict[TickSize, RoundConfig] = {
     "0.0001": RoundConfig(price=4, size=2, amount=6),
 }
 
+ORDER_TYPE_HASH = Order.type_hash()
+
+
+class ExchangeOrderBuilder(UtilsOrderBuilder):
+    """
+    Order builder for a single exchange which hashes its domain separator only once
+    """
+
+    def __init__(self, exchange_address: str, chain_id: int, signer: UtilsSigner):
+        super().__init__(exchange_address, chain_id, signer)
+        self.domain_separator_hash = self.domain_separator.hash_struct()
+
+    def _create_struct_hash(self, order: Order):
+        struct_hash = keccak(ORDER_TYPE_HASH + order.encode_value())
+        return prepend_zx(
+            keccak(b"\x19\x01" + self.domain_separator_hash + struct_hash).hex()
+        )
+
 
 class OrderBuilder:
     def __init__(self, signer: Signer, sig_type=None, funder=None):
@@ -47,6 +71,26 @@ class OrderBuilder:
         # Defaults to the address of the signer
         self.funder = funder if funder is not None else self.signer.address()
 
+        # signer and exchange builders reused across orders
+        self.signer_address = self.signer.address()
+        self.utils_signer = UtilsSigner(key=self.signer.private_key)
+        self.__exchange_builders = {}
+
+    def get_exchange_builder(self, neg_risk: bool) -> ExchangeOrderBuilder:
+        """
+        Returns the cached order builder of the exchange, (neg risk or not) for the chain of the signer
+        """
+        chain_id = self.signer.get_chain_id()
+        key = (chain_id, bool(neg_risk))
+        exchange_builder = self.__exchange_builders.get(key)
+        if exchange_builder is None:
+            contract_config = get_contract_config(chain_id, neg_risk)
+            exchange_builder = ExchangeOrderBuilder(
+                contract_config.exchange, chain_id, self.utils_signer
+            )
+            self.__exchange_builders[key] = exchange_builder
+        return exchange_builder
+
     def get_order_amounts(
         self, side: str, size: float, price: float, round_config: RoundConfig
     ):
@@ -137,22 +181,47 @@ class OrderBuilder:
             side=side,
             feeRateBps=str(order_args.fee_rate_bps),
             nonce=str(order_args.nonce),
-            signer=self.signer.address(),
+            signer=self.signer_address,
             expiration=str(order_args.expiration),
             signatureType=self.sig_type,
         )
 
-        contract_config = get_contract_config(
-            self.signer.get_chain_id(), options.neg_risk
-        )
-
-        order_builder = UtilsOrderBuilder(
-            contract_config.exchange,
-            self.signer.get_chain_id(),
-            UtilsSigner(key=self.signer.private_key),
-        )
+        return self.get_exchange_builder(options.neg_risk).build_signed_order(data)
 
-        return order_builder.build_signed_order(data)
+    def create_orders(
+        self,
+        orders: list[tuple[OrderArgs, CreateOrderOptions]],
+        executor: Executor = None,
+    ) -> list[SignedOrder]:
+        """
+        Creates and signs a list of orders, preserving their order
+        Signing is CPU bound: pass the pool of signing_pool() to sign the orders in worker processes,
+        a thread pool signs them with this builder
+        """
+        if executor is None or len(orders) < 2:
+            return [
+                self.create_order(order_args, options) for order_args, options in orders
+            ]
+
+        order_args = [order_args for order_args, _ in orders]
+        options = [options for _, options in orders]
+        if not isinstance(executor, ProcessPoolExecutor):
+            return list(executor.map(self.create_order, order_args, options))
+
+        if not isinstance(executor, SigningPool):
+            raise ValueError(
+                "orders are signed in worker processes by a SigningPool, see signing_pool"
+            )
+        if executor.signer_address != self.signer_address:
+            raise ValueError("the signing pool belongs to another signer")
+        chunksize = max(1, len(orders) // (os.cpu_count() or 1))
+        return list(executor.map(_sign_order, order_args, options, chunksize=chunksize))
+
+    def signing_pool(self, max_workers: int = None) -> "SigningPool":
+        """
+        Returns a process pool signing the orders of this builder, see create_orders
+        """
+        return SigningPool(self, max_workers)
 
     def create_market_order(
         self, order_args: MarketOrderArgs, options: CreateOrderOptions
@@ -176,22 +245,12 @@ class OrderBuilder:
             side=side,
             feeRateBps=str(order_args.fee_rate_bps),
             nonce=str(order_args.nonce),
-            signer=self.signer.address(),
+            signer=self.signer_address,
             expiration="0",
             signatureType=self.sig_type,
         )
 
-        contract_config = get_contract_config(
-            self.signer.get_chain_id(), options.neg_risk
-        )
-
-        order_builder = UtilsOrderBuilder(
-            contract_config.exchange,
-            self.signer.get_chain_id(),
-            UtilsSigner(key=self.signer.private_key),
-        )
-
-        return order_builder.build_signed_order(data)
+        return self.get_exchange_builder(options.neg_risk).build_signed_order(data)
 
     def calculate_buy_market_price(
         self, positions: list[OrderSummary], amount_to_match: float
@@ -212,3 +271,46 @@ class OrderBuilder:
             if sum >= amount_to_match:
                 return float(p.price)
         raise Exception("no match")
+
+
+class SigningPool(ProcessPoolExecutor):
+    """
+    Process pool whose workers sign orders for one signer
+
+        with builder.signing_pool() as pool:
+            signed_orders = builder.create_orders(orders, pool)
+
+    The signing config, private key included, is sent once to each worker when it starts,
+    not with every order, and only lives in the worker processes
+    """
+
+    def __init__(self, builder: OrderBuilder, max_workers: int = None):
+        self.signer_address = builder.signer_address
+        super().__init__(
+            max_workers,
+            initializer=_init_worker,
+            initargs=(
+                builder.signer.private_key,
+                builder.signer.get_chain_id(),
+                builder.sig_type,
+                builder.funder,
+            ),
+        )
+
+
+# order builder of a SigningPool worker, only set inside the worker processes
+_worker_builder = None
+
+
+def _init_worker(private_key: str, chain_id: int, sig_type: int, funder: str):
+    global _worker_builder
+    _worker_builder = OrderBuilder(
+        Signer(private_key, chain_id), sig_type=sig_type, funder=funder
+    )
+
+
+def _sign_order(order_args: OrderArgs, options: CreateOrderOptions):
+    """
+    Signs an order inside a worker process of a SigningPool
+    """
+    return _worker_builder.create_order(order_args, options)
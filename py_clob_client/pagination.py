@@ -0,0 +1,188 @@
+import asyncio
+import contextvars
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Optional
+
+from .constants import END_CURSOR, START_CURSOR
+from .utilities import decode_cursor, encode_cursor
+
+
+def _submit(executor: ThreadPoolExecutor, fetch: Callable[[str], dict], cursor: str):
+    # runs in a copy of the caller context, so the fetch sees its deadline_scope
+    return executor.submit(contextvars.copy_context().run, fetch, cursor)
+
+
+def cursor_step(cursor: str, next_cursor: str) -> Optional[int]:
+    """
+    Returns the page size between two offset cursors, None if the cursors can't be predicted
+    """
+    offset, next_offset = decode_cursor(cursor), decode_cursor(next_cursor)
+    if offset is None or next_offset is None or next_offset <= offset:
+        return None
+    return next_offset - offset
+
+
+def iter_pages(
+    fetch: Callable[[str], dict], next_cursor: str = START_CURSOR, concurrency: int = 1
+):
+    """
+    Walks every page starting at next_cursor and yields the records in order
+    fetch: returns the raw page ({"data": [...], "next_cursor": ...}) for a cursor
+    concurrency: with more than one worker, upcoming cursors are predicted from the offset
+    encoded in them and fetched in parallel. Falls back to a serial walk when the cursors
+    are not offsets
+    """
+    cursor = next_cursor if next_cursor else START_CURSOR
+    response = fetch(cursor)
+    yield from response["data"]
+    next_cursor = response["next_cursor"]
+
+    executor = ThreadPoolExecutor(max_workers=concurrency) if concurrency > 1 else None
+    try:
+        while next_cursor and next_cursor != END_CURSOR:
+            step = cursor_step(cursor, next_cursor)
+            if executor is None or step is None:
+                cursor = next_cursor
+                response = fetch(cursor)
+                yield from response["data"]
+                next_cursor = response["next_cursor"]
+                continue
+
+            pending = deque()
+            offset = decode_cursor(next_cursor)
+            for _ in range(concurrency):
+                pending.append(
+                    (offset, _submit(executor, fetch, encode_cursor(offset)))
+                )
+                offset += step
+
+            while pending:
+                page_offset, future = pending.popleft()
+                response = future.result()
+                yield from response["data"]
+                cursor, next_cursor = (
+                    encode_cursor(page_offset),
+                    response["next_cursor"],
+                )
+                if next_cursor != encode_cursor(page_offset + step):
+                    # last page or unexpected cursor, discard the predictions
+                    break
+                pending.append(
+                    (offset, _submit(executor, fetch, encode_cursor(offset)))
+                )
+                offset += step
+
+            for _, future in pending:
+                future.cancel()
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(
+    fetch: Callable[[str], Awaitable[dict]],
+    next_cursor: str = START_CURSOR,
+    concurrency: int = 1,
+):
+    """
+    Async version of iter_pages, predicted pages are fetched as concurrent tasks
+    """
+    cursor = next_cursor if next_cursor else START_CURSOR
+    response = await fetch(cursor)
+    for record in response["data"]:
+        yield record
+    next_cursor = response["next_cursor"]
+
+    pending = deque()
+    try:
+        while next_cursor and next_cursor != END_CURSOR:
+            step = cursor_step(cursor, next_cursor)
+            if concurrency <= 1 or step is None:
+                cursor = next_cursor
+                response = await fetch(cursor)
+                for record in response["data"]:
+                    yield record
+                next_cursor = response["next_cursor"]
+                continue
+
+            offset = decode_cursor(next_cursor)
+            for _ in range(concurrency):
+                task = asyncio.ensure_future(fetch(encode_cursor(offset)))
+                pending.append((offset, task))
+                offset += step
+
+            while pending:
+                page_offset, task = pending.popleft()
+                response = await task
+                for record in response["data"]:
+                    yield record
+                cursor, next_cursor = (
+                    encode_cursor(page_offset),
+                    response["next_cursor"],
+                )
+                if next_cursor != encode_cursor(page_offset + step):
+                    break
+                task = asyncio.ensure_future(fetch(encode_cursor(offset)))
+                pending.append((offset, task))
+                offset += step
+
+            _cancel_tasks(pending)
+    finally:
+        _cancel_tasks(pending)
+
+
+def _cancel_tasks(pending: deque):
+    while pending:
+        _, task = pending.popleft()
+        if task.done():
+            if not task.cancelled():
+                # retrieve the outcome of predicted pages past the end
+                task.exception()
+        else:
+            task.cancel()
+
+
+def iter_prefetched_pages(
+    fetch: Callable[[str], dict], next_cursor: str = START_CURSOR
+):
+    """
+    Walks every page starting at next_cursor and yields the records in order
+    The next page is fetched in the background while the records of the current one are consumed
+    """
+    cursor = next_cursor if next_cursor else START_CURSOR
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        future = _submit(executor, fetch, cursor)
+        while future is not None:
+            response = future.result()
+            next_cursor = response["next_cursor"]
+            future = None
+            if next_cursor and next_cursor != END_CURSOR:
+                future = _submit(executor, fetch, next_cursor)
+            yield from response["data"]
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_prefetched_pages(
+    fetch: Callable[[str], Awaitable[dict]], next_cursor: str = START_CURSOR
+):
+    """
+    Async version of iter_prefetched_pages
+    """
+    pending = deque()
+    try:
+        pending.append(
+            (None, asyncio.ensure_future(fetch(next_cursor or START_CURSOR)))
+        )
+        while pending:
+            _, task = pending.popleft()
+            response = await task
+            next_cursor = response["next_cursor"]
+            if next_cursor and next_cursor != END_CURSOR:
+                pending.append((None, asyncio.ensure_future(fetch(next_cursor))))
+            for record in response["data"]:
+                yield record
+    finally:
+        _cancel_tasks(pending)
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from poly_eip712_structs import make_domain
 from eth_utils import keccak
 from py_order_utils.utils import prepend_zx
@@ -9,20 +11,43 @@ CLOB_DOMAIN_NAME = "ClobAuthDomain"
 CLOB_VERSION = "1"
 MSG_TO_SIGN = "This message attests that I control the given wallet"
 
+CLOB_AUTH_TYPE_HASH = ClobAuth.type_hash()
+MSG_TO_SIGN_HASH = keccak(text=MSG_TO_SIGN)
+
 
 def get_clob_auth_domain(chain_id: int):
     return make_domain(name=CLOB_DOMAIN_NAME, version=CLOB_VERSION, chainId=chain_id)
 
 
-def sign_clob_auth_message(signer: Signer, timestamp: int, nonce: int) -> str:
-    clob_auth_msg = ClobAuth(
-        address=signer.address(),
-        timestamp=str(timestamp),
-        nonce=nonce,
-        message=MSG_TO_SIGN,
+@lru_cache(maxsize=None)
+def get_clob_auth_domain_separator(chain_id: int) -> bytes:
+    """
+    Returns the hash of the ClobAuth domain, computed once per chain id
+    """
+    return get_clob_auth_domain(chain_id).hash_struct()
+
+
+def clob_auth_struct_hash(address: str, timestamp: int, nonce: int) -> bytes:
+    """
+    Hashes a ClobAuth struct from its ABI encoded fields
+    Equivalent to hashing a ClobAuth EIP712Struct
+    """
+    return keccak(
+        CLOB_AUTH_TYPE_HASH
+        + bytes.fromhex(address[2:]).rjust(32, b"\0")
+        + keccak(text=str(timestamp))
+        + nonce.to_bytes(32, "big")
+        + MSG_TO_SIGN_HASH
     )
+
+
+def sign_clob_auth_message(signer: Signer, timestamp: int, nonce: int) -> str:
     chain_id = signer.get_chain_id()
     auth_struct_hash = prepend_zx(
-        keccak(clob_auth_msg.signable_bytes(get_clob_auth_domain(chain_id))).hex()
+        keccak(
+            b"\x19\x01"
+            + get_clob_auth_domain_separator(chain_id)
+            + clob_auth_struct_hash(signer.address(), timestamp, nonce)
+        ).hex()
     )
     return prepend_zx(signer.sign(auth_struct_hash))
@@ -3,20 +3,54 @@ import hashlib
 import base64
 
 
-def build_hmac_signature(
-    secret: str, timestamp: str, method: str, requestPath: str, body=None
-):
+def build_hmac_message(
+    timestamp: str, method: str, requestPath: str, body=None
+) -> bytes:
     """
-    Creates an HMAC signature by signing a payload with the secret
+    Builds the message signed by the HMAC signature
+    A body already serialized to bytes is signed as is
     """
-    base64_secret = base64.urlsafe_b64decode(secret)
     message = str(timestamp) + str(method) + str(requestPath)
+    if isinstance(body, bytes):
+        return bytes(message, "utf-8") + body
     if body:
         # NOTE: Necessary to replace single quotes with double quotes
         # to generate the same hmac message as go and typescript
         message += str(body).replace("'", '"')
+    return bytes(message, "utf-8")
 
-    h = hmac.new(base64_secret, bytes(message, "utf-8"), hashlib.sha256)
+
+def build_hmac_signature(
+    secret: str, timestamp: str, method: str, requestPath: str, body=None
+):
+    """
+    Creates an HMAC signature by signing a payload with the secret
+    """
+    base64_secret = base64.urlsafe_b64decode(secret)
+    message = build_hmac_message(timestamp, method, requestPath, body)
+
+    h = hmac.new(base64_secret, message, hashlib.sha256)
 
     # ensure base64 encoded
     return (base64.urlsafe_b64encode(h.digest())).decode("utf-8")
+
+
+class HmacSigner:
+    """
+    Signs payloads with a secret which is decoded and keyed only once
+    """
+
+    def __init__(self, secret: str):
+        self._hmac = hmac.new(
+            base64.urlsafe_b64decode(secret), digestmod=hashlib.sha256
+        )
+
+    def sign(self, timestamp: str, method: str, requestPath: str, body=None) -> str:
+        """
+        Creates an HMAC signature, equivalent to build_hmac_signature
+        """
+        h = self._hmac.copy()
+        h.update(build_hmac_message(timestamp, method, requestPath, body))
+
+        # ensure base64 encoded
+        return (base64.urlsafe_b64encode(h.digest())).decode("utf-8")
@@ -1,6 +1,22 @@
+import base64
+import binascii
 import hashlib
+import random
+from concurrent.futures import Executor
+from dataclasses import fields
+from json import dumps
+from json.encoder import encode_basestring_ascii
+from typing import Iterable, Optional, Union
 
-from .clob_types import OrderBookSummary, OrderSummary, TickSize
+from .clob_types import (
+    MakerOrder,
+    OpenOrder,
+    OrderBookSummary,
+    OrderSummary,
+    TickSize,
+    Trade,
+)
+from .order_book.compact import CompactOrderBook
 
 
 def parse_raw_orderbook_summary(raw_obs: any) -> OrderBookSummary:
@@ -24,13 +40,144 @@ def parse_raw_orderbook_summary(raw_obs: any) -> OrderBookSummary:
     return orderbookSummary
 
 
+_OPEN_ORDER_FIELDS = [f.name for f in fields(OpenOrder) if f.name != "id"]
+_TRADE_FIELDS = [f.name for f in fields(Trade) if f.name != "id"]
+_MAKER_ORDER_FIELDS = [f.name for f in fields(MakerOrder) if f.name != "order_id"]
+
+
+def parse_raw_open_order(raw_order: dict) -> OpenOrder:
+    return OpenOrder(
+        id=raw_order["id"],
+        **{f: raw_order.get(f) for f in _OPEN_ORDER_FIELDS},
+    )
+
+
+def parse_raw_trade(raw_trade: dict) -> Trade:
+    trade = Trade(id=raw_trade["id"], **{f: raw_trade.get(f) for f in _TRADE_FIELDS})
+    if trade.maker_orders is not None:
+        trade.maker_orders = [
+            MakerOrder(
+                order_id=m["order_id"],
+                **{f: m.get(f) for f in _MAKER_ORDER_FIELDS},
+            )
+            for m in trade.maker_orders
+        ]
+    return trade
+
+
 def generate_orderbook_summary_hash(orderbook: OrderBookSummary) -> str:
-    orderbook.hash = ""
-    hash = hashlib.sha1(str(orderbook.json).encode("utf-8")).hexdigest()
+    hash = orderbook_summary_hash(orderbook)
     orderbook.hash = hash
     return hash
 
 
+def _encode_json_value(value) -> str:
+    if isinstance(value, str):
+        return encode_basestring_ascii(value)
+    return dumps(value)
+
+
+def encode_book_levels(levels: Optional[Iterable[tuple]]) -> str:
+    """
+    Compact json of (price, size) levels, as hashed by the CLOB
+    """
+    if levels is None:
+        return "null"
+    return (
+        "["
+        + ",".join(
+            '{"price":'
+            + _encode_json_value(price)
+            + ',"size":'
+            + _encode_json_value(size)
+            + "}"
+            for price, size in levels
+        )
+        + "]"
+    )
+
+
+def orderbook_hash_message(
+    orderbook: Union[OrderBookSummary, CompactOrderBook]
+) -> bytes:
+    """
+    Builds the canonical bytes hashed by the CLOB: the compact json of the book with an empty hash
+    Written directly from the levels, the book is neither copied nor mutated
+    Compact books are hashed from the price and size strings received, missing levels are hashed as null
+    like generate_orderbook_summary_hash does
+    """
+    if isinstance(orderbook, CompactOrderBook):
+        bids = encode_book_levels(orderbook.bid_strings())
+        asks = encode_book_levels(orderbook.ask_strings())
+    else:
+        bids = encode_book_levels(
+            None
+            if orderbook.bids is None
+            else ((b.price, b.size) for b in orderbook.bids)
+        )
+        asks = encode_book_levels(
+            None
+            if orderbook.asks is None
+            else ((a.price, a.size) for a in orderbook.asks)
+        )
+
+    return book_hash_message(
+        orderbook.market, orderbook.asset_id, orderbook.timestamp, bids, asks
+    )
+
+
+def book_hash_message(
+    market: Optional[str],
+    asset_id: Optional[str],
+    timestamp: Optional[str],
+    bids: str,
+    asks: str,
+) -> bytes:
+    """
+    Builds the canonical bytes hashed by the CLOB from the levels already encoded by encode_book_levels
+    """
+    return (
+        '{"market":'
+        + _encode_json_value(market)
+        + ',"asset_id":'
+        + _encode_json_value(asset_id)
+        + ',"timestamp":'
+        + _encode_json_value(timestamp)
+        + ',"bids":'
+        + bids
+        + ',"asks":'
+        + asks
+        + ',"hash":""}'
+    ).encode("utf-8")
+
+
+def orderbook_summary_hash(orderbook: Union[OrderBookSummary, CompactOrderBook]) -> str:
+    """
+    Calculates the hash of the orderbook without modifying it
+    """
+    return hashlib.sha1(orderbook_hash_message(orderbook)).hexdigest()
+
+
+def verify_book_hash(orderbook: Union[OrderBookSummary, CompactOrderBook]) -> bool:
+    """
+    Checks that the hash sent with the orderbook matches its content
+    """
+    return orderbook_summary_hash(orderbook) == orderbook.hash
+
+
+def verify_book_hashes(
+    orderbooks: list[Union[OrderBookSummary, CompactOrderBook]],
+    executor: Executor = None,
+) -> list[bool]:
+    """
+    Checks the hashes of a batch of orderbooks, e.g. the result of get_order_books
+    If an executor is given, the books are hashed on it, hashlib releases the GIL on large books
+    """
+    if executor is None:
+        return [verify_book_hash(orderbook) for orderbook in orderbooks]
+    return list(executor.map(verify_book_hash, orderbooks))
+
+
 def order_to_json(order, owner, orderType) -> dict:
     return {"order": order.dict(), "owner": owner, "orderType": orderType}
 
@@ -39,5 +186,38 @@ def is_tick_size_smaller(a: TickSize, b: TickSize) -> bool:
     return float(a) < float(b)
 
 
+def is_tick_size_error(error) -> bool:
+    """
+    Whether an order was rejected by the server because of its tick size
+    """
+    message = str(error).lower()
+    return "tick size" in message or "tick_size" in message
+
+
 def price_valid(price: float, tick_size: TickSize) -> bool:
     return price >= float(tick_size) and price <= 1 - float(tick_size)
+
+
+def encode_cursor(offset: int) -> str:
+    """
+    Encodes an offset as a pagination cursor, e.g. 0 -> "MA=="
+    """
+    return base64.b64encode(str(offset).encode("utf-8")).decode("utf-8")
+
+
+def decode_cursor(cursor: str) -> Optional[int]:
+    """
+    Decodes the offset held by a pagination cursor, None if the cursor is not an offset
+    """
+    try:
+        return int(base64.b64decode(cursor, validate=True).decode("utf-8"))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        return None
+
+
+def backoff_delay(attempt: int, min_backoff: float, max_backoff: float) -> float:
+    """
+    Exponential backoff delay, with jitter over [delay / 2, delay]
+    """
+    delay = min(max_backoff, min_backoff * 2**attempt)
+    return delay / 2 + random.random() * delay / 2
@@ -0,0 +1,176 @@
+import asyncio
+import json
+import logging
+from typing import Awaitable, Callable, Optional
+
+try:
+    import websockets
+except ImportError:  # pragma: no cover
+    websockets = None
+
+from ..exceptions import PolyException
+from ..utilities import backoff_delay
+
+logger = logging.getLogger(__name__)
+
+WEBSOCKETS_UNAVAILABLE = (
+    "websockets is needed to use the websocket client: pip install websockets"
+)
+
+PING = "PING"
+PONG = "PONG"
+
+DEFAULT_PING_INTERVAL = 10
+DEFAULT_HEARTBEAT_TIMEOUT = 30
+DEFAULT_MIN_BACKOFF = 0.5
+DEFAULT_MAX_BACKOFF = 30
+
+
+class ManagedWebSocket:
+    """
+    Websocket connection kept open until closed
+    Reconnects with exponential backoff on any error or disconnect, calling on_open
+    on every connection so subscriptions can be resent, and sends a PING every
+    ping_interval seconds, the connection is recycled if nothing is received
+    for heartbeat_timeout seconds
+    """
+
+    def __init__(
+        self,
+        url: str,
+        on_message: Callable[[dict], None],
+        on_open: Callable[["ManagedWebSocket"], Awaitable[None]] = None,
+        ping_interval: float = DEFAULT_PING_INTERVAL,
+        heartbeat_timeout: float = DEFAULT_HEARTBEAT_TIMEOUT,
+        min_backoff: float = DEFAULT_MIN_BACKOFF,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+    ):
+        """
+        on_message: called with every decoded message, must not block
+        on_open: awaited after every (re)connection, before messages are read
+        """
+        if websockets is None:
+            raise PolyException(WEBSOCKETS_UNAVAILABLE)
+
+        self.url = url
+        self.on_message = on_message
+        self.on_open = on_open
+        self.ping_interval = ping_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+
+        self.reconnects = 0
+        self._ws = None
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self._last_received = 0.0
+
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None
+
+    def start(self) -> asyncio.Task:
+        """
+        Starts the connection in a background task
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def run(self):
+        """
+        Connects and reads messages until closed
+        """
+        loop = asyncio.get_running_loop()
+        attempt = 0
+        while not self._closed:
+            try:
+                async with websockets.connect(self.url, ping_interval=None) as ws:
+                    self._ws = ws
+                    self._last_received = loop.time()
+                    if self.on_open is not None:
+                        await self.on_open(self)
+                    attempt = 0
+
+                    heartbeat = asyncio.create_task(self._heartbeat(ws))
+                    try:
+                        async for raw in ws:
+                            self._last_received = loop.time()
+                            self._dispatch(raw)
+                    finally:
+                        heartbeat.cancel()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("websocket %s error: %r", self.url, e)
+            finally:
+                self._ws = None
+
+            if self._closed:
+                break
+
+            delay = backoff_delay(attempt, self.min_backoff, self.max_backoff)
+            attempt += 1
+            self.reconnects += 1
+            logger.info("websocket %s reconnecting in %.2fs", self.url, delay)
+            await asyncio.sleep(delay)
+
+    async def _heartbeat(self, ws):
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                await asyncio.sleep(self.ping_interval)
+                if loop.time() - self._last_received > self.heartbeat_timeout:
+                    logger.warning("websocket %s heartbeat timeout", self.url)
+                    await ws.close()
+                    return
+                await ws.send(PING)
+        except websockets.ConnectionClosed:
+            pass
+
+    def _dispatch(self, raw):
+        if raw == PONG:
+            return
+        try:
+            message = json.loads(raw)
+        except ValueError:
+            logger.warning("websocket %s unexpected message: %r", self.url, raw)
+            return
+
+        for m in message if isinstance(message, list) else [message]:
+            try:
+                self.on_message(m)
+            except Exception:
+                logger.exception("websocket %s message handler failed", self.url)
+
+    async def send(self, message) -> bool:
+        """
+        Sends a message if connected, dicts and lists are sent as json
+        Returns whether the message was sent
+        """
+        ws = self._ws
+        if ws is None:
+            return False
+        if not isinstance(message, str):
+            message = json.dumps(message)
+        try:
+            await ws.send(message)
+            return True
+        except websockets.ConnectionClosed:
+            return False
+
+    async def close(self):
+        """
+        Closes the connection and stops reconnecting
+        """
+        self._closed = True
+        if self._ws is not None:
+            await self._ws.close()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,117 @@
+import asyncio
+from collections import OrderedDict, deque
+from typing import Callable, Hashable
+
+from ..exceptions import PolyException
+
+# policies applied when a consumer queue is full
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+# keeps only the latest message per key, e.g. per event type and asset id
+# only for consumers that need the latest state, deltas must not be coalesced
+COALESCE = "coalesce"
+
+POLICIES = (DROP_OLDEST, DROP_NEWEST, COALESCE)
+
+CONSUMER_CLOSED = "The consumer queue is closed"
+
+
+def default_key(message: dict) -> Hashable:
+    return message.get("event_type"), message.get("asset_id")
+
+
+class ConsumerQueue:
+    """
+    Bounded queue of websocket messages for a single consumer
+    put never blocks, so a slow consumer cannot stall the connection feeding it,
+    messages are dropped or coalesced according to the policy instead
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1000,
+        policy: str = DROP_OLDEST,
+        key: Callable[[dict], Hashable] = default_key,
+    ):
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}")
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+
+        self.maxsize = maxsize
+        self.policy = policy
+        self.key = key
+        self.dropped = 0
+        self.closed = False
+        self._messages = OrderedDict() if policy == COALESCE else deque()
+        self._ready = asyncio.Event()
+
+    def put(self, message: dict):
+        """
+        Adds a message, dropping or coalescing if the queue is full
+        """
+        if self.closed:
+            return
+
+        if self.policy == COALESCE:
+            key = self.key(message)
+            if key in self._messages:
+                self._messages[key] = message
+                self.dropped += 1
+            else:
+                if len(self._messages) >= self.maxsize:
+                    self._messages.popitem(last=False)
+                    self.dropped += 1
+                self._messages[key] = message
+        elif len(self._messages) >= self.maxsize:
+            self.dropped += 1
+            if self.policy == DROP_NEWEST:
+                return
+            self._messages.popleft()
+            self._messages.append(message)
+        else:
+            self._messages.append(message)
+
+        self._ready.set()
+
+    def get_nowait(self) -> dict:
+        """
+        Returns the oldest message, raises asyncio.QueueEmpty if there is none
+        """
+        if not self._messages:
+            raise asyncio.QueueEmpty
+        if self.policy == COALESCE:
+            return self._messages.popitem(last=False)[1]
+        return self._messages.popleft()
+
+    async def get(self) -> dict:
+        """
+        Waits for the oldest message, raises PolyException once closed and drained
+        """
+        while not self._messages:
+            if self.closed:
+                raise PolyException(CONSUMER_CLOSED)
+            self._ready.clear()
+            await self._ready.wait()
+        return self.get_nowait()
+
+    def close(self):
+        """
+        Stops accepting messages, the remaining ones can still be read
+        """
+        self.closed = True
+        self._ready.set()
+
+    def __len__(self):
+        return len(self._messages)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> dict:
+        if self.closed and not self._messages:
+            raise StopAsyncIteration
+        try:
+            return await self.get()
+        except PolyException:
+            raise StopAsyncIteration
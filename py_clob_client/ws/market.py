@@ -0,0 +1,160 @@
+import asyncio
+from typing import Callable, Hashable
+
+from .connection import ManagedWebSocket
+from .consumer import DROP_OLDEST, ConsumerQueue, default_key
+
+MARKET_CHANNEL_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+
+# maximum number of asset ids subscribed on a single connection
+MAX_ASSETS_PER_CONNECTION = 500
+
+
+class _Shard:
+    def __init__(self, asset_ids: set):
+        self.asset_ids = asset_ids
+        self.connection: ManagedWebSocket = None
+
+
+class MarketDataClient:
+    """
+    Client of the market websocket channel
+    Asset ids are spread over as many connections as needed to stay under
+    max_assets_per_connection, each connection reconnects on its own and resubscribes
+    its asset ids. Messages are fanned out to bounded consumer queues
+
+        async with MarketDataClient() as client:
+            consumer = client.consumer()
+            await client.subscribe([token_id])
+            async for message in consumer:
+                ...
+    """
+
+    def __init__(
+        self,
+        url: str = MARKET_CHANNEL_URL,
+        max_assets_per_connection: int = MAX_ASSETS_PER_CONNECTION,
+        **connection_kwargs,
+    ):
+        """
+        connection_kwargs: passed to ManagedWebSocket, e.g. ping_interval or max_backoff
+        """
+        self.url = url
+        self.max_assets_per_connection = max_assets_per_connection
+        self.connection_kwargs = connection_kwargs
+        self.consumers: list[ConsumerQueue] = []
+        self.shards: list[_Shard] = []
+        self.started = False
+
+    @property
+    def asset_ids(self) -> set:
+        return set().union(*(shard.asset_ids for shard in self.shards))
+
+    def consumer(
+        self,
+        maxsize: int = 1000,
+        policy: str = DROP_OLDEST,
+        key: Callable[[dict], Hashable] = default_key,
+    ) -> ConsumerQueue:
+        """
+        Adds a consumer receiving every message, see ConsumerQueue
+        """
+        queue = ConsumerQueue(maxsize, policy, key)
+        self.consumers.append(queue)
+        return queue
+
+    def remove_consumer(self, queue: ConsumerQueue):
+        self.consumers.remove(queue)
+        queue.close()
+
+    def _on_message(self, message: dict):
+        for consumer in self.consumers:
+            consumer.put(message)
+
+    def _open_shard(self, shard: _Shard):
+        async def on_open(connection: ManagedWebSocket):
+            if shard.asset_ids:
+                await connection.send(
+                    {"assets_ids": sorted(shard.asset_ids), "type": "market"}
+                )
+
+        shard.connection = ManagedWebSocket(
+            self.url, self._on_message, on_open, **self.connection_kwargs
+        )
+        shard.connection.start()
+
+    async def subscribe(self, asset_ids: list[str]):
+        """
+        Subscribes to the market channel of the asset ids, opening connections as needed
+        """
+        subscribed = self.asset_ids
+        new_ids = [a for a in dict.fromkeys(asset_ids) if a not in subscribed]
+
+        for shard in self.shards:
+            if not new_ids:
+                break
+            room = self.max_assets_per_connection - len(shard.asset_ids)
+            if room <= 0:
+                continue
+            added, new_ids = new_ids[:room], new_ids[room:]
+            shard.asset_ids.update(added)
+            if shard.connection is not None:
+                await shard.connection.send(
+                    {"assets_ids": added, "operation": "subscribe"}
+                )
+
+        while new_ids:
+            added = new_ids[: self.max_assets_per_connection]
+            new_ids = new_ids[self.max_assets_per_connection :]
+            shard = _Shard(set(added))
+            self.shards.append(shard)
+            if self.started:
+                self._open_shard(shard)
+
+    async def unsubscribe(self, asset_ids: list[str]):
+        """
+        Unsubscribes from the asset ids, closing the connections left without any
+        """
+        asset_ids = set(asset_ids)
+        for shard in list(self.shards):
+            removed = shard.asset_ids & asset_ids
+            if not removed:
+                continue
+            shard.asset_ids -= removed
+            if not shard.asset_ids:
+                self.shards.remove(shard)
+                if shard.connection is not None:
+                    await shard.connection.close()
+            elif shard.connection is not None:
+                await shard.connection.send(
+                    {"assets_ids": sorted(removed), "operation": "unsubscribe"}
+                )
+
+    async def start(self):
+        """
+        Opens the connections of the subscribed asset ids
+        """
+        self.started = True
+        for shard in self.shards:
+            if shard.connection is None:
+                self._open_shard(shard)
+
+    async def close(self):
+        """
+        Closes all connections and consumers
+        """
+        self.started = False
+        await asyncio.gather(
+            *(shard.connection.close() for shard in self.shards if shard.connection)
+        )
+        for shard in self.shards:
+            shard.connection = None
+        for consumer in self.consumers:
+            consumer.close()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
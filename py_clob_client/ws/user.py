@@ -0,0 +1,297 @@
+from dataclasses import fields
+from typing import Awaitable, Callable, Hashable, Optional, Union
+
+from ..clob_types import ApiCreds, MakerOrderFill, OrderEvent, TradeEvent
+from .connection import ManagedWebSocket
+from .consumer import DROP_OLDEST, ConsumerQueue
+
+USER_CHANNEL_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/user"
+
+ORDER_EVENT = "order"
+TRADE_EVENT = "trade"
+
+PLACEMENT = "PLACEMENT"
+UPDATE = "UPDATE"
+CANCELLATION = "CANCELLATION"
+
+UserEvent = Union[OrderEvent, TradeEvent]
+
+
+def parse_order_event(message: dict) -> OrderEvent:
+    """
+    Parses an order message of the user channel, or an order returned by get_orders
+    """
+    return OrderEvent(
+        type=message.get("type", PLACEMENT),
+        id=message["id"],
+        market=message.get("market"),
+        asset_id=message.get("asset_id"),
+        side=message.get("side"),
+        price=message.get("price"),
+        original_size=message.get("original_size"),
+        size_matched=message.get("size_matched"),
+        outcome=message.get("outcome"),
+        owner=message.get("owner"),
+        timestamp=message.get("timestamp"),
+        associate_trades=message.get("associate_trades"),
+    )
+
+
+def parse_trade_event(message: dict) -> TradeEvent:
+    """
+    Parses a trade message of the user channel
+    """
+    return TradeEvent(
+        id=message["id"],
+        status=message.get("status"),
+        market=message.get("market"),
+        asset_id=message.get("asset_id"),
+        side=message.get("side"),
+        size=message.get("size"),
+        price=message.get("price"),
+        outcome=message.get("outcome"),
+        owner=message.get("owner"),
+        taker_order_id=message.get("taker_order_id"),
+        maker_orders=[
+            MakerOrderFill(
+                order_id=m["order_id"],
+                owner=m.get("owner"),
+                matched_amount=m.get("matched_amount"),
+                price=m.get("price"),
+                asset_id=m.get("asset_id"),
+                outcome=m.get("outcome"),
+            )
+            for m in message.get("maker_orders") or []
+        ],
+        matchtime=message.get("matchtime"),
+        timestamp=message.get("timestamp"),
+    )
+
+
+def parse_user_event(message: dict) -> Optional[UserEvent]:
+    """
+    Parses a message of the user channel, None if it is neither an order nor a trade
+    """
+    event_type = message.get("event_type")
+    if event_type == ORDER_EVENT:
+        return parse_order_event(message)
+    if event_type == TRADE_EVENT:
+        return parse_trade_event(message)
+    return None
+
+
+def event_key(event: UserEvent) -> Hashable:
+    return type(event), event.id
+
+
+class UserOrderIndex:
+    """
+    In memory index of the open orders and fills of the user, fed with user channel events
+    owner: api key of the user, used to pick its orders among the makers of a trade,
+    all maker orders are indexed if not given
+    """
+
+    def __init__(self, owner: str = None):
+        self.owner = owner
+        self.open_orders: dict[str, OrderEvent] = {}
+        self.orders_by_asset: dict[str, set[str]] = {}
+        self.trades: dict[str, TradeEvent] = {}
+        self.trades_by_order: dict[str, dict[str, None]] = {}
+        self.trades_by_asset: dict[str, dict[str, None]] = {}
+
+    def seed_orders(self, orders: list[dict]):
+        """
+        Replaces the open orders with the result of get_orders
+        """
+        self.open_orders.clear()
+        self.orders_by_asset.clear()
+        for order in orders:
+            self._add_order(parse_order_event(order))
+
+    def apply(self, event: UserEvent):
+        if isinstance(event, OrderEvent):
+            self._apply_order(event)
+        elif isinstance(event, TradeEvent):
+            self._apply_trade(event)
+
+    def _add_order(self, order: OrderEvent):
+        self.open_orders[order.id] = order
+        self.orders_by_asset.setdefault(order.asset_id, set()).add(order.id)
+
+    def _remove_order(self, order_id: str):
+        order = self.open_orders.pop(order_id, None)
+        if order is None:
+            return
+        ids = self.orders_by_asset.get(order.asset_id)
+        if ids is not None:
+            ids.discard(order_id)
+            if not ids:
+                del self.orders_by_asset[order.asset_id]
+
+    def _apply_order(self, event: OrderEvent):
+        if event.type == CANCELLATION:
+            self._remove_order(event.id)
+            return
+
+        current = self.open_orders.get(event.id)
+        if current is not None:
+            # updates may only carry the fields that changed
+            for field in fields(event):
+                if getattr(event, field.name) is None:
+                    setattr(event, field.name, getattr(current, field.name))
+            self._remove_order(event.id)
+
+        if _is_filled(event):
+            return
+        self._add_order(event)
+
+    def _apply_trade(self, event: TradeEvent):
+        self.trades[event.id] = event
+
+        order_ids = [event.taker_order_id] if event.taker_order_id else []
+        asset_ids = [event.asset_id] if event.asset_id else []
+        for maker in event.maker_orders or []:
+            if self.owner is None or maker.owner == self.owner:
+                order_ids.append(maker.order_id)
+                if maker.asset_id:
+                    asset_ids.append(maker.asset_id)
+
+        for order_id in order_ids:
+            self.trades_by_order.setdefault(order_id, {})[event.id] = None
+        for asset_id in asset_ids:
+            self.trades_by_asset.setdefault(asset_id, {})[event.id] = None
+
+    def get_open_orders(self, asset_id: str = None) -> list[OrderEvent]:
+        if asset_id is None:
+            return list(self.open_orders.values())
+        return [self.open_orders[i] for i in self.orders_by_asset.get(asset_id, ())]
+
+    def get_fills(self, order_id: str = None, asset_id: str = None) -> list[TradeEvent]:
+        """
+        Trades of an order or of an asset, every trade if neither is given
+        """
+        if order_id is not None:
+            ids = self.trades_by_order.get(order_id, {})
+        elif asset_id is not None:
+            ids = self.trades_by_asset.get(asset_id, {})
+        else:
+            ids = self.trades
+        return [self.trades[i] for i in ids]
+
+
+def _is_filled(order: OrderEvent) -> bool:
+    if order.original_size is None or order.size_matched is None:
+        return False
+    return float(order.size_matched) >= float(order.original_size)
+
+
+class UserChannelClient:
+    """
+    Client of the authenticated user websocket channel
+    Order and trade messages are parsed into OrderEvent and TradeEvent, applied to
+    the index and fanned out to bounded consumer queues. Events sent while disconnected
+    are lost, resync is awaited on every connection to reseed the open orders
+
+        async with UserChannelClient(creds, resync=client.get_orders) as user:
+            async for event in user.consumer():
+                ...
+    """
+
+    def __init__(
+        self,
+        creds: ApiCreds,
+        markets: list[str] = None,
+        url: str = USER_CHANNEL_URL,
+        index: UserOrderIndex = None,
+        resync: Callable[[], Awaitable[list[dict]]] = None,
+        **connection_kwargs,
+    ):
+        """
+        markets: condition ids to subscribe to, all the markets of the user if not given
+        resync: fetches the open orders, e.g. AsyncClobClient.get_orders
+        connection_kwargs: passed to ManagedWebSocket, e.g. ping_interval or max_backoff
+        """
+        self.creds = creds
+        self.markets = list(markets or [])
+        self.url = url
+        self.index = index or UserOrderIndex(creds.api_key)
+        self.resync = resync
+        self.connection_kwargs = connection_kwargs
+        self.consumers: list[ConsumerQueue] = []
+        self.connection: ManagedWebSocket = None
+
+    def consumer(
+        self,
+        maxsize: int = 1000,
+        policy: str = DROP_OLDEST,
+        key: Callable[[UserEvent], Hashable] = event_key,
+    ) -> ConsumerQueue:
+        """
+        Adds a consumer receiving every event, see ConsumerQueue
+        """
+        queue = ConsumerQueue(maxsize, policy, key)
+        self.consumers.append(queue)
+        return queue
+
+    def remove_consumer(self, queue: ConsumerQueue):
+        self.consumers.remove(queue)
+        queue.close()
+
+    def _on_message(self, message: dict):
+        event = parse_user_event(message)
+        if event is None:
+            return
+        self.index.apply(event)
+        for consumer in self.consumers:
+            consumer.put(event)
+
+    async def _on_open(self, connection: ManagedWebSocket):
+        await connection.send(
+            {
+                "auth": {
+                    "apiKey": self.creds.api_key,
+                    "secret": self.creds.api_secret,
+                    "passphrase": self.creds.api_passphrase,
+                },
+                "markets": self.markets,
+                "type": "user",
+            }
+        )
+        # messages are only read once on_open returns, so the events received
+        # meanwhile are applied on top of the fresh open orders
+        if self.resync is not None:
+            self.index.seed_orders(await self.resync())
+
+    async def subscribe(self, markets: list[str]):
+        """
+        Adds markets to the subscription
+        """
+        new_markets = [m for m in dict.fromkeys(markets) if m not in self.markets]
+        if not new_markets:
+            return
+        self.markets.extend(new_markets)
+        if self.connection is not None:
+            await self.connection.send(
+                {"markets": new_markets, "operation": "subscribe"}
+            )
+
+    async def start(self):
+        if self.connection is None:
+            self.connection = ManagedWebSocket(
+                self.url, self._on_message, self._on_open, **self.connection_kwargs
+            )
+            self.connection.start()
+
+    async def close(self):
+        if self.connection is not None:
+            await self.connection.close()
+            self.connection = None
+        for consumer in self.consumers:
+            consumer.close()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
@@ -22,6 +22,14 @@ setuptools.setup(
         "python-dotenv",
         "requests",
     ],
+    extras_require={
+        "async": ["httpx"],
+        "ws": ["websockets"],
+        "export": ["pyarrow"],
+        "prometheus": ["prometheus_client"],
+        "otel": ["opentelemetry-api"],
+        "fast": ["orjson", "msgspec"],
+    },
     project_urls={
         "Bug Tracker": "https://github.com/Polymarket/py-clob-client/issues",
     },
@@ -0,0 +1,82 @@
+import asyncio
+import json
+import threading
+import time
+from collections import namedtuple
+from datetime import timedelta
+
+FakeRequest = namedtuple("FakeRequest", ["method", "url", "data", "timeout"])
+
+
+class FakeResponse:
+    """
+    Response with a json body, or raw bytes, as returned by requests and httpx
+    """
+
+    def __init__(self, status_code=200, body=None, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.text = self.content.decode()
+        self.elapsed = timedelta(milliseconds=1)
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class FakeSession:
+    """
+    Returns the responses in turn, then the last one again, and records the requests
+    An exception is raised, a (delay, response) tuple is returned after delay seconds
+    Subclasses answer from the request by overriding respond
+    """
+
+    def __init__(self, *responses, delay=0.0):
+        self.responses = list(responses)
+        self.delay = delay
+        self.requests: list[FakeRequest] = []
+        self.lock = threading.Lock()
+
+    @property
+    def calls(self) -> int:
+        return len(self.requests)
+
+    @property
+    def timeouts(self) -> list:
+        return [r.timeout for r in self.requests]
+
+    def respond(self, index: int, request: FakeRequest):
+        """
+        Response to the request number index
+        """
+        return self.responses[min(index, len(self.responses) - 1)]
+
+    def next_response(self, method, url, data, timeout) -> tuple:
+        request = FakeRequest(method, url, data, timeout)
+        with self.lock:
+            index = len(self.requests)
+            self.requests.append(request)
+        response = self.respond(index, request)
+        if isinstance(response, tuple):
+            return response
+        return self.delay, response
+
+    def request(
+        self, method=None, url=None, headers=None, data=None, timeout=None, **kwargs
+    ):
+        delay, response = self.next_response(method, url, data, timeout)
+        time.sleep(delay)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class FakeAsyncSession(FakeSession):
+    async def request(
+        self, method=None, url=None, headers=None, content=None, timeout=None, **kwargs
+    ):
+        delay, response = self.next_response(method, url, content, timeout)
+        await asyncio.sleep(delay)
+        if isinstance(response, Exception):
+            raise response
+        return response
@@ -11,8 +11,10 @@ from py_clob_client.headers.headers import (
     POLY_TIMESTAMP,
     create_level_1_headers,
     create_level_2_headers,
+    Level2HeaderBuilder,
 )
 from py_clob_client.signer import Signer
+from py_clob_client.signing.hmac import build_hmac_signature
 
 # publicly known private key
 private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
@@ -82,3 +84,31 @@ class TestHeaders(TestCase):
         )
         self.assertEqual(l2_headers[POLY_API_KEY], creds.api_key)
         self.assertEqual(l2_headers[POLY_PASSPHRASE], creds.api_passphrase)
+
+    def test_level_2_header_builder(self):
+        builder = Level2HeaderBuilder(signer, creds)
+        request_args = RequestArgs(
+            method="POST", request_path="/order", body='{"hash": "0x123"}'
+        )
+
+        l2_headers = builder.create(request_args)
+        self.assertEqual(l2_headers[POLY_ADDRESS], signer.address())
+        self.assertEqual(l2_headers[POLY_API_KEY], creds.api_key)
+        self.assertEqual(l2_headers[POLY_PASSPHRASE], creds.api_passphrase)
+        self.assertTrue(
+            int(l2_headers[POLY_TIMESTAMP]) <= int(datetime.now().timestamp())
+        )
+        self.assertEqual(
+            l2_headers[POLY_SIGNATURE],
+            build_hmac_signature(
+                creds.api_secret,
+                l2_headers[POLY_TIMESTAMP],
+                "POST",
+                "/order",
+                '{"hash": "0x123"}',
+            ),
+        )
+
+        # every request gets its own headers
+        l2_headers["User-Agent"] = "py_clob_client"
+        self.assertNotIn("User-Agent", builder.create(request_args))
@@ -0,0 +1,38 @@
+from unittest import IsolatedAsyncioTestCase
+
+import httpx
+
+from py_clob_client.exceptions import PolyApiException
+from py_clob_client.http_helpers.async_helpers import get, post
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/ok":
+        return httpx.Response(200, json={"ok": True})
+    if request.url.path == "/text":
+        return httpx.Response(200, text="OK")
+    if request.url.path == "/echo":
+        return httpx.Response(200, content=request.content)
+    return httpx.Response(404, json={"error": "not found"})
+
+
+class TestAsyncHelpers(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def asyncTearDown(self):
+        await self.session.aclose()
+
+    async def test_get(self):
+        self.assertEqual(await get("http://clob/ok", self.session), {"ok": True})
+        self.assertEqual(await get("http://clob/text", self.session), "OK")
+
+    async def test_post(self):
+        resp = await post("http://clob/echo", self.session, data=[{"token_id": "1"}])
+        self.assertEqual(resp, [{"token_id": "1"}])
+
+    async def test_error(self):
+        with self.assertRaises(PolyApiException) as ctx:
+            await get("http://clob/missing", self.session)
+        self.assertEqual(ctx.exception.status_code, 404)
+        self.assertEqual(ctx.exception.error_msg, {"error": "not found"})
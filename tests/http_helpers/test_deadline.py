@@ -0,0 +1,182 @@
+import asyncio
+import time
+from unittest import TestCase
+
+import requests
+
+from py_clob_client.client import ClobClient
+from py_clob_client.exceptions import DeadlineExceeded, PolyApiException
+from py_clob_client.http_helpers import async_helpers, helpers
+from py_clob_client.http_helpers.deadline import (
+    Deadline,
+    as_deadline,
+    bounded_timeout,
+    current_deadline,
+    deadline_scope,
+    with_deadline,
+)
+from py_clob_client.http_helpers.helpers import GET
+from py_clob_client.http_helpers.rate_limit import RateLimit, RateLimiter
+from py_clob_client.http_helpers.retry import Retrier, RetryPolicy
+from py_clob_client.utilities import encode_cursor
+from tests.fakes import FakeAsyncSession, FakeResponse, FakeSession
+
+HOST = "https://clob.polymarket.com"
+
+
+class PagedSession(FakeSession):
+    """
+    Answers with pages of one record each
+    """
+
+    def __init__(self, pages: int, delay=0.0):
+        super().__init__(delay=delay)
+        self.pages = pages
+
+    def respond(self, index, request):
+        cursor = request.url.split("next_cursor=")[1]
+        page = [encode_cursor(i) for i in range(self.pages)].index(cursor)
+        next_cursor = encode_cursor(page + 1) if page + 1 < self.pages else "LTE="
+        return FakeResponse(200, {"data": [page], "next_cursor": next_cursor})
+
+
+class TestDeadline(TestCase):
+    def test_deadline(self):
+        deadline = Deadline.after(10)
+        self.assertFalse(deadline.expired)
+        self.assertGreater(deadline.remaining(), 9)
+        deadline.check()
+
+        expired = Deadline.after(-1)
+        self.assertTrue(expired.expired)
+        self.assertEqual(expired.remaining(), 0)
+        with self.assertRaises(DeadlineExceeded):
+            expired.check()
+
+        self.assertIsNone(as_deadline(None))
+        self.assertIs(as_deadline(deadline), deadline)
+        self.assertAlmostEqual(as_deadline(5).remaining(), 5, places=1)
+
+    def test_deadline_scope(self):
+        self.assertIsNone(current_deadline())
+        with deadline_scope(10) as outer:
+            self.assertIs(current_deadline(), outer)
+            with deadline_scope(1) as inner:
+                self.assertLess(inner.remaining(), 2)
+            # nested scopes can not extend the deadline
+            with deadline_scope(100) as inner:
+                self.assertIs(inner, outer)
+            with deadline_scope(None) as inner:
+                self.assertIs(inner, outer)
+        self.assertIsNone(current_deadline())
+
+    def test_bounded_timeout(self):
+        self.assertEqual(bounded_timeout((5, 30), None), (5, 30))
+        timeout = bounded_timeout((5, 30), Deadline.after(10))
+        self.assertEqual(timeout[0], 5)
+        self.assertLessEqual(timeout[1], 10)
+        self.assertLessEqual(bounded_timeout(None, Deadline.after(2)), 2)
+        self.assertGreater(bounded_timeout(1, Deadline.after(-1)), 0)
+
+    def test_with_deadline(self):
+        @with_deadline
+        def call():
+            return current_deadline()
+
+        @with_deadline
+        def iterate():
+            return (current_deadline() for _ in range(2))
+
+        self.assertIsNone(call())
+        self.assertLess(call(deadline=1).remaining(), 2)
+
+        deadlines = list(iterate(deadline=1))
+        self.assertEqual(len(deadlines), 2)
+        self.assertIs(deadlines[0], deadlines[1])
+        self.assertLess(deadlines[0].remaining(), 2)
+        self.assertEqual(list(iterate()), [None, None])
+
+    def test_request_deadline(self):
+        session = FakeSession(FakeResponse(200, {"ok": True}))
+        helpers.get(HOST + "/ok", session=session, timeout=(5, 30), deadline=2)
+        connect, read = session.timeouts[-1]
+        self.assertLessEqual(connect, 2)
+        self.assertLessEqual(read, 2)
+
+        # the deadline of the scope applies
+        with deadline_scope(1):
+            helpers.get(HOST + "/ok", session=session, timeout=(5, 30))
+        self.assertLessEqual(session.timeouts[-1][1], 1)
+
+        with self.assertRaises(DeadlineExceeded):
+            helpers.get(HOST + "/ok", session=session, deadline=Deadline.after(-1))
+        self.assertEqual(len(session.timeouts), 2)
+
+    def test_request_timeout(self):
+        session = FakeSession(requests.Timeout("read"), delay=0.05)
+        with self.assertRaises(DeadlineExceeded):
+            helpers.get(HOST + "/ok", session=session, deadline=0.01)
+
+        # a timeout within the deadline is a request error
+        with self.assertRaises(PolyApiException):
+            helpers.get(HOST + "/ok", session=session, deadline=10)
+
+    def test_rate_limiter_deadline(self):
+        limiter = RateLimiter({"/book": RateLimit(rate=1, burst=1)})
+        limiter.acquire(GET, HOST + "/book", Deadline.after(1))
+        start = time.monotonic()
+        with self.assertRaises(DeadlineExceeded):
+            limiter.acquire(GET, HOST + "/book", Deadline.after(0.1))
+        self.assertLess(time.monotonic() - start, 0.05)
+        self.assertEqual(limiter.usage()["/book"].queued, 0)
+
+        async def main():
+            await limiter.acquire_async(GET, HOST + "/book", Deadline.after(0.1))
+
+        with self.assertRaises(DeadlineExceeded):
+            asyncio.run(main())
+
+    def test_retry_deadline(self):
+        policy = RetryPolicy(max_retries=5, min_backoff=1, max_backoff=1)
+        retrier = Retrier(policies={}, read=policy)
+        session = FakeSession(requests.ConnectionError("reset"))
+        start = time.monotonic()
+        with self.assertRaises(PolyApiException):
+            helpers.get(HOST + "/ok", session=session, retrier=retrier, deadline=0.15)
+        self.assertLess(time.monotonic() - start, 0.1)
+        self.assertEqual(len(session.timeouts), 1)
+
+    def test_async_request_deadline(self):
+        session = FakeAsyncSession(FakeResponse(200, {"ok": True}))
+
+        async def main():
+            await async_helpers.get(HOST + "/ok", session)
+            await async_helpers.get(HOST + "/ok", session, timeout=(5, 30), deadline=2)
+            await async_helpers.get(HOST + "/ok", session, deadline=Deadline.after(-1))
+
+        with self.assertRaises(DeadlineExceeded):
+            asyncio.run(main())
+        self.assertIsNone(session.timeouts[0])
+        self.assertLessEqual(session.timeouts[1].read, 2)
+        self.assertEqual(len(session.timeouts), 2)
+
+    def test_client_deadline(self):
+        session = PagedSession(pages=6)
+        client = ClobClient(HOST, session=session)
+
+        # the deadline reaches the pages fetched in parallel
+        markets = client.get_all_markets(concurrency=3, deadline=5)
+        self.assertEqual(markets, list(range(6)))
+        self.assertTrue(all(read <= 5 for _, read in session.timeouts))
+
+        client.get_markets()
+        self.assertEqual(session.timeouts[-1], client.timeout)
+
+        session = PagedSession(pages=100, delay=0.02)
+        client = ClobClient(HOST, session=session)
+        records = []
+        with self.assertRaises(DeadlineExceeded):
+            for record in client.iter_all_markets(deadline=0.1):
+                records.append(record)
+        self.assertGreater(len(records), 0)
+        self.assertLess(len(records), 100)
@@ -10,6 +10,8 @@ from py_clob_client.clob_types import (
 )
 
 from py_clob_client.http_helpers.helpers import (
+    create_session,
+    serialize_body,
     build_query_params,
     add_query_trade_params,
     add_query_open_orders_params,
@@ -21,6 +23,25 @@ from py_clob_client.http_helpers.helpers import (
 
 
 class TestHelpers(TestCase):
+    def test_create_session(self):
+        session = create_session(pool_connections=2, pool_maxsize=32, max_retries=3)
+        self.assertIsNotNone(session)
+
+        adapter = session.get_adapter("https://clob.polymarket.com")
+        self.assertIs(adapter, session.get_adapter("http://localhost"))
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertEqual(adapter.max_retries.total, 3)
+
+    def test_serialize_body(self):
+        self.assertEqual(
+            serialize_body({"orderID": "0x1", "ids": ["a", "b"]}),
+            b'{"orderID":"0x1","ids":["a","b"]}',
+        )
+        self.assertEqual(serialize_body(["it's"]), b'["it\'s"]')
+        self.assertEqual(serialize_body('{"hash": "0x123"}'), b'{"hash": "0x123"}')
+        self.assertEqual(serialize_body(b"[]"), b"[]")
+
     def test_build_query_params(self):
         # last is ?
         url = build_query_params("http://tracker?", "q1", "a")
@@ -0,0 +1,148 @@
+import asyncio
+import threading
+import time
+from unittest import TestCase
+
+from py_clob_client.exceptions import PolyApiException
+from py_clob_client.http_helpers.helpers import DELETE, GET, POST, request
+from py_clob_client.http_helpers.rate_limit import (
+    DEFAULT_FAMILY,
+    PRIORITY_CANCEL,
+    PRIORITY_MARKET_DATA,
+    PRIORITY_ORDER,
+    RateLimit,
+    RateLimiter,
+    TokenBucket,
+    request_priority,
+)
+from tests.fakes import FakeResponse, FakeSession
+
+HOST = "https://clob.polymarket.com"
+
+TOO_MANY_REQUESTS = {"error": "Too Many Requests"}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRateLimit(TestCase):
+    def test_token_bucket(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=3, clock=clock)
+
+        self.assertEqual([bucket.try_acquire() for _ in range(3)], [0, 0, 0])
+        self.assertAlmostEqual(bucket.try_acquire(), 0.5)
+
+        clock.now += 0.5
+        self.assertEqual(bucket.try_acquire(), 0)
+
+        clock.now += 10
+        self.assertEqual(bucket.usage(), (3, 0))
+
+        bucket.pause(2)
+        self.assertEqual(bucket.usage(), (0, 2))
+        self.assertEqual(bucket.try_acquire(), 2)
+        clock.now += 2.5
+        self.assertEqual(bucket.try_acquire(), 0)
+
+    def test_family(self):
+        limiter = RateLimiter()
+        self.assertEqual(limiter.family(HOST + "/book?token_id=1"), "/book")
+        self.assertEqual(limiter.family(HOST + "/books"), "/books")
+        self.assertEqual(limiter.family(HOST + "/order"), "/order")
+        self.assertEqual(limiter.family(HOST + "/orders"), "/orders")
+        self.assertEqual(
+            limiter.family(HOST + "/data/trades?next_cursor=MA=="), "/data/trades"
+        )
+        self.assertEqual(limiter.family(HOST + "/markets/0xabc"), "/markets")
+        self.assertEqual(limiter.family(HOST + "/data/orders"), DEFAULT_FAMILY)
+
+        limiter = RateLimiter({"/book": RateLimit(1, 1)})
+        self.assertIsNone(limiter.family(HOST + "/price"))
+        limiter.acquire(GET, HOST + "/price")
+
+    def test_request_priority(self):
+        self.assertEqual(request_priority(DELETE, "/order"), PRIORITY_CANCEL)
+        self.assertEqual(request_priority(DELETE, "/cancel-all"), PRIORITY_CANCEL)
+        self.assertEqual(request_priority(POST, "/orders"), PRIORITY_ORDER)
+        self.assertEqual(request_priority(GET, "/book"), PRIORITY_MARKET_DATA)
+
+    def test_acquire_by_priority(self):
+        limiter = RateLimiter({"/order": RateLimit(rate=20, burst=1)})
+        limiter.acquire(GET, HOST + "/order")
+
+        served = []
+
+        def call(method):
+            limiter.acquire(method, HOST + "/order")
+            served.append(method)
+
+        family = limiter.families["/order"]
+        threads = []
+        for method in (GET, POST, DELETE):
+            thread = threading.Thread(target=call, args=(method,))
+            thread.start()
+            threads.append(thread)
+            # queued one after the other, so the order of arrival is the reverse of the priorities
+            while len(family.waiters) < len(threads):
+                time.sleep(0.001)
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(served, [DELETE, POST, GET])
+        self.assertEqual(limiter.usage()["/order"].queued, 0)
+
+    def test_acquire_async_by_priority(self):
+        limiter = RateLimiter({"/order": RateLimit(rate=20, burst=1)})
+        served = []
+
+        async def call(method):
+            await limiter.acquire_async(method, HOST + "/order")
+            served.append(method)
+
+        async def main():
+            await limiter.acquire_async(GET, HOST + "/order")
+            tasks = []
+            for method in (GET, POST, DELETE):
+                tasks.append(asyncio.create_task(call(method)))
+                await asyncio.sleep(0)
+            await asyncio.wait_for(asyncio.gather(*tasks), 5)
+
+        asyncio.run(main())
+        self.assertEqual(served, [DELETE, POST, GET])
+
+    def test_retry_after(self):
+        exc = PolyApiException(
+            FakeResponse(429, TOO_MANY_REQUESTS, {"Retry-After": "3"})
+        )
+        self.assertEqual(exc.retry_after, 3)
+        self.assertIsNone(PolyApiException(FakeResponse(500)).retry_after)
+        self.assertIsNone(PolyApiException(error_msg="Request exception!").retry_after)
+
+        exc = PolyApiException(
+            FakeResponse(
+                429, TOO_MANY_REQUESTS, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+            )
+        )
+        self.assertEqual(exc.retry_after, 0)
+
+    def test_request_rate_limited(self):
+        clock = FakeClock()
+        limiter = RateLimiter({"/book": RateLimit(rate=10, burst=10)}, clock=clock)
+        session = FakeSession(
+            FakeResponse(429, TOO_MANY_REQUESTS, {"Retry-After": "5"})
+        )
+
+        with self.assertRaises(PolyApiException) as cm:
+            request(HOST + "/book", GET, session=session, rate_limiter=limiter)
+        self.assertEqual(cm.exception.status_code, 429)
+
+        usage = limiter.usage()["/book"]
+        self.assertEqual(usage.available, 0)
+        self.assertEqual(usage.retry_after, 5)
+        self.assertEqual(limiter.families["/book"].bucket.try_acquire(), 5)
@@ -0,0 +1,152 @@
+import asyncio
+import threading
+import time
+from unittest import TestCase
+
+import requests
+
+from py_clob_client.exceptions import PolyApiException
+from py_clob_client.http_helpers import async_helpers, helpers
+from py_clob_client.http_helpers.helpers import DELETE, GET, POST
+from py_clob_client.http_helpers.retry import (
+    HEDGED_READ_RETRY,
+    NO_RETRY,
+    READ_RETRY,
+    LatencyTracker,
+    Retrier,
+    RetryPolicy,
+)
+from tests.fakes import FakeAsyncSession, FakeResponse, FakeSession
+
+HOST = "https://clob.polymarket.com"
+
+FAST = RetryPolicy(max_retries=2, min_backoff=0.001, max_backoff=0.002)
+
+
+class TestRetry(TestCase):
+    def test_policy(self):
+        retrier = Retrier()
+        self.assertEqual(
+            retrier.policy(GET, HOST + "/book?token_id=1"), HEDGED_READ_RETRY
+        )
+        self.assertEqual(retrier.policy(POST, HOST + "/books"), HEDGED_READ_RETRY)
+        self.assertEqual(retrier.policy(GET, HOST + "/markets/0x1"), READ_RETRY)
+        self.assertEqual(retrier.policy(POST, HOST + "/midpoints"), READ_RETRY)
+        self.assertEqual(retrier.policy(DELETE, HOST + "/order"), READ_RETRY)
+        self.assertEqual(retrier.policy(POST, HOST + "/order"), NO_RETRY)
+        self.assertEqual(retrier.policy(POST, HOST + "/orders"), NO_RETRY)
+
+    def test_latency_percentile(self):
+        latencies = LatencyTracker(window=100)
+        key = (GET, "/book")
+        for i in range(10):
+            latencies.record(key, i)
+        self.assertIsNone(latencies.percentile(key, 0.95))
+
+        for i in range(200):
+            latencies.record(key, i / 100)
+        self.assertAlmostEqual(latencies.percentile(key, 0.95), 1.94)
+        self.assertIsNone(latencies.percentile((GET, "/midpoint"), 0.95))
+
+    def test_retry_read(self):
+        retrier = Retrier(policies={}, read=FAST)
+        session = FakeSession(
+            requests.ConnectionError("reset"),
+            FakeResponse(503, "unavailable"),
+            FakeResponse(200, {"mid": "0.5"}),
+        )
+        result = helpers.get(HOST + "/midpoint", session=session, retrier=retrier)
+        self.assertEqual(result, {"mid": "0.5"})
+        self.assertEqual(session.calls, 3)
+
+    def test_retry_gives_up(self):
+        retrier = Retrier(policies={}, read=FAST)
+        session = FakeSession(FakeResponse(503, "unavailable"))
+        with self.assertRaises(PolyApiException) as cm:
+            helpers.get(HOST + "/midpoint", session=session, retrier=retrier)
+        self.assertEqual(cm.exception.status_code, 503)
+        self.assertEqual(session.calls, 3)
+
+        # client errors are not retried
+        session = FakeSession(FakeResponse(400, "bad request"))
+        with self.assertRaises(PolyApiException):
+            helpers.get(HOST + "/midpoint", session=session, retrier=retrier)
+        self.assertEqual(session.calls, 1)
+
+    def test_no_retry_order(self):
+        retrier = Retrier(read=FAST)
+        session = FakeSession(requests.ConnectionError("reset"))
+        with self.assertRaises(PolyApiException) as cm:
+            helpers.post(HOST + "/order", data={}, session=session, retrier=retrier)
+        self.assertIsInstance(cm.exception.__cause__, requests.ConnectionError)
+        self.assertEqual(session.calls, 1)
+
+    def test_hedged(self):
+        policy = RetryPolicy(hedge=True, hedge_delay=0.02)
+        retrier = Retrier(policies={(GET, "/book"): policy})
+        # the hedge stands in for a request which fails after the hedge delay
+        session = FakeSession(
+            (0.1, requests.ConnectionError("reset")),
+            FakeResponse(200, {"hedge": True}),
+        )
+        result = helpers.get(HOST + "/book", session=session, retrier=retrier)
+        self.assertEqual(result, {"hedge": True})
+        self.assertEqual(session.calls, 2)
+
+        # a slow response is beaten by the hedge
+        session = FakeSession(
+            (1, FakeResponse(200, {"slow": True})), FakeResponse(200, {"slow": False})
+        )
+        start = time.monotonic()
+        result = helpers.get(HOST + "/book", session=session, retrier=retrier)
+        self.assertEqual(result, {"slow": False})
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(session.calls, 2)
+
+        # a fast response does not fire the hedge
+        session = FakeSession(FakeResponse(200, {"slow": False}))
+        helpers.get(HOST + "/book", session=session, retrier=retrier)
+        time.sleep(0.05)
+        self.assertEqual(session.calls, 1)
+        retrier.close()
+
+    def test_hedged_busy_executor(self):
+        # the hedge delay counts from the start of the request, not the wait for a worker
+        policy = RetryPolicy(hedge=True, hedge_delay=0.05)
+        retrier = Retrier(policies={(GET, "/book"): policy}, max_hedge_workers=1)
+        blocker = threading.Event()
+        retrier._get_executor().submit(blocker.wait)
+        threading.Timer(0.2, blocker.set).start()
+        session = FakeSession(FakeResponse(200, {"ok": True}))
+        self.assertEqual(
+            helpers.get(HOST + "/book", session=session, retrier=retrier),
+            {"ok": True},
+        )
+        self.assertEqual(session.calls, 1)
+        retrier.close()
+
+    def test_hedged_async(self):
+        policy = RetryPolicy(hedge=True, hedge_delay=0.02)
+        retrier = Retrier(policies={(GET, "/book"): policy})
+        session = FakeAsyncSession(
+            (1, FakeResponse(200, {"slow": True})), FakeResponse(200, {"slow": False})
+        )
+
+        async def main():
+            return await asyncio.wait_for(
+                async_helpers.get(HOST + "/book", session, retrier=retrier), 0.5
+            )
+
+        self.assertEqual(asyncio.run(main()), {"slow": False})
+        self.assertEqual(session.calls, 2)
+
+    def test_retry_async(self):
+        retrier = Retrier(policies={}, read=FAST)
+        session = FakeAsyncSession(
+            FakeResponse(502, "bad gateway"), FakeResponse(200, {"price": "0.5"})
+        )
+        result = asyncio.run(
+            async_helpers.get(HOST + "/price", session, retrier=retrier)
+        )
+        self.assertEqual(result, {"price": "0.5"})
+        self.assertEqual(session.calls, 2)
@@ -0,0 +1,115 @@
+import gc
+import json
+import tracemalloc
+from unittest import TestCase
+
+from py_clob_client.clob_types import OrderSummary
+from py_clob_client.order_book.compact import CompactOrderBook, format_decimal
+from py_clob_client.order_book.depth import BookDepth
+from py_clob_client.order_builder.constants import BUY, SELL
+from py_clob_client.utilities import (
+    generate_orderbook_summary_hash,
+    parse_raw_orderbook_summary,
+    verify_book_hash,
+)
+
+raw_obs = {
+    "market": "0xbd31dc8a20211944f6b70f31557f1001557b59905b7738480ca09bd4532f84af",
+    "asset_id": "52114319501245915516055106046884209969926127482827954674443846427813813222426",
+    "bids": [
+        {"price": "0.15", "size": "100"},
+        {"price": "0.31", "size": "148.56"},
+        {"price": "0.33", "size": "58"},
+        {"price": "0.5", "size": "100"},
+    ],
+    "asks": [
+        {"price": "0.99", "size": "1000000"},
+        {"price": "0.6", "size": "0.01"},
+    ],
+    "hash": "9d6d9e8831a150ac4cd878f99f7b2c6d419b875f",
+    "timestamp": "123456789",
+}
+
+
+class TestCompactOrderBook(TestCase):
+    def test_format_decimal(self):
+        self.assertEqual(format_decimal(100.0), "100")
+        self.assertEqual(format_decimal(148.56), "148.56")
+        self.assertEqual(format_decimal(0.001), "0.001")
+
+    def test_from_raw(self):
+        book = CompactOrderBook.from_raw(raw_obs)
+        self.assertEqual(book.market, raw_obs["market"])
+        self.assertEqual(book.asset_id, raw_obs["asset_id"])
+        self.assertEqual(book.timestamp, "123456789")
+        self.assertEqual(book.hash, "9d6d9e8831a150ac4cd878f99f7b2c6d419b875f")
+        self.assertEqual(list(book.bid_prices), [0.15, 0.31, 0.33, 0.5])
+        self.assertEqual(list(book.bid_sizes), [100, 148.56, 58, 100])
+        self.assertEqual(list(book.ask_prices), [0.99, 0.6])
+        self.assertEqual(list(book.ask_sizes), [1000000, 0.01])
+
+        with self.assertRaises(AttributeError):
+            book.extra = 1
+
+    def test_to_summary(self):
+        book = CompactOrderBook.from_raw(raw_obs)
+        summary = parse_raw_orderbook_summary(raw_obs)
+        self.assertEqual(book.to_summary(), summary)
+        self.assertEqual(book.bids[1], OrderSummary(price="0.31", size="148.56"))
+        self.assertEqual(
+            generate_orderbook_summary_hash(book.to_summary()),
+            generate_orderbook_summary_hash(summary),
+        )
+
+    def test_raw_strings(self):
+        # non canonical decimals are kept as sent by the CLOB
+        raw = {
+            "market": "0xaabbcc",
+            "asset_id": "100",
+            "timestamp": "123456789",
+            "bids": [{"price": "0.50", "size": "10.00"}],
+            "asks": [{"price": "0.60", "size": "1e3"}],
+            "hash": "9e60f1b739918285fc08dfb0be19c1d2e2156996",
+        }
+        book = CompactOrderBook.from_raw(raw)
+        self.assertEqual(list(book.bid_prices), [0.5])
+        self.assertEqual(book.bids, [OrderSummary(price="0.50", size="10.00")])
+        self.assertEqual(book.asks, [OrderSummary(price="0.60", size="1e3")])
+        self.assertEqual(book.to_summary(), parse_raw_orderbook_summary(raw))
+        self.assertTrue(verify_book_hash(book))
+
+        empty = CompactOrderBook.from_raw({**raw, "bids": [], "asks": []})
+        self.assertEqual((empty.bids, list(empty.ask_prices)), ([], []))
+
+    def test_memory(self):
+        # a compact book retains a fraction of the memory of its OrderSummary levels
+        levels = [
+            {"price": "0.{:02d}".format(i % 99 + 1), "size": "{}.25".format(i)}
+            for i in range(200)
+        ]
+        payload = json.dumps({**raw_obs, "bids": levels, "asks": levels})
+
+        def retained(parse):
+            gc.collect()
+            tracemalloc.start()
+            books = [parse(json.loads(payload)) for _ in range(20)]
+            gc.collect()
+            size, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del books
+            return size
+
+        self.assertLess(
+            retained(CompactOrderBook.from_raw) * 5,
+            retained(parse_raw_orderbook_summary),
+        )
+
+    def test_depth(self):
+        book = CompactOrderBook.from_raw(raw_obs)
+        summary = parse_raw_orderbook_summary(raw_obs)
+        amounts = [1, 10, 50, 100, 200, 500]
+        for side, positions in [(BUY, summary.asks), (SELL, summary.bids)]:
+            self.assertEqual(
+                book.depth(side).market_prices(amounts),
+                BookDepth.from_positions(side, positions).market_prices(amounts),
+            )
@@ -0,0 +1,85 @@
+import random
+from unittest import TestCase
+
+from py_clob_client.clob_types import OrderSummary
+from py_clob_client.constants import AMOY
+from py_clob_client.order_book.depth import BookDepth
+from py_clob_client.order_builder.builder import OrderBuilder
+from py_clob_client.order_builder.constants import BUY, SELL
+from py_clob_client.signer import Signer
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+chain_id = AMOY
+signer = Signer(private_key=private_key, chain_id=chain_id)
+
+
+class TestBookDepth(TestCase):
+    def test_market_prices(self):
+        builder = OrderBuilder(signer)
+        rng = random.Random(0)
+        for _ in range(50):
+            positions = [
+                OrderSummary(
+                    price=str(round(rng.uniform(0.01, 0.99), 2)),
+                    size=str(round(rng.uniform(1, 500), 2)),
+                )
+                for _ in range(rng.randint(0, 20))
+            ]
+            amounts = [rng.uniform(1, 3000) for _ in range(20)]
+
+            for side, calculate in [
+                (BUY, builder.calculate_buy_market_price),
+                (SELL, builder.calculate_sell_market_price),
+            ]:
+                depth = BookDepth.from_positions(side, positions)
+                for amount, price in zip(amounts, depth.market_prices(amounts)):
+                    if price is None:
+                        with self.assertRaises(Exception):
+                            calculate(positions, amount)
+                    else:
+                        self.assertEqual(price, calculate(positions, amount))
+
+    def test_vwaps(self):
+        # asks, matched in order
+        depth = BookDepth.from_positions(
+            BUY,
+            [
+                OrderSummary(price="0.5", size="100"),
+                OrderSummary(price="0.4", size="100"),
+            ],
+        )
+        self.assertEqual(depth.vwaps([25, 50, 70, 91]), [0.5, 0.5, 70 / 150, None])
+        self.assertEqual(depth.slippages([50, 70]), [0.0, 0.5 - 70 / 150])
+
+        # bids, matched from the end
+        depth = BookDepth.from_positions(
+            SELL,
+            [
+                OrderSummary(price="0.3", size="100"),
+                OrderSummary(price="0.4", size="100"),
+            ],
+        )
+        self.assertEqual(depth.vwaps([100, 150, 201]), [0.4, 55 / 150, None])
+        self.assertEqual(depth.market_prices([100, 150, 201]), [0.4, 0.3, None])
+
+    def test_depths_at_prices(self):
+        positions = [
+            OrderSummary(price="0.3", size="10"),
+            OrderSummary(price="0.4", size="20"),
+            OrderSummary(price="0.5", size="30"),
+        ]
+
+        depth = BookDepth.from_positions(BUY, positions)
+        self.assertEqual(
+            depth.depths_at_prices([0.2, 0.3, 0.45, 0.5, 1]), [0, 10, 30, 60, 60]
+        )
+
+        depth = BookDepth.from_positions(SELL, positions)
+        self.assertEqual(
+            depth.depths_at_prices([0.2, 0.3, 0.45, 0.5, 1]), [60, 60, 30, 30, 0]
+        )
+
+        self.assertEqual(
+            BookDepth.from_positions(SELL, []).depths_at_prices([0.5]), [0]
+        )
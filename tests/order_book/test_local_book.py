@@ -0,0 +1,226 @@
+import asyncio
+from unittest import TestCase
+
+from py_clob_client.async_client import AsyncClobClient
+
+from py_clob_client.order_book.depth import BookDepth
+from py_clob_client.order_book.local_book import LocalOrderBook, LocalOrderBooks
+from py_clob_client.order_builder.constants import BUY, SELL
+from py_clob_client.utilities import (
+    generate_orderbook_summary_hash,
+    orderbook_summary_hash,
+    parse_raw_orderbook_summary,
+)
+from tests.fakes import FakeAsyncSession, FakeResponse
+
+raw_obs = {
+    "market": "0xaabbcc",
+    "asset_id": "100",
+    "timestamp": "123456789",
+    "bids": [
+        {"price": "0.3", "size": "100"},
+        {"price": "0.4", "size": "100"},
+    ],
+    "asks": [
+        {"price": "0.7", "size": "100"},
+        {"price": "0.6", "size": "100"},
+    ],
+    "hash": "",
+}
+
+
+def expected_hash(bids, asks, timestamp):
+    summary = parse_raw_orderbook_summary(
+        {**raw_obs, "bids": bids, "asks": asks, "timestamp": timestamp}
+    )
+    return generate_orderbook_summary_hash(summary)
+
+
+class TestLocalOrderBook(TestCase):
+    def seeded(self, **kwargs):
+        book = LocalOrderBook("100", **kwargs)
+        summary = parse_raw_orderbook_summary(raw_obs)
+        generate_orderbook_summary_hash(summary)
+        book.seed(summary)
+        return book
+
+    def test_seed(self):
+        book = self.seeded()
+        self.assertTrue(book.synced)
+        self.assertEqual(book.best_bid, 0.4)
+        self.assertEqual(book.best_ask, 0.6)
+        self.assertAlmostEqual(book.spread, 0.2)
+        self.assertAlmostEqual(book.midpoint, 0.5)
+
+        summary = parse_raw_orderbook_summary(raw_obs)
+        self.assertEqual(book.compute_hash(), generate_orderbook_summary_hash(summary))
+        self.assertEqual(book.to_summary(), summary)
+
+    def test_apply_changes(self):
+        book = self.seeded()
+        bids = [
+            {"price": "0.3", "size": "100"},
+            {"price": "0.45", "size": "20"},
+        ]
+        asks = [
+            {"price": "0.7", "size": "100"},
+            {"price": "0.6", "size": "50.5"},
+        ]
+        hash = expected_hash(bids, asks, "123456790")
+        in_sync = book.apply(
+            {
+                "event_type": "price_change",
+                "asset_id": "100",
+                "timestamp": "123456790",
+                "hash": hash,
+                "changes": [
+                    {"price": "0.45", "side": "BUY", "size": "20"},
+                    {"price": "0.4", "side": "BUY", "size": "0"},
+                    {"price": "0.6", "side": "SELL", "size": "50.5"},
+                ],
+            }
+        )
+        self.assertTrue(in_sync)
+        self.assertEqual(book.best_bid, 0.45)
+        self.assertEqual(book.size_at(BUY, 0.4), 0.0)
+        self.assertEqual(book.size_at(SELL, 0.6), 50.5)
+        self.assertEqual(book.hash, hash)
+
+        summary = book.to_summary()
+        self.assertEqual([b.price for b in summary.bids], ["0.3", "0.45"])
+        self.assertEqual([a.price for a in summary.asks], ["0.7", "0.6"])
+
+        amounts = [10, 40, 100]
+        for side, positions in [(BUY, summary.asks), (SELL, summary.bids)]:
+            self.assertEqual(
+                book.depth(side).market_prices(amounts),
+                BookDepth.from_positions(side, positions).market_prices(amounts),
+            )
+        self.assertEqual(book.market_price(SELL, 10), 0.45)
+        self.assertIsNone(book.market_price(SELL, 1000))
+
+    def test_hash_cache(self):
+        book = self.seeded()
+        book.compute_hash()
+        bids = book.bids.encoded()
+
+        # only the changed side is encoded again
+        book.apply_changes(
+            [{"price": "0.65", "side": "SELL", "size": "5"}], timestamp="123456790"
+        )
+        self.assertIs(book.bids.encoded(), bids)
+        self.assertEqual(book.compute_hash(), orderbook_summary_hash(book.to_summary()))
+
+        book.apply_changes([{"price": "0.4", "side": "BUY", "size": "0"}])
+        self.assertEqual(book.compute_hash(), orderbook_summary_hash(book.to_summary()))
+
+        book.seed(parse_raw_orderbook_summary({**raw_obs, "bids": [], "asks": []}))
+        self.assertEqual(book.compute_hash(), orderbook_summary_hash(book.to_summary()))
+
+    def test_stale_delta(self):
+        book = self.seeded()
+        book.apply_changes(
+            [{"price": "0.4", "side": "BUY", "size": "0"}], timestamp="123456788"
+        )
+        self.assertEqual(book.best_bid, 0.4)
+
+    def test_resync_on_hash_mismatch(self):
+        snapshots = []
+
+        def resync(asset_id):
+            snapshots.append(asset_id)
+            return parse_raw_orderbook_summary(raw_obs)
+
+        book = self.seeded(resync=resync)
+        in_sync = book.apply_changes(
+            [{"price": "0.4", "side": "BUY", "size": "0"}],
+            timestamp="123456790",
+            hash="bad",
+        )
+        self.assertTrue(in_sync)
+        self.assertEqual(snapshots, ["100"])
+        self.assertEqual(book.best_bid, 0.4)
+
+        book = self.seeded()
+        self.assertFalse(
+            book.apply_changes(
+                [{"price": "0.4", "side": "BUY", "size": "0"}], hash="bad"
+            )
+        )
+        self.assertFalse(book.synced)
+        # deltas are ignored until the next snapshot
+        self.assertFalse(
+            book.apply_changes([{"price": "0.5", "side": "BUY", "size": "1"}])
+        )
+        book.apply({"event_type": "book", **raw_obs})
+        self.assertTrue(book.synced)
+        self.assertEqual(book.best_bid, 0.4)
+
+    def test_resync_failure(self):
+        def resync(asset_id):
+            raise ConnectionError("unavailable")
+
+        book = self.seeded(resync=resync)
+        with self.assertLogs("py_clob_client.order_book.local_book", "ERROR"):
+            in_sync = book.apply_changes(
+                [{"price": "0.4", "side": "BUY", "size": "0"}], hash="bad"
+            )
+        self.assertFalse(in_sync)
+        self.assertFalse(book.synced)
+
+    def test_unverified_delta(self):
+        book = self.seeded(resync=lambda _: parse_raw_orderbook_summary(raw_obs))
+        book.apply_changes([{"price": "0.4", "side": "BUY", "size": "0"}], hash="bad")
+        self.assertFalse(book.verified)
+        # deltas without a hash can't be checked against the resynced snapshot
+        with self.assertLogs("py_clob_client.order_book.local_book", "WARNING"):
+            book.apply_changes([{"price": "0.35", "side": "BUY", "size": "1"}])
+
+        bids = [
+            {"price": "0.3", "size": "100"},
+            {"price": "0.35", "size": "1"},
+            {"price": "0.4", "size": "100"},
+        ]
+        hash = expected_hash(bids, raw_obs["asks"], "123456789")
+        self.assertTrue(book.apply_changes([], hash=hash))
+        self.assertTrue(book.verified)
+        with self.assertNoLogs("py_clob_client.order_book.local_book"):
+            book.apply_changes([{"price": "0.3", "side": "BUY", "size": "0"}])
+
+    def test_async_local_order_book(self):
+        session = FakeAsyncSession(FakeResponse(200, raw_obs))
+        client = AsyncClobClient("https://clob.polymarket.com", session=session)
+        book = asyncio.run(client.get_local_order_book("100"))
+        self.assertTrue(book.synced)
+        self.assertFalse(book.verified)
+        self.assertIsNone(book.resync)
+        self.assertEqual(book.best_bid, 0.4)
+
+    def test_local_order_books(self):
+        books = LocalOrderBooks()
+        updated = books.apply(
+            [
+                {"event_type": "book", **raw_obs},
+                {"event_type": "book", **raw_obs, "asset_id": "200"},
+            ]
+        )
+        self.assertEqual(updated, ["100", "200"])
+        self.assertEqual(len(books), 2)
+
+        updated = books.apply(
+            {
+                "event_type": "price_change",
+                "market": "0xaabbcc",
+                "timestamp": "123456790",
+                "price_changes": [
+                    {"asset_id": "100", "price": "0.5", "side": "BUY", "size": "1"},
+                    {"asset_id": "200", "price": "0.55", "side": "SELL", "size": "1"},
+                ],
+            }
+        )
+        self.assertEqual(updated, ["100", "200"])
+        self.assertEqual(books["100"].best_bid, 0.5)
+        self.assertEqual(books["100"].best_ask, 0.6)
+        self.assertEqual(books["200"].best_bid, 0.4)
+        self.assertEqual(books["200"].best_ask, 0.55)
+        self.assertEqual(books.apply({"event_type": "last_trade_price"}), [])
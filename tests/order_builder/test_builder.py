@@ -1,17 +1,27 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from unittest import TestCase
 
+from eth_account import Account
+
 from py_clob_client.clob_types import (
     OrderArgs,
     MarketOrderArgs,
     CreateOrderOptions,
     OrderSummary,
 )
+from py_clob_client.config import get_contract_config
 from py_clob_client.constants import AMOY
 from py_clob_client.order_builder.constants import BUY, SELL
 
 from py_clob_client.signer import Signer
-from py_clob_client.order_builder.builder import OrderBuilder, ROUNDING_CONFIG
+from py_clob_client.order_builder.builder import (
+    OrderBuilder,
+    ExchangeOrderBuilder,
+    ROUNDING_CONFIG,
+)
 from py_clob_client.order_builder.helpers import decimal_places, round_normal
+from py_order_utils.builders import OrderBuilder as UtilsOrderBuilder
+from py_order_utils.signer import Signer as UtilsSigner
 from py_order_utils.model import (
     POLY_GNOSIS_SAFE,
     EOA,
@@ -2144,6 +2154,77 @@ class TestOrderBuilder(TestCase):
         )
         self.assertIsNotNone(signed_order_dict["signature"])
 
+    def test_exchange_order_builder(self):
+        builder = OrderBuilder(signer)
+        self.assertIs(
+            builder.get_exchange_builder(False), builder.get_exchange_builder(False)
+        )
+        self.assertIsNot(
+            builder.get_exchange_builder(False), builder.get_exchange_builder(True)
+        )
+
+        for neg_risk in [False, True]:
+            signed_order = builder.create_order(
+                OrderArgs(token_id="123", price=0.56, size=21.04, side=BUY),
+                CreateOrderOptions(tick_size="0.01", neg_risk=neg_risk),
+            )
+            exchange = get_contract_config(chain_id, neg_risk).exchange
+            utils_signer = UtilsSigner(key=private_key)
+            self.assertEqual(
+                ExchangeOrderBuilder(
+                    exchange, chain_id, utils_signer
+                )._create_struct_hash(signed_order.order),
+                UtilsOrderBuilder(exchange, chain_id, utils_signer)._create_struct_hash(
+                    signed_order.order
+                ),
+            )
+
+    def test_create_orders(self):
+        builder = OrderBuilder(signer)
+        orders = [
+            (
+                OrderArgs(token_id="123", price=0.01 * i, size=10 + i, side=BUY),
+                CreateOrderOptions(tick_size="0.01", neg_risk=i % 2 == 0),
+            )
+            for i in range(1, 9)
+        ]
+
+        serial_orders = builder.create_orders(orders)
+        with builder.signing_pool(max_workers=2) as pool:
+            parallel_orders = builder.create_orders(orders, pool)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            threaded_orders = builder.create_orders(orders, executor)
+        self.assertEqual(
+            [o.dict()["makerAmount"] for o in threaded_orders],
+            [o.dict()["makerAmount"] for o in serial_orders],
+        )
+        # the key is only sent to the workers of a signing pool
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            with self.assertRaises(ValueError):
+                builder.create_orders(orders, executor)
+        other_key = "0x59c6995e998f97a5a0044966f0945389dc9e86dae88c7a8412f4603b6b78690d"
+        with OrderBuilder(Signer(other_key, chain_id)).signing_pool(1) as pool:
+            with self.assertRaises(ValueError):
+                builder.create_orders(orders, pool)
+
+        self.assertEqual(len(parallel_orders), len(orders))
+        for (order_args, options), serial, parallel in zip(
+            orders, serial_orders, parallel_orders
+        ):
+            for key in ["maker", "signer", "tokenId", "makerAmount", "takerAmount"]:
+                self.assertEqual(parallel.dict()[key], serial.dict()[key])
+
+            # signed by the signer for the right exchange
+            exchange = get_contract_config(chain_id, options.neg_risk).exchange
+            utils_builder = UtilsOrderBuilder(
+                exchange, chain_id, UtilsSigner(key=private_key)
+            )
+            struct_hash = utils_builder._create_struct_hash(parallel.order)
+            self.assertEqual(
+                Account._recover_hash(struct_hash, signature=parallel.signature),
+                signer.address(),
+            )
+
     def test_dict_order_sell(self):
         builder = OrderBuilder(signer, sig_type=POLY_GNOSIS_SAFE)
 
@@ -2,7 +2,16 @@ from unittest import TestCase
 from py_clob_client.constants import AMOY
 
 from py_clob_client.signer import Signer
-from py_clob_client.signing.eip712 import sign_clob_auth_message
+from eth_utils import keccak
+
+from py_clob_client.signing.eip712 import (
+    MSG_TO_SIGN,
+    clob_auth_struct_hash,
+    get_clob_auth_domain,
+    get_clob_auth_domain_separator,
+    sign_clob_auth_message,
+)
+from py_clob_client.signing.model import ClobAuth
 
 # publicly known private key
 private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
@@ -18,3 +27,29 @@ class TestEIP712(TestCase):
             signature,
             "0xf62319a987514da40e57e2f4d7529f7bac38f0355bd88bb5adbb3768d80de6c1682518e0af677d5260366425f4361e7b70c25ae232aff0ab2331e2b164a1aedc1b",
         )
+
+    def test_clob_auth_struct_hash(self):
+        for timestamp, nonce in [(10000000, 23), (1700000000, 0), (1, 2**64)]:
+            clob_auth_msg = ClobAuth(
+                address=signer.address(),
+                timestamp=str(timestamp),
+                nonce=nonce,
+                message=MSG_TO_SIGN,
+            )
+            self.assertEqual(
+                clob_auth_struct_hash(signer.address(), timestamp, nonce),
+                clob_auth_msg.hash_struct(),
+            )
+
+            domain = get_clob_auth_domain(chain_id)
+            self.assertEqual(
+                get_clob_auth_domain_separator(chain_id), domain.hash_struct()
+            )
+            self.assertEqual(
+                keccak(
+                    b"\x19\x01"
+                    + get_clob_auth_domain_separator(chain_id)
+                    + clob_auth_struct_hash(signer.address(), timestamp, nonce)
+                ),
+                keccak(clob_auth_msg.signable_bytes(domain)),
+            )
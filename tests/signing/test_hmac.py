@@ -1,6 +1,6 @@
 from unittest import TestCase
 
-from py_clob_client.signing.hmac import build_hmac_signature
+from py_clob_client.signing.hmac import build_hmac_signature, HmacSigner
 
 
 class TestHMAC(TestCase):
@@ -17,3 +17,53 @@ class TestHMAC(TestCase):
             signature,
             "ZwAdJKvoYRlEKDkNMwd5BuwNNtg93kNaR_oU2HrfVvc=",
         )
+
+    def test_hmac_signer(self):
+        hmac_signer = HmacSigner("AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=")
+        signature = hmac_signer.sign(
+            "1000000", "test-sign", "/orders", '{"hash": "0x123"}'
+        )
+        self.assertEqual(signature, "ZwAdJKvoYRlEKDkNMwd5BuwNNtg93kNaR_oU2HrfVvc=")
+
+        # the keyed hmac is reused across signatures
+        self.assertEqual(
+            hmac_signer.sign("1000000", "test-sign", "/orders", '{"hash": "0x123"}'),
+            signature,
+        )
+        self.assertEqual(
+            hmac_signer.sign("1000000", "GET", "/orders"),
+            build_hmac_signature(
+                "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=",
+                "1000000",
+                "GET",
+                "/orders",
+            ),
+        )
+
+    def test_build_hmac_signature_serialized_body(self):
+        # serialized bodies are signed as is
+        signature = build_hmac_signature(
+            "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=",
+            "1000000",
+            "test-sign",
+            "/orders",
+            b'{"hash": "0x123"}',
+        )
+        self.assertEqual(signature, "ZwAdJKvoYRlEKDkNMwd5BuwNNtg93kNaR_oU2HrfVvc=")
+
+        self.assertNotEqual(
+            build_hmac_signature(
+                "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=",
+                "1000000",
+                "DELETE",
+                "/orders",
+                b'["it\'s"]',
+            ),
+            build_hmac_signature(
+                "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=",
+                "1000000",
+                "DELETE",
+                "/orders",
+                '["it\'s"]',
+            ),
+        )
@@ -0,0 +1,153 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+import httpx
+
+from py_clob_client.async_client import AsyncClobClient
+from py_clob_client.clob_types import ApiCreds, OrderArgs
+from py_clob_client.headers.headers import (
+    POLY_ADDRESS,
+    POLY_API_KEY,
+    POLY_PASSPHRASE,
+    POLY_SIGNATURE,
+    POLY_TIMESTAMP,
+)
+from py_clob_client.http_helpers.retry import Retrier
+from py_clob_client.order_builder.constants import BUY
+from py_clob_client.signing.hmac import build_hmac_signature
+
+HOST = "https://clob.polymarket.com"
+PRIVATE_KEY = "0x0000000000000000000000000000000000000000000000000000000000000001"
+CREDS = ApiCreds("key", "c2VjcmV0", "passphrase")
+
+PAGES = {
+    "MA==": {"data": [{"id": "1"}], "next_cursor": "MQ=="},
+    "MQ==": {"data": [{"id": "2"}], "next_cursor": "LTE="},
+}
+
+
+class Server:
+    """
+    Answers the requests of the client through an httpx.MockTransport, and records them
+    """
+
+    def __init__(self):
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path == "/data/orders":
+            return httpx.Response(200, json=PAGES[request.url.params["next_cursor"]])
+        if request.url.path == "/order":
+            return httpx.Response(200, json={"success": True, "orderID": "0x1"})
+        if request.url.path == "/":
+            return httpx.Response(200, text="OK")
+        return httpx.Response(404, json={"error": "not found"})
+
+    def session(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self))
+
+
+def order_args(i=0):
+    return OrderArgs(token_id="1", price=0.5, size=10 + i, side=BUY)
+
+
+class TestAsyncClobClient(TestCase):
+    def setUp(self):
+        self.server = Server()
+
+    def client(self, **kwargs) -> AsyncClobClient:
+        client = AsyncClobClient(
+            HOST,
+            137,
+            PRIVATE_KEY,
+            creds=CREDS,
+            session=self.server.session(),
+            **kwargs,
+        )
+        client.market_cache.update("1", tick_size="0.01", neg_risk=False)
+        return client
+
+    def assert_signed(self, request: httpx.Request, client: AsyncClobClient):
+        headers = request.headers
+        self.assertEqual(headers[POLY_ADDRESS], client.get_address())
+        self.assertEqual(headers[POLY_API_KEY], CREDS.api_key)
+        self.assertEqual(headers[POLY_PASSPHRASE], CREDS.api_passphrase)
+        self.assertEqual(
+            headers[POLY_SIGNATURE],
+            build_hmac_signature(
+                CREDS.api_secret,
+                headers[POLY_TIMESTAMP],
+                request.method,
+                request.url.path,
+                request.content or None,
+            ),
+        )
+
+    def test_post_order(self):
+        client = self.client()
+
+        async def main():
+            async with client:
+                order = await client.create_order(order_args())
+                return order, await client.post_order(order)
+
+        order, resp = asyncio.run(main())
+        self.assertEqual(resp, {"success": True, "orderID": "0x1"})
+
+        (request,) = self.server.requests
+        # the bytes sent are the bytes signed
+        self.assert_signed(request, client)
+        body = json.loads(request.content)
+        self.assertEqual(body["owner"], CREDS.api_key)
+        self.assertEqual(body["order"]["signature"], order.signature)
+
+    def test_pagination(self):
+        client = self.client()
+
+        async def main():
+            async with client:
+                return await client.get_orders()
+
+        self.assertEqual(asyncio.run(main()), [{"id": "1"}, {"id": "2"}])
+        self.assertEqual(
+            [r.url.params["next_cursor"] for r in self.server.requests],
+            ["MA==", "MQ=="],
+        )
+        for request in self.server.requests:
+            self.assert_signed(request, client)
+
+    def test_create_orders(self):
+        client = self.client()
+
+        async def main():
+            async with client:
+                serial = await client.create_orders([order_args(i) for i in range(3)])
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    parallel = await client.create_orders(
+                        [order_args(i) for i in range(3)], executor=executor
+                    )
+                return serial, parallel
+
+        serial, parallel = asyncio.run(main())
+        self.assertEqual(
+            [o.order["makerAmount"] for o in parallel],
+            [o.order["makerAmount"] for o in serial],
+        )
+        self.assertTrue(all(o.signature for o in parallel))
+        self.assertEqual(self.server.requests, [])
+
+    def test_close(self):
+        retrier = Retrier()
+        client = self.client(retrier=retrier)
+        retrier._get_executor()
+
+        async def main():
+            async with client:
+                return await client.get_ok()
+
+        self.assertEqual(asyncio.run(main()), "OK")
+        self.assertTrue(client.session.is_closed)
+        self.assertIsNone(retrier._executor)
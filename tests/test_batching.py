@@ -0,0 +1,227 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from py_clob_client.async_client import AsyncClobClient
+from py_clob_client.batching import (
+    RequestCoalescer,
+    afetch_in_chunks,
+    chunks,
+    fetch_in_chunks,
+    merge_results,
+)
+from py_clob_client.client import ClobClient
+from py_clob_client.clob_types import ApiCreds, BookParams, OrderArgs, PostOrdersArgs
+from py_clob_client.exceptions import DeadlineExceeded, PolyApiException
+from py_clob_client.http_helpers.deadline import deadline_scope
+from tests.fakes import FakeAsyncSession, FakeResponse, FakeSession
+
+HOST = "https://clob.polymarket.com"
+PRIVATE_KEY = "0x0000000000000000000000000000000000000000000000000000000000000001"
+
+
+def book(token_id):
+    return {
+        "market": "0x1",
+        "asset_id": token_id,
+        "timestamp": "1700000000000",
+        "hash": "0xabc",
+        "bids": [{"price": "0.4", "size": "100"}],
+        "asks": [{"price": "0.6", "size": "20"}],
+    }
+
+
+def respond(path: str, body: list):
+    tokens = [item["token_id"] for item in body]
+    if path == "/books":
+        return [book(t) for t in tokens if t != "missing"]
+    if path == "/midpoints":
+        return {t: "0.5" for t in tokens if t != "missing"}
+    if path == "/spreads":
+        return {t: "0.02" for t in tokens}
+    if path == "/prices":
+        return {item["token_id"]: {item["side"]: "0.45"} for item in body}
+
+
+class BatchSession(FakeSession):
+    """
+    Answers the batch endpoints
+    """
+
+    def respond(self, index, request):
+        path = request.url[len(HOST) :]
+        body = json.loads(request.data) if request.data else []
+        return FakeResponse(200, respond(path, body))
+
+    def batches(self) -> list[tuple[str, str, list]]:
+        """
+        Method, path and tokens of every request
+        """
+        return [
+            (
+                r.method,
+                r.url[len(HOST) :],
+                [item["token_id"] for item in json.loads(r.data)],
+            )
+            for r in self.requests
+        ]
+
+
+class AsyncBatchSession(BatchSession, FakeAsyncSession):
+    pass
+
+
+class TestBatching(TestCase):
+    def test_chunks(self):
+        self.assertEqual(chunks([1, 2, 3, 4, 5], 2), [[1, 2], [3, 4], [5]])
+        self.assertEqual(chunks([], 2), [])
+        self.assertEqual(merge_results([[1], [2, 3]]), [1, 2, 3])
+        self.assertEqual(merge_results([{"a": 1}, {"b": 2}]), {"a": 1, "b": 2})
+
+    def test_fetch_in_chunks(self):
+        calls = []
+
+        def fetch(part):
+            calls.append(part)
+            return [i * 2 for i in part]
+
+        items = list(range(1200))
+        self.assertEqual(fetch_in_chunks(fetch, items, 500), [i * 2 for i in items])
+        self.assertEqual(sorted(len(c) for c in calls), [200, 500, 500])
+
+        async def afetch(part):
+            await asyncio.sleep(0)
+            return {i: i for i in part}
+
+        result = asyncio.run(afetch_in_chunks(afetch, items, 500, concurrency=2))
+        self.assertEqual(result, {i: i for i in items})
+
+    def test_client_chunks(self):
+        session = BatchSession()
+        client = ClobClient(HOST, session=session, batch_size=2)
+        params = [BookParams(token_id=str(i)) for i in range(5)]
+        books = client.get_order_books(params)
+        self.assertEqual([b.asset_id for b in books], ["0", "1", "2", "3", "4"])
+        self.assertEqual(
+            sorted(tokens for _, _, tokens in session.batches()),
+            [["0", "1"], ["2", "3"], ["4"]],
+        )
+        self.assertEqual(len(client.get_midpoints(params)), 5)
+
+    def test_coalesce(self):
+        session = BatchSession()
+        client = ClobClient(
+            HOST, session=session, coalescer=RequestCoalescer(window=0.05)
+        )
+        tokens = [str(i % 10) for i in range(20)]
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            mids = list(executor.map(client.get_midpoint, tokens))
+            prices = list(
+                executor.map(lambda t: client.get_price(t, "BUY"), tokens[:10])
+            )
+
+        self.assertEqual(mids, [{"mid": "0.5"}] * 20)
+        self.assertEqual(prices, [{"price": "0.45"}] * 10)
+        # duplicated tokens are requested once
+        self.assertEqual(
+            [(path, sorted(tokens)) for _, path, tokens in session.batches()],
+            [("/midpoints", sorted(set(tokens))), ("/prices", sorted(set(tokens)))],
+        )
+
+        book = client.get_order_book("3")
+        self.assertEqual(book.asset_id, "3")
+        self.assertEqual(client.get_spread("3"), {"spread": "0.02"})
+
+    def test_coalesce_full_batch(self):
+        session = BatchSession()
+        client = ClobClient(
+            HOST,
+            session=session,
+            coalescer=RequestCoalescer(window=10, max_batch_size=2),
+        )
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(client.get_midpoint, ["1", "2", "3", "4"]))
+        # batches are sent once full, without waiting for the window
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(session.calls, 2)
+
+    def test_coalesce_errors(self):
+        client = ClobClient(
+            HOST, session=BatchSession(), coalescer=RequestCoalescer(window=0.01)
+        )
+        with self.assertRaises(PolyApiException):
+            client.get_midpoint("missing")
+
+        coalescer = RequestCoalescer(window=0.01)
+
+        def fail(params):
+            raise PolyApiException(error_msg="Request exception!")
+
+        with self.assertRaises(PolyApiException):
+            coalescer.call("key", "1", fail)
+
+        client = ClobClient(
+            HOST,
+            session=BatchSession(delay=0.5),
+            coalescer=RequestCoalescer(window=0.01),
+        )
+        start = time.monotonic()
+        with self.assertRaises(DeadlineExceeded):
+            with deadline_scope(0.05):
+                client.get_midpoint("1")
+        self.assertLess(time.monotonic() - start, 0.4)
+
+    def test_coalesce_async(self):
+        session = AsyncBatchSession()
+        client = AsyncClobClient(
+            HOST, session=session, coalescer=RequestCoalescer(window=0.02)
+        )
+
+        async def main():
+            books = await asyncio.gather(
+                *(client.get_order_book(str(i)) for i in range(10))
+            )
+            spreads = await asyncio.gather(
+                *(client.get_spread(str(i)) for i in range(10))
+            )
+            with self.assertRaises(PolyApiException):
+                await client.get_order_book("missing")
+            return books, spreads
+
+        books, spreads = asyncio.run(main())
+        self.assertEqual([b.asset_id for b in books], [str(i) for i in range(10)])
+        self.assertEqual(spreads, [{"spread": "0.02"}] * 10)
+        self.assertEqual(
+            [path for _, path, _ in session.batches()], ["/books", "/spreads", "/books"]
+        )
+
+    def test_post_orders_partial(self):
+        client = ClobClient(
+            HOST,
+            137,
+            PRIVATE_KEY,
+            creds=ApiCreds("key", "c2VjcmV0", "passphrase"),
+            # the first request is accepted, the following ones fail
+            session=FakeSession(
+                FakeResponse(200, [{"success": True}] * 15),
+                FakeResponse(500, {"error": "unavailable"}),
+            ),
+        )
+        client.market_cache.update("1", tick_size="0.01", neg_risk=False)
+        args = [
+            PostOrdersArgs(
+                client.create_order(
+                    OrderArgs(token_id="1", price=0.5, size=10, side="BUY")
+                )
+            )
+            for _ in range(20)
+        ]
+        with self.assertRaises(PolyApiException) as cm:
+            client.post_orders(args)
+        # the results of the first request are kept on the error of the second
+        self.assertEqual(cm.exception.status_code, 500)
+        self.assertEqual(cm.exception.partial_results, [{"success": True}] * 15)
+        self.assertEqual(cm.exception.unposted_orders, args[15:])
@@ -0,0 +1,128 @@
+import threading
+from unittest import TestCase
+
+from py_clob_client.cache import MarketMetadata, MarketMetadataCache, TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache(TestCase):
+    def test_ttl(self):
+        clock = FakeClock()
+        cache = TTLCache(maxsize=10, ttl=5, clock=clock)
+        cache.set("a", 1)
+        clock.now = 4.9
+        self.assertEqual(cache.get("a"), 1)
+        clock.now = 5
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("a", 0), 0)
+        self.assertNotIn("a", cache)
+
+    def test_lru(self):
+        cache = TTLCache(maxsize=2, ttl=5, clock=FakeClock())
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+        self.assertEqual(len(cache), 2)
+
+        cache.invalidate("a")
+        self.assertNotIn("a", cache)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+        with self.assertRaises(ValueError):
+            TTLCache(maxsize=0)
+
+    def test_len_expired(self):
+        clock = FakeClock()
+        cache = TTLCache(ttl=5, clock=clock)
+        cache.set("a", 1)
+        clock.now = 3
+        cache.set("b", 2)
+        self.assertEqual(len(cache), 2)
+        # expired entries are not counted
+        clock.now = 5
+        self.assertEqual(len(cache), 1)
+        clock.now = 8
+        self.assertEqual(cache.prune(), 1)
+        self.assertEqual(len(cache), 0)
+
+
+class TestMarketMetadataCache(TestCase):
+    def test_update(self):
+        clock = FakeClock()
+        cache = MarketMetadataCache(ttl=60, clock=clock)
+        self.assertIsNone(cache.get_tick_size("1"))
+
+        cache.update("1", tick_size="0.01")
+        cache.update("1", neg_risk=False)
+        self.assertEqual(cache.get("1"), MarketMetadata("0.01", False))
+
+        clock.now = 60
+        self.assertIsNone(cache.get_tick_size("1"))
+        self.assertIsNone(cache.get_neg_risk("1"))
+
+        with self.assertRaises(TypeError):
+            cache.update("1", tick="0.01")
+
+    def test_update_keeps_expiry(self):
+        clock = FakeClock()
+        cache = MarketMetadataCache(ttl=60, clock=clock)
+        cache.update("1", tick_size="0.01")
+        clock.now = 50
+        cache.update("1", neg_risk=True)
+
+        # updating neg_risk does not extend the tick size
+        clock.now = 60
+        self.assertEqual(cache.get("1"), MarketMetadata(None, True))
+        clock.now = 110
+        self.assertEqual(cache.get("1"), MarketMetadata())
+
+    def test_concurrent_updates(self):
+        cache = MarketMetadataCache()
+        fields = {"tick_size": "0.01", "neg_risk": True, "condition_id": "0xaa"}
+        barrier = threading.Barrier(len(fields))
+
+        def update(token_id, name):
+            barrier.wait()
+            cache.update(token_id, **{name: fields[name]})
+
+        for token_id in map(str, range(50)):
+            threads = [
+                threading.Thread(target=update, args=(token_id, name))
+                for name in fields
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            # no update is lost
+            self.assertEqual(cache.get(token_id), MarketMetadata(**fields))
+
+    def test_update_from_market(self):
+        cache = MarketMetadataCache()
+        market = {
+            "condition_id": "0xaabbcc",
+            "minimum_tick_size": 0.001,
+            "neg_risk": True,
+            "tokens": [{"token_id": "1"}, {"token_id": "2"}],
+        }
+        self.assertEqual(cache.update_from_market(market), ["1", "2"])
+        self.assertEqual(cache.get("2"), MarketMetadata("0.001", True, "0xaabbcc"))
+
+        cache.invalidate()
+        self.assertEqual(cache.update_from_market(market, {"2", "3"}), ["2"])
+        self.assertIsNone(cache.get_tick_size("1"))
+
+        cache.invalidate("2")
+        self.assertEqual(len(cache), 0)
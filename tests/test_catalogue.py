@@ -0,0 +1,96 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from py_clob_client.catalogue import MarketCatalogue
+from py_clob_client.constants import END_CURSOR
+from py_clob_client.utilities import decode_cursor, encode_cursor
+
+
+def market(i: int, closed: bool = False) -> dict:
+    return {
+        "condition_id": f"0x{i:02x}",
+        "question": f"Will market {i} resolve?",
+        "market_slug": f"market-{i}",
+        "active": True,
+        "closed": closed,
+        "minimum_tick_size": 0.01,
+        "neg_risk": False,
+        "tokens": [
+            {"token_id": f"{i}1", "outcome": "Yes"},
+            {"token_id": f"{i}2", "outcome": "No"},
+        ],
+    }
+
+
+class MarketPages:
+    """
+    Fake /markets endpoint, new markets are appended at the end
+    """
+
+    def __init__(self, markets: list, limit: int = 3):
+        self.markets = markets
+        self.limit = limit
+        self.fetched = []
+
+    def __call__(self, cursor: str) -> dict:
+        self.fetched.append(cursor)
+        offset = decode_cursor(cursor)
+        end = min(offset + self.limit, len(self.markets))
+        return {
+            "data": self.markets[offset:end],
+            "next_cursor": (
+                END_CURSOR if end >= len(self.markets) else encode_cursor(end)
+            ),
+        }
+
+
+class TestMarketCatalogue(TestCase):
+    def test_refresh(self):
+        pages = MarketPages([market(i) for i in range(7)])
+        catalogue = MarketCatalogue()
+
+        stats = catalogue.refresh(pages)
+        self.assertEqual((stats.markets, stats.inserted, stats.updated), (7, 7, 0))
+        self.assertEqual(len(catalogue), 7)
+        self.assertEqual(catalogue.last_cursor, encode_cursor(6))
+
+        # only the last page and the new ones are fetched
+        pages.markets += [market(7), market(8)]
+        pages.fetched = []
+        stats = catalogue.refresh(pages)
+        self.assertEqual(pages.fetched, [encode_cursor(6)])
+        self.assertEqual((stats.markets, stats.inserted, stats.updated), (3, 2, 0))
+        self.assertEqual(catalogue.last_cursor, encode_cursor(6))
+
+        # changes to older markets need a full refresh
+        pages.markets[1] = market(1, closed=True)
+        changed = []
+        stats = catalogue.refresh(
+            pages, full=True, concurrency=2, on_change=changed.append
+        )
+        self.assertEqual((stats.markets, stats.inserted, stats.updated), (9, 0, 1))
+        self.assertEqual(changed, [market(1, closed=True)])
+        self.assertTrue(catalogue.get_market("0x01")["closed"])
+
+    def test_queries(self):
+        catalogue = MarketCatalogue()
+        catalogue.refresh(MarketPages([market(1), market(2, closed=True)]))
+
+        self.assertEqual(catalogue.get_market("0x01"), market(1))
+        self.assertIsNone(catalogue.get_market("0xff"))
+        self.assertEqual(catalogue.get_market_by_token("22"), market(2, closed=True))
+        self.assertEqual(sorted(catalogue.get_token_ids("0x01")), ["11", "12"])
+        self.assertEqual(list(catalogue.markets(closed=False)), [market(1)])
+        self.assertEqual(len(list(catalogue.markets(active=True))), 2)
+        self.assertEqual(catalogue.search("MARKET 2"), [market(2, closed=True)])
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "markets.sqlite")
+            with MarketCatalogue(path) as catalogue:
+                catalogue.refresh(MarketPages([market(i) for i in range(4)]))
+
+            with MarketCatalogue(path) as catalogue:
+                self.assertEqual(len(catalogue), 4)
+                self.assertEqual(catalogue.last_cursor, encode_cursor(3))
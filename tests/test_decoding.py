@@ -0,0 +1,137 @@
+import json
+from unittest import TestCase, skipUnless
+
+from py_clob_client.client import ClobClient
+from py_clob_client.clob_types import (
+    ApiCreds,
+    BookParams,
+    MakerOrder,
+    OpenOrder,
+    OrderBookSummary,
+    OrderSummary,
+    Trade,
+)
+from py_clob_client.decoding import (
+    OPEN_ORDERS_PAGE_DECODER,
+    ORDER_BOOKS_DECODER,
+    TRADES_PAGE_DECODER,
+    TypedDecoder,
+    decode_json,
+    msgspec,
+)
+from py_clob_client.utilities import parse_raw_orderbook_summary
+from tests.fakes import FakeResponse, FakeSession
+
+HOST = "https://clob.polymarket.com"
+PRIVATE_KEY = "0x0000000000000000000000000000000000000000000000000000000000000001"
+
+BOOK = {
+    "market": "0x1",
+    "asset_id": "123",
+    "timestamp": "1700000000000",
+    "hash": "0xabc",
+    "bids": [{"price": "0.4", "size": "100"}, {"price": "0.39", "size": "5"}],
+    "asks": [{"price": "0.6", "size": "20"}],
+    "tick_size": "0.01",
+}
+
+ORDER = {
+    "id": "0xorder",
+    "status": "LIVE",
+    "market": "0x1",
+    "asset_id": "123",
+    "side": "BUY",
+    "original_size": "10",
+    "size_matched": "0",
+    "price": "0.5",
+    "associate_trades": [],
+    "created_at": 1700000000,
+}
+
+TRADE = {
+    "id": "trade",
+    "taker_order_id": "0xtaker",
+    "side": "SELL",
+    "size": "5",
+    "price": "0.5",
+    "status": "CONFIRMED",
+    "match_time": "1700000000",
+    "bucket_index": 0,
+    "maker_orders": [{"order_id": "0xmaker", "matched_amount": "5", "price": "0.5"}],
+}
+
+
+def without_msgspec(decoder: TypedDecoder) -> TypedDecoder:
+    return TypedDecoder(decoder.type, decoder.parse, use_msgspec=False)
+
+
+class TestDecoding(TestCase):
+    def test_decode_json(self):
+        self.assertEqual(decode_json(b'{"a": [1, "b"]}'), {"a": [1, "b"]})
+        with self.assertRaises(ValueError):
+            decode_json(b"OK")
+
+    def test_order_books(self):
+        content = json.dumps([BOOK, BOOK]).encode()
+        expected = [parse_raw_orderbook_summary(BOOK)] * 2
+        for decoder in (ORDER_BOOKS_DECODER, without_msgspec(ORDER_BOOKS_DECODER)):
+            books = decoder(content)
+            self.assertEqual(books, expected)
+            self.assertIsInstance(books[0], OrderBookSummary)
+            self.assertIsInstance(books[0].bids[0], OrderSummary)
+
+    def test_pages(self):
+        content = json.dumps({"data": [ORDER], "next_cursor": "LTE="}).encode()
+        for decoder in (
+            OPEN_ORDERS_PAGE_DECODER,
+            without_msgspec(OPEN_ORDERS_PAGE_DECODER),
+        ):
+            page = decoder(content)
+            self.assertEqual(page["next_cursor"], "LTE=")
+            (order,) = page["data"]
+            self.assertIsInstance(order, OpenOrder)
+            self.assertEqual((order.id, order.price), ("0xorder", "0.5"))
+            self.assertEqual(order.created_at, 1700000000)
+            self.assertIsNone(order.outcome)
+
+        content = json.dumps({"data": [TRADE], "next_cursor": "LTE="}).encode()
+        for decoder in (TRADES_PAGE_DECODER, without_msgspec(TRADES_PAGE_DECODER)):
+            (trade,) = decoder(content)["data"]
+            self.assertIsInstance(trade, Trade)
+            self.assertEqual(trade.match_time, "1700000000")
+            self.assertEqual(
+                trade.maker_orders,
+                [MakerOrder(order_id="0xmaker", matched_amount="5", price="0.5")],
+            )
+
+    @skipUnless(msgspec, "msgspec is not installed")
+    def test_mismatch(self):
+        # a response which does not match the type is parsed from the json instead
+        order = dict(ORDER, created_at="1700000000", outcome=None)
+        content = json.dumps({"data": [order], "next_cursor": "LTE="}).encode()
+        (decoded,) = OPEN_ORDERS_PAGE_DECODER(content)["data"]
+        self.assertEqual(decoded.created_at, "1700000000")
+
+    def test_client(self):
+        session = FakeSession(
+            FakeResponse(200, [BOOK]),
+            FakeResponse(200, {"data": [TRADE], "next_cursor": "LTE="}),
+            FakeResponse(200, {"data": [TRADE], "next_cursor": "LTE="}),
+            FakeResponse(200, b"OK"),
+        )
+        client = ClobClient(
+            HOST,
+            137,
+            PRIVATE_KEY,
+            creds=ApiCreds("key", "c2VjcmV0", "passphrase"),
+            session=session,
+        )
+        books = client.get_order_books([BookParams(token_id="123")])
+        self.assertEqual(books, [parse_raw_orderbook_summary(BOOK)])
+
+        (trade,) = client.get_trades(typed=True)
+        self.assertIsInstance(trade, Trade)
+        self.assertEqual(client.get_trades(), [TRADE])
+
+        # responses which are not json are returned as text
+        self.assertEqual(client.get_ok(), "OK")
@@ -0,0 +1,140 @@
+import csv
+import os
+import tempfile
+from unittest import TestCase, skipUnless
+
+from py_clob_client.export import (
+    BOOK_COLUMNS,
+    MARKET_COLUMNS,
+    PARQUET,
+    export_markets,
+    export_order_books,
+    export_rows,
+    export_trades,
+    flatten_market,
+    market_columns,
+    pyarrow,
+)
+from py_clob_client.utilities import parse_raw_orderbook_summary
+
+market = {
+    "condition_id": "0xaabbcc",
+    "question": "Will it rain?",
+    "active": True,
+    "closed": False,
+    "minimum_tick_size": 0.01,
+    "rewards": {"rates": None, "min_size": 100, "max_spread": 3.5},
+    "tags": ["Weather", "All"],
+    "tokens": [
+        {"token_id": "1", "outcome": "Yes", "price": 0.6, "winner": False},
+        {"token_id": "2", "outcome": "No", "price": 0.4, "winner": False},
+    ],
+}
+
+trade = {
+    "id": "t1",
+    "market": "0xaabbcc",
+    "asset_id": "1",
+    "side": "BUY",
+    "size": "10",
+    "price": "0.6",
+    "match_time": "1700000000",
+    "maker_orders": [{"order_id": "o1"}, {"order_id": "o2"}],
+}
+
+
+def read_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+class TestExport(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_flatten_market(self):
+        row = flatten_market(market)
+        self.assertEqual(set(row), set(MARKET_COLUMNS))
+        self.assertEqual(row["tags"], "Weather,All")
+        self.assertEqual(row["rewards_max_spread"], 3.5)
+        self.assertEqual(row["token_1_outcome"], "No")
+
+    def test_market_tokens(self):
+        outcomes = ["A", "B", "C"]
+        multi = {
+            **market,
+            "tokens": [
+                {"token_id": str(i), "outcome": o} for i, o in enumerate(outcomes)
+            ],
+        }
+        # tokens beyond the exported count are dropped with a warning
+        with self.assertLogs("py_clob_client.export", "WARNING"):
+            row = flatten_market(multi)
+        self.assertNotIn("token_2_outcome", row)
+
+        self.assertEqual(export_markets([multi], self.path("m.csv"), tokens=3), 1)
+        (row,) = read_csv(self.path("m.csv"))
+        self.assertEqual(list(row), list(market_columns(3)))
+        self.assertEqual(row["token_2_outcome"], "C")
+
+    def test_export_markets_csv(self):
+        count = export_markets(
+            (market for _ in range(5)), self.path("markets.csv"), batch_size=2
+        )
+        self.assertEqual(count, 5)
+        rows = read_csv(self.path("markets.csv"))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(list(rows[0]), list(MARKET_COLUMNS))
+        self.assertEqual(rows[0]["token_0_id"], "1")
+        self.assertEqual(rows[0]["active"], "True")
+        self.assertEqual(rows[0]["question_id"], "")
+
+    def test_export_trades_csv(self):
+        self.assertEqual(export_trades([trade], self.path("trades.csv")), 1)
+        row = read_csv(self.path("trades.csv"))[0]
+        self.assertEqual(row["maker_orders"], "2")
+        self.assertEqual(row["size"], "10.0")
+        self.assertEqual(row["match_time"], "1700000000")
+
+    def test_export_order_books_csv(self):
+        book = parse_raw_orderbook_summary(
+            {
+                "market": "0xaabbcc",
+                "asset_id": "1",
+                "timestamp": "123456789",
+                "hash": "h",
+                "bids": [{"price": "0.3", "size": "100"}],
+                "asks": [{"price": "0.7", "size": "5"}, {"price": "0.6", "size": "1"}],
+            }
+        )
+        self.assertEqual(export_order_books([book], self.path("books.csv")), 3)
+        rows = read_csv(self.path("books.csv"))
+        self.assertEqual(list(rows[0]), list(BOOK_COLUMNS))
+        self.assertEqual(
+            [(r["side"], r["level"], r["price"]) for r in rows],
+            [("BUY", "0", "0.3"), ("SELL", "0", "0.7"), ("SELL", "1", "0.6")],
+        )
+
+    def test_export_empty(self):
+        self.assertEqual(export_rows([], self.path("empty.csv"), BOOK_COLUMNS), 0)
+        self.assertEqual(read_csv(self.path("empty.csv")), [])
+        with self.assertRaises(ValueError):
+            export_rows([], self.path("empty.json"), BOOK_COLUMNS, format="json")
+
+    @skipUnless(pyarrow, "pyarrow is not installed")
+    def test_export_markets_parquet(self):
+        import pyarrow.parquet
+
+        count = export_markets(
+            [market] * 3, self.path("markets.parquet"), format=PARQUET, batch_size=2
+        )
+        self.assertEqual(count, 3)
+        table = pyarrow.parquet.read_table(self.path("markets.parquet"))
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(table.column_names, list(MARKET_COLUMNS))
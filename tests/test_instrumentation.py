@@ -0,0 +1,179 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import TestCase, skipUnless
+
+import httpx
+
+from py_clob_client.client import ClobClient
+from py_clob_client.clob_types import OrderArgs
+from py_clob_client.exceptions import PolyApiException
+from py_clob_client.http_helpers import async_helpers, helpers
+from py_clob_client.http_helpers.retry import Retrier, RetryPolicy
+from py_clob_client.instrumentation import (
+    CONNECT,
+    DECODE,
+    SERVER,
+    SIGN_ORDER,
+    TRANSFER,
+    Instrumentation,
+    OpenTelemetryInstrumentation,
+    PrometheusInstrumentation,
+    RequestMetrics,
+    endpoint_label,
+    otel_metrics,
+    prometheus_client,
+    request_metrics,
+)
+from tests.fakes import FakeResponse, FakeSession
+
+HOST = "https://clob.polymarket.com"
+PRIVATE_KEY = "0x0000000000000000000000000000000000000000000000000000000000000001"
+
+
+class Recorder(Instrumentation):
+    def __init__(self):
+        self.requests: list[RequestMetrics] = []
+        self.signings: list[tuple[str, float]] = []
+
+    def on_request(self, metrics: RequestMetrics):
+        self.requests.append(metrics)
+
+    def on_signing(self, operation: str, seconds: float):
+        self.signings.append((operation, seconds))
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = json.dumps({"mid": "0.5"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestInstrumentation(TestCase):
+    def test_endpoint_label(self):
+        self.assertEqual(endpoint_label("/book"), "/book")
+        self.assertEqual(endpoint_label("/markets/0xabc"), "/markets/{id}")
+        self.assertEqual(endpoint_label("/markets"), "/markets")
+        self.assertEqual(endpoint_label("/data/order/0x1"), "/data/order/{id}")
+
+    def test_request_metrics(self):
+        failed = RequestMetrics("GET", HOST + "/book", status_code=503)
+        succeeded = RequestMetrics(
+            "GET", HOST + "/book", status_code=200, phases={SERVER: 0.1}
+        )
+        metrics = request_metrics(
+            "GET", HOST + "/book?token_id=1", [failed, succeeded], 0.5, None
+        )
+        self.assertEqual(metrics.endpoint, "/book")
+        self.assertEqual(metrics.status_code, 200)
+        self.assertEqual(metrics.phases, {SERVER: 0.1})
+        self.assertEqual((metrics.attempts, metrics.retries), (2, 1))
+        self.assertEqual(metrics.duration, 0.5)
+
+        error = PolyApiException(error_msg="Request exception!")
+        metrics = request_metrics("GET", HOST + "/book", [], 0.1, error)
+        self.assertIsNone(metrics.status_code)
+        self.assertIs(metrics.error, error)
+
+    def test_request(self):
+        recorder = Recorder()
+        session = FakeSession(
+            FakeResponse(503, {"error": "unavailable"}), FakeResponse(200, {"a": 1})
+        )
+        retrier = Retrier(
+            policies={}, read=RetryPolicy(max_retries=1, min_backoff=0.001)
+        )
+        result = helpers.post(
+            HOST + "/midpoints",
+            data=[{"token_id": "1"}],
+            session=session,
+            retrier=retrier,
+            instrumentation=recorder,
+        )
+        self.assertEqual(result, {"a": 1})
+
+        (metrics,) = recorder.requests
+        self.assertEqual((metrics.method, metrics.endpoint), ("POST", "/midpoints"))
+        self.assertEqual(metrics.status_code, 200)
+        self.assertEqual(metrics.attempts, 2)
+        self.assertEqual(metrics.request_bytes, len(b'[{"token_id":"1"}]'))
+        self.assertEqual(metrics.response_bytes, len(b'{"a": 1}'))
+        self.assertEqual(set(metrics.phases), {SERVER, TRANSFER, DECODE})
+        self.assertGreaterEqual(metrics.duration, sum(metrics.phases.values()))
+        self.assertIsNone(metrics.error)
+
+    def test_request_error(self):
+        recorder = Recorder()
+        session = FakeSession(FakeResponse(400, {"error": "bad request"}))
+        with self.assertRaises(PolyApiException) as cm:
+            helpers.get(HOST + "/book", session=session, instrumentation=recorder)
+        (metrics,) = recorder.requests
+        self.assertEqual(metrics.status_code, 400)
+        self.assertIs(metrics.error, cm.exception)
+
+    def test_async_request(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        recorder = Recorder()
+
+        async def main():
+            async with httpx.AsyncClient() as session:
+                return await async_helpers.get(
+                    "http://127.0.0.1:{}/midpoint".format(server.server_port),
+                    session,
+                    instrumentation=recorder,
+                )
+
+        try:
+            self.assertEqual(asyncio.run(main()), {"mid": "0.5"})
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        (metrics,) = recorder.requests
+        self.assertEqual(metrics.status_code, 200)
+        self.assertEqual(metrics.endpoint, "/midpoint")
+        self.assertEqual(set(metrics.phases), {CONNECT, SERVER, TRANSFER, DECODE})
+
+    def test_signing(self):
+        recorder = Recorder()
+        client = ClobClient(HOST, 137, PRIVATE_KEY, instrumentation=recorder)
+        client.market_cache.update("1", tick_size="0.01", neg_risk=False)
+        client.create_order(OrderArgs(token_id="1", price=0.5, size=10, side="BUY"))
+        self.assertEqual([op for op, _ in recorder.signings], [SIGN_ORDER])
+        self.assertEqual(recorder.requests, [])
+
+    @skipUnless(prometheus_client, "prometheus_client is not installed")
+    def test_prometheus(self):
+        registry = prometheus_client.CollectorRegistry()
+        instrumentation = PrometheusInstrumentation(registry)
+        instrumentation.on_request(
+            RequestMetrics(
+                "GET", "/book", status_code=200, attempts=2, phases={SERVER: 0.1}
+            )
+        )
+        labels = {"method": "GET", "endpoint": "/book"}
+        self.assertEqual(
+            registry.get_sample_value(
+                "clob_requests_total", {**labels, "status": "200"}
+            ),
+            1,
+        )
+        self.assertEqual(
+            registry.get_sample_value("clob_request_retries_total", labels), 1
+        )
+
+    @skipUnless(otel_metrics, "opentelemetry-api is not installed")
+    def test_opentelemetry(self):
+        instrumentation = OpenTelemetryInstrumentation()
+        instrumentation.on_request(RequestMetrics("GET", "/book", status_code=200))
+        instrumentation.on_signing(SIGN_ORDER, 0.001)
@@ -0,0 +1,99 @@
+from unittest import TestCase
+
+from py_clob_client.market_index import MarketIndex, tokenize
+
+
+def market(condition_id, question, slug, **kwargs):
+    return {
+        "condition_id": condition_id,
+        "question": question,
+        "market_slug": slug,
+        "description": kwargs.pop("description", ""),
+        "active": True,
+        "closed": False,
+        "minimum_tick_size": 0.01,
+        "tokens": [
+            {"token_id": "1", "outcome": "Yes"},
+            {"token_id": "2", "outcome": "No"},
+        ],
+        **kwargs,
+    }
+
+
+markets = [
+    market(
+        "0x01",
+        "Will the Lakers win the NBA Finals?",
+        "lakers-nba-finals",
+        end_date_iso="2025-06-30T00:00:00Z",
+    ),
+    market(
+        "0x02",
+        "Will the Celtics win the NBA Finals?",
+        "celtics-nba-finals",
+        description="Resolves if the Celtics beat the Lakers",
+        end_date_iso="2025-06-30T00:00:00Z",
+    ),
+    market(
+        "0x03",
+        "Will Bitcoin reach $100k?",
+        "bitcoin-100k",
+        closed=True,
+        minimum_tick_size=0.001,
+        end_date_iso="2024-12-31T00:00:00Z",
+    ),
+]
+
+
+class TestMarketIndex(TestCase):
+    def setUp(self):
+        self.index = MarketIndex.from_markets(markets)
+
+    def test_tokenize(self):
+        self.assertEqual(
+            tokenize("Will Bitcoin reach $100k?"), ["will", "bitcoin", "reach", "100k"]
+        )
+
+    def test_keywords(self):
+        # the question match is boosted over the description match
+        self.assertEqual(self.index.search("lakers"), ["0x01", "0x02"])
+        self.assertEqual(self.index.search("LAKERS finals"), ["0x01", "0x02"])
+        self.assertEqual(self.index.search("celtics"), ["0x02"])
+        self.assertEqual(self.index.search("lakers -celtics"), ["0x01"])
+        self.assertEqual(self.index.search("lak*"), ["0x01", "0x02"])
+        self.assertEqual(self.index.search("bitcoin OR celtics"), ["0x02", "0x03"])
+        self.assertEqual(self.index.search("nba-finals"), ["0x01", "0x02"])
+        self.assertEqual(self.index.search("0x03"), ["0x03"])
+        self.assertEqual(self.index.search("dodgers"), [])
+        self.assertEqual(len(self.index.search()), 3)
+        self.assertEqual(self.index.search("lakers", limit=1), ["0x01"])
+
+    def test_filters(self):
+        self.assertEqual(self.index.search(closed=True), ["0x03"])
+        self.assertEqual(self.index.search("will", closed=False), ["0x01", "0x02"])
+        self.assertEqual(self.index.search(tick_size=0.001), ["0x03"])
+        self.assertEqual(self.index.search(end_before="2025-01-01"), ["0x03"])
+        self.assertEqual(self.index.search(end_after="2025-01-01"), ["0x01", "0x02"])
+        self.assertEqual(
+            [m["condition_id"] for m in self.index.search_markets("bitcoin")], ["0x03"]
+        )
+
+    def test_updates(self):
+        self.index.add({**markets[0], "closed": True, "question": "Lakers champions?"})
+        self.assertEqual(self.index.search("finals", closed=False), ["0x02"])
+        self.assertEqual(self.index.search("champ*"), ["0x01"])
+        self.assertEqual(len(self.index), 3)
+
+        self.index.remove("0x03")
+        self.assertEqual(self.index.search("bitcoin"), [])
+        self.assertNotIn("bitcoin", self.index.postings)
+        self.assertNotIn("bitcoin", self.index.terms)
+        self.assertNotIn("0x03", self.index)
+
+    def test_csv_tokens(self):
+        csv_market = market(
+            "0x04", "Will it rain?", "rain", tokens="[{'outcome': 'Yes'}]"
+        )
+        index = MarketIndex.from_markets([csv_market])
+        self.assertEqual(index.search("rain"), ["0x04"])
+        self.assertEqual(index.search("yes"), [])
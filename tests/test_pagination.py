@@ -0,0 +1,121 @@
+import asyncio
+import time
+from unittest import TestCase
+
+from py_clob_client.constants import END_CURSOR
+from py_clob_client.pagination import (
+    aiter_pages,
+    aiter_prefetched_pages,
+    cursor_step,
+    iter_pages,
+    iter_prefetched_pages,
+)
+from py_clob_client.utilities import decode_cursor, encode_cursor
+
+
+class OffsetPages:
+    """
+    Fake paginated endpoint using base64 offsets as cursors
+    """
+
+    def __init__(self, total: int, limit: int):
+        self.total = total
+        self.limit = limit
+        self.fetched = []
+
+    def __call__(self, cursor: str) -> dict:
+        self.fetched.append(cursor)
+        offset = decode_cursor(cursor)
+        if offset >= self.total:
+            raise Exception("out of range")
+        end = min(offset + self.limit, self.total)
+        return {
+            "data": list(range(offset, end)),
+            "next_cursor": END_CURSOR if end >= self.total else encode_cursor(end),
+        }
+
+
+class OpaquePages:
+    """
+    Fake paginated endpoint using opaque cursors
+    """
+
+    def __init__(self, pages: int):
+        self.pages = pages
+
+    def __call__(self, cursor: str) -> dict:
+        index = 0 if cursor == "MA==" else int(cursor[len("page-") :])
+        return {
+            "data": [index],
+            "next_cursor": (
+                END_CURSOR if index + 1 >= self.pages else "page-{}".format(index + 1)
+            ),
+        }
+
+
+class TestPagination(TestCase):
+    def test_cursor_step(self):
+        self.assertEqual(cursor_step("MA==", encode_cursor(500)), 500)
+        self.assertEqual(cursor_step(encode_cursor(500), encode_cursor(1000)), 500)
+        self.assertIsNone(cursor_step("MA==", END_CURSOR))
+        self.assertIsNone(cursor_step("MA==", "page-1"))
+
+    def test_iter_pages_serial(self):
+        fetch = OffsetPages(total=1050, limit=100)
+        self.assertEqual(list(iter_pages(fetch)), list(range(1050)))
+        self.assertEqual(len(fetch.fetched), 11)
+
+    def test_iter_pages_concurrent(self):
+        for concurrency in [2, 4, 16]:
+            fetch = OffsetPages(total=1050, limit=100)
+            records = list(iter_pages(fetch, concurrency=concurrency))
+            self.assertEqual(records, list(range(1050)))
+
+        # single page
+        fetch = OffsetPages(total=10, limit=100)
+        self.assertEqual(list(iter_pages(fetch, concurrency=4)), list(range(10)))
+
+    def test_iter_pages_opaque_cursor(self):
+        records = list(iter_pages(OpaquePages(pages=5), concurrency=4))
+        self.assertEqual(records, [0, 1, 2, 3, 4])
+
+    def test_aiter_pages(self):
+        async def collect(fetch, concurrency):
+            async def afetch(cursor):
+                return fetch(cursor)
+
+            return [r async for r in aiter_pages(afetch, concurrency=concurrency)]
+
+        for concurrency in [1, 4]:
+            fetch = OffsetPages(total=1050, limit=100)
+            records = asyncio.run(collect(fetch, concurrency))
+            self.assertEqual(records, list(range(1050)))
+
+        records = asyncio.run(collect(OpaquePages(pages=5), 4))
+        self.assertEqual(records, [0, 1, 2, 3, 4])
+
+    def test_iter_prefetched_pages(self):
+        fetch = OffsetPages(total=1050, limit=100)
+        records = iter_prefetched_pages(fetch)
+        self.assertEqual(next(records), 0)
+        # the second page is requested before the first one is consumed
+        deadline = time.monotonic() + 1
+        while len(fetch.fetched) < 2 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        self.assertEqual(fetch.fetched, ["MA==", encode_cursor(100)])
+        self.assertEqual(list(records), list(range(1, 1050)))
+        self.assertEqual(len(fetch.fetched), 11)
+
+        records = list(iter_prefetched_pages(OpaquePages(pages=5)))
+        self.assertEqual(records, [0, 1, 2, 3, 4])
+
+    def test_aiter_prefetched_pages(self):
+        async def collect(fetch):
+            async def afetch(cursor):
+                return fetch(cursor)
+
+            return [r async for r in aiter_prefetched_pages(afetch)]
+
+        fetch = OffsetPages(total=1050, limit=100)
+        self.assertEqual(asyncio.run(collect(fetch)), list(range(1050)))
+        self.assertEqual(asyncio.run(collect(OpaquePages(pages=5))), [0, 1, 2, 3, 4])
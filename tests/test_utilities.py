@@ -1,7 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 
 from py_clob_client.clob_types import (
     OrderArgs,
+    OrderBookSummary,
     OrderType,
     CreateOrderOptions,
 )
@@ -14,8 +16,15 @@ from py_clob_client.utilities import (
     generate_orderbook_summary_hash,
     order_to_json,
     is_tick_size_smaller,
+    is_tick_size_error,
     price_valid,
+    encode_cursor,
+    decode_cursor,
+    orderbook_summary_hash,
+    verify_book_hash,
+    verify_book_hashes,
 )
+from py_clob_client.order_book.compact import CompactOrderBook
 
 
 class TestUtilities(TestCase):
@@ -164,6 +173,84 @@ class TestUtilities(TestCase):
             "6d754a2f0304a83544f91a076fa3faa9cbfb9f63",
         )
 
+    def test_verify_book_hash(self):
+        raw_obs = {
+            "market": "0xaabbcc",
+            "asset_id": "100",
+            "timestamp": "123456789",
+            "bids": [
+                {"price": "0.3", "size": "100"},
+                {"price": "0.4", "size": "100"},
+            ],
+            "asks": [
+                {"price": "0.6", "size": "100"},
+                {"price": "0.7", "size": "100"},
+            ],
+            "hash": "5489da29343426f88622d61044975dc5fd828a27",
+        }
+
+        orderbook_summary = parse_raw_orderbook_summary(raw_obs)
+        compact = CompactOrderBook.from_raw(raw_obs)
+        self.assertEqual(
+            orderbook_summary_hash(orderbook_summary),
+            "5489da29343426f88622d61044975dc5fd828a27",
+        )
+        self.assertEqual(
+            orderbook_summary_hash(compact),
+            "5489da29343426f88622d61044975dc5fd828a27",
+        )
+        self.assertTrue(verify_book_hash(orderbook_summary))
+        self.assertTrue(verify_book_hash(compact))
+        # the book is not mutated
+        self.assertEqual(
+            orderbook_summary.hash, "5489da29343426f88622d61044975dc5fd828a27"
+        )
+
+        tampered = parse_raw_orderbook_summary(
+            {**raw_obs, "bids": [{"price": "0.3", "size": "101"}]}
+        )
+        self.assertFalse(verify_book_hash(tampered))
+
+        empty = parse_raw_orderbook_summary(
+            {
+                "market": "0xaabbcc",
+                "asset_id": "100",
+                "timestamp": "",
+                "bids": [],
+                "asks": [],
+                "hash": "",
+            }
+        )
+        self.assertEqual(
+            orderbook_summary_hash(empty), generate_orderbook_summary_hash(empty)
+        )
+
+        # missing levels are hashed as null, like generate_orderbook_summary_hash
+        no_levels = OrderBookSummary(
+            market="0xaabbcc",
+            asset_id="100",
+            timestamp="123456789",
+            hash="ce5bd5477ae9b50392c33997a22dbb527cf8f9c4",
+        )
+        self.assertTrue(verify_book_hash(no_levels))
+
+        # compact books are hashed from the strings received
+        raw_obs = {
+            **raw_obs,
+            "bids": [{"price": "0.50", "size": "10.00"}],
+            "asks": [{"price": "0.60", "size": "1e3"}],
+            "hash": "9e60f1b739918285fc08dfb0be19c1d2e2156996",
+        }
+        self.assertTrue(verify_book_hash(parse_raw_orderbook_summary(raw_obs)))
+        self.assertTrue(verify_book_hash(CompactOrderBook.from_raw(raw_obs)))
+
+        books = [orderbook_summary, compact, tampered]
+        self.assertEqual(verify_book_hashes(books), [True, True, False])
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(
+                verify_book_hashes(books, executor=executor), [True, True, False]
+            )
+
     def test_order_to_json_0_1(self):
         # publicly known private key
         private_key = (
@@ -1517,6 +1604,13 @@ class TestUtilities(TestCase):
         self.assertTrue(is_tick_size_smaller("0.0001", "0.001"))
         self.assertFalse(is_tick_size_smaller("0.0001", "0.0001"))
 
+    def test_is_tick_size_error(self):
+        self.assertTrue(is_tick_size_error("INVALID_ORDER_MIN_TICK_SIZE"))
+        self.assertTrue(
+            is_tick_size_error({"error": "order breaks minimum tick size rules"})
+        )
+        self.assertFalse(is_tick_size_error("not enough balance / allowance"))
+
     def test_price_valid(self):
         self.assertFalse(price_valid(0.00001, "0.0001"))
         self.assertTrue(price_valid(0.0001, "0.0001"))
@@ -1561,3 +1655,15 @@ class TestUtilities(TestCase):
         self.assertFalse(price_valid(0.999, "0.1"))
         self.assertFalse(price_valid(0.9999, "0.1"))
         self.assertFalse(price_valid(0.99999, "0.1"))
+
+    def test_encode_cursor(self):
+        self.assertEqual(encode_cursor(0), "MA==")
+        self.assertEqual(encode_cursor(-1), "LTE=")
+        self.assertEqual(encode_cursor(1000), "MTAwMA==")
+
+    def test_decode_cursor(self):
+        self.assertEqual(decode_cursor("MA=="), 0)
+        self.assertEqual(decode_cursor("LTE="), -1)
+        self.assertEqual(decode_cursor("MTAwMA=="), 1000)
+        self.assertIsNone(decode_cursor("not a cursor"))
+        self.assertIsNone(decode_cursor("YWJj"))
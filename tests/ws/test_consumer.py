@@ -0,0 +1,58 @@
+from unittest import IsolatedAsyncioTestCase
+
+from py_clob_client.exceptions import PolyException
+from py_clob_client.ws.consumer import (
+    COALESCE,
+    DROP_NEWEST,
+    DROP_OLDEST,
+    ConsumerQueue,
+)
+
+
+def message(asset_id, n):
+    return {"event_type": "book", "asset_id": asset_id, "n": n}
+
+
+class TestConsumerQueue(IsolatedAsyncioTestCase):
+    async def test_drop_oldest(self):
+        queue = ConsumerQueue(maxsize=2, policy=DROP_OLDEST)
+        for n in range(4):
+            queue.put(message("1", n))
+        self.assertEqual(queue.dropped, 2)
+        self.assertEqual([(await queue.get())["n"] for _ in range(2)], [2, 3])
+
+    async def test_drop_newest(self):
+        queue = ConsumerQueue(maxsize=2, policy=DROP_NEWEST)
+        for n in range(4):
+            queue.put(message("1", n))
+        self.assertEqual(queue.dropped, 2)
+        self.assertEqual([(await queue.get())["n"] for _ in range(2)], [0, 1])
+
+    async def test_coalesce(self):
+        queue = ConsumerQueue(maxsize=2, policy=COALESCE)
+        queue.put(message("1", 0))
+        queue.put(message("2", 1))
+        queue.put(message("1", 2))
+        self.assertEqual(len(queue), 2)
+        self.assertEqual((await queue.get())["n"], 2)
+        self.assertEqual((await queue.get())["n"], 1)
+
+        queue.put(message("1", 3))
+        queue.put(message("2", 4))
+        queue.put(message("3", 5))
+        self.assertEqual([queue.get_nowait()["n"] for _ in range(2)], [4, 5])
+
+    async def test_close(self):
+        queue = ConsumerQueue()
+        queue.put(message("1", 0))
+        queue.close()
+        queue.put(message("1", 1))
+        self.assertEqual([m["n"] async for m in queue], [0])
+        with self.assertRaises(PolyException):
+            await queue.get()
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            ConsumerQueue(policy="block")
+        with self.assertRaises(ValueError):
+            ConsumerQueue(maxsize=0)
@@ -0,0 +1,96 @@
+import asyncio
+import json
+from unittest import IsolatedAsyncioTestCase
+
+import websockets
+
+from py_clob_client.ws.connection import backoff_delay
+from py_clob_client.ws.market import MarketDataClient
+
+
+class FakeMarketChannel:
+    """
+    Market channel sending a book for every subscribed asset id
+    A connection is dropped the first time it subscribes to a set of asset ids
+    """
+
+    def __init__(self):
+        self.connections = 0
+        self.received = []
+        self.dropped = set()
+
+    async def handler(self, ws, path=None):
+        self.connections += 1
+        connection = self.connections
+        async for raw in ws:
+            if raw == "PING":
+                await ws.send("PONG")
+                continue
+            message = json.loads(raw)
+            self.received.append(message)
+            await ws.send(
+                json.dumps(
+                    [
+                        {"event_type": "book", "asset_id": a, "connection": connection}
+                        for a in message["assets_ids"]
+                    ]
+                )
+            )
+            asset_ids = frozenset(message["assets_ids"])
+            if asset_ids not in self.dropped:
+                self.dropped.add(asset_ids)
+                await ws.close()
+
+
+class TestMarketDataClient(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.channel = FakeMarketChannel()
+        self.server = await websockets.serve(self.channel.handler, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.url = f"ws://127.0.0.1:{port}"
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def test_reconnect_and_resubscribe(self):
+        client = MarketDataClient(
+            self.url, max_assets_per_connection=2, min_backoff=0.01, ping_interval=0.05
+        )
+        consumer = client.consumer()
+        await client.subscribe(["1", "2", "3"])
+        self.assertEqual([s.asset_ids for s in client.shards], [{"1", "2"}, {"3"}])
+
+        async with client:
+            messages = []
+            while len(messages) < 6:
+                messages.append(await asyncio.wait_for(consumer.get(), 5))
+
+            await client.subscribe(["4"])
+            while messages[-1]["asset_id"] != "4":
+                messages.append(await asyncio.wait_for(consumer.get(), 5))
+
+            # every asset id received a book from the first connection
+            # and again after the reconnection
+            for asset_id in ["1", "2", "3"]:
+                books = [m for m in messages if m["asset_id"] == asset_id]
+                self.assertGreaterEqual(len(books), 2)
+            self.assertGreaterEqual(
+                sum(s.connection.reconnects for s in client.shards), 2
+            )
+            self.assertIn(
+                {"assets_ids": ["4"], "operation": "subscribe"}, self.channel.received
+            )
+            self.assertEqual(client.asset_ids, {"1", "2", "3", "4"})
+
+            await client.unsubscribe(["3", "4"])
+            self.assertEqual(len(client.shards), 1)
+
+        self.assertTrue(consumer.closed)
+
+    def test_backoff_delay(self):
+        for attempt in range(10):
+            delay = backoff_delay(attempt, 0.5, 30)
+            expected = min(30, 0.5 * 2**attempt)
+            self.assertGreaterEqual(delay, expected / 2)
+            self.assertLessEqual(delay, expected)
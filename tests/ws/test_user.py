@@ -0,0 +1,142 @@
+import asyncio
+import json
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+import websockets
+
+from py_clob_client.clob_types import ApiCreds, OrderEvent, TradeEvent
+from py_clob_client.ws.user import (
+    UserChannelClient,
+    UserOrderIndex,
+    parse_user_event,
+)
+
+
+def order_message(type, id="o1", size_matched="0", **kwargs):
+    return {
+        "event_type": "order",
+        "type": type,
+        "id": id,
+        "market": "0xaabbcc",
+        "asset_id": "100",
+        "side": "BUY",
+        "price": "0.5",
+        "original_size": "10",
+        "size_matched": size_matched,
+        "owner": "key",
+        **kwargs,
+    }
+
+
+trade_message = {
+    "event_type": "trade",
+    "type": "TRADE",
+    "id": "t1",
+    "status": "MATCHED",
+    "market": "0xaabbcc",
+    "asset_id": "200",
+    "side": "SELL",
+    "size": "4",
+    "price": "0.5",
+    "owner": "other",
+    "taker_order_id": "o2",
+    "maker_orders": [
+        {"order_id": "o1", "owner": "key", "matched_amount": "4", "asset_id": "100"},
+        {"order_id": "o3", "owner": "other", "matched_amount": "1", "asset_id": "100"},
+    ],
+}
+
+
+class TestUserOrderIndex(TestCase):
+    def test_orders(self):
+        index = UserOrderIndex("key")
+        index.apply(parse_user_event(order_message("PLACEMENT")))
+        index.apply(parse_user_event(order_message("PLACEMENT", id="o4")))
+        self.assertEqual(len(index.get_open_orders("100")), 2)
+
+        index.apply(
+            parse_user_event(
+                {
+                    "event_type": "order",
+                    "type": "UPDATE",
+                    "id": "o1",
+                    "size_matched": "4",
+                }
+            )
+        )
+        order = index.open_orders["o1"]
+        self.assertEqual(order.size_matched, "4")
+        self.assertEqual(order.asset_id, "100")
+
+        index.apply(parse_user_event(order_message("UPDATE", size_matched="10")))
+        index.apply(parse_user_event(order_message("CANCELLATION", id="o4")))
+        self.assertEqual(index.get_open_orders(), [])
+        self.assertEqual(index.orders_by_asset, {})
+
+        index.seed_orders([order_message("PLACEMENT", id="o5")])
+        self.assertEqual(list(index.open_orders), ["o5"])
+
+    def test_trades(self):
+        index = UserOrderIndex("key")
+        trade = parse_user_event(trade_message)
+        self.assertIsInstance(trade, TradeEvent)
+        self.assertEqual(trade.maker_orders[0].order_id, "o1")
+
+        index.apply(trade)
+        index.apply(parse_user_event({**trade_message, "status": "CONFIRMED"}))
+        self.assertEqual([t.status for t in index.get_fills()], ["CONFIRMED"])
+        self.assertEqual(len(index.get_fills(order_id="o1")), 1)
+        self.assertEqual(len(index.get_fills(order_id="o2")), 1)
+        self.assertEqual(index.get_fills(order_id="o3"), [])
+        self.assertEqual(len(index.get_fills(asset_id="100")), 1)
+        self.assertEqual(len(index.get_fills(asset_id="200")), 1)
+
+        self.assertIsNone(parse_user_event({"event_type": "other"}))
+
+
+class TestUserChannelClient(IsolatedAsyncioTestCase):
+    async def test_stream(self):
+        received = []
+
+        async def handler(ws, path=None):
+            received.append(json.loads(await ws.recv()))
+            await ws.send(json.dumps([order_message("PLACEMENT"), trade_message]))
+            await ws.send(json.dumps({"event_type": "other"}))
+            await ws.wait_closed()
+
+        server = await websockets.serve(handler, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+
+        async def resync():
+            return [order_message("PLACEMENT", id="o0")]
+
+        creds = ApiCreds("key", "secret", "passphrase")
+        try:
+            async with UserChannelClient(
+                creds, ["0xaabbcc"], url=f"ws://127.0.0.1:{port}", resync=resync
+            ) as user:
+                consumer = user.consumer()
+                order = await asyncio.wait_for(consumer.get(), 5)
+                trade = await asyncio.wait_for(consumer.get(), 5)
+        finally:
+            server.close()
+            await server.wait_closed()
+
+        self.assertEqual(
+            received,
+            [
+                {
+                    "auth": {
+                        "apiKey": "key",
+                        "secret": "secret",
+                        "passphrase": "passphrase",
+                    },
+                    "markets": ["0xaabbcc"],
+                    "type": "user",
+                }
+            ],
+        )
+        self.assertIsInstance(order, OrderEvent)
+        self.assertIsInstance(trade, TradeEvent)
+        self.assertEqual(set(user.index.open_orders), {"o0", "o1"})
+        self.assertEqual(len(user.index.get_fills(order_id="o1")), 1)